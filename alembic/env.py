@@ -11,7 +11,8 @@ from app.db import Base
 load_dotenv()
 
 config = context.config
-if config.config_file_name is not None:
+# Beim Aufruf aus der App (app.db.bootstrap) Logging der App nicht überschreiben
+if config.config_file_name is not None and "connection" not in config.attributes:
     fileConfig(config.config_file_name)
 
 # ENV-Variable für DB
@@ -35,6 +36,14 @@ def run_migrations_offline():
 
 
 def run_migrations_online():
+    # Von app.db.bootstrap übergebene Verbindung (Transaktion gehört dem Aufrufer)
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section),
         prefix="sqlalchemy.",
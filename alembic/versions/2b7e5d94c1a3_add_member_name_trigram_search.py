@@ -0,0 +1,67 @@
+"""Add trigram search index on members.name (pg_trgm / SQLite FTS5)
+
+Revision ID: 2b7e5d94c1a3
+Revises: 8d3f1c2a9b47
+Create Date: 2026-10-17 15:40:09.201377
+
+"""
+
+import sqlite3
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2b7e5d94c1a3"
+down_revision: Union[str, Sequence[str], None] = "8d3f1c2a9b47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Eingefrorene Kopie der DDL aus app.models.member zum Stand dieser Revision.
+# Bewusst nicht importiert: spätere Änderungen am Modell brauchen eine eigene
+# Migration und dürfen diese nicht rückwirkend verändern.
+POSTGRES_NAME_TRGM_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_members_name_trgm "
+    "ON members USING gin (name gin_trgm_ops)",
+]
+
+# FTS5-Trigram-Tabelle als Ersatz auf SQLite (ab 3.34), per Trigger synchron
+SQLITE_NAME_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS members_name_fts USING fts5("
+    "name, content='members', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS members_name_fts_ai AFTER INSERT ON members BEGIN "
+    "INSERT INTO members_name_fts(rowid, name) VALUES (new.id, new.name); END",
+    "CREATE TRIGGER IF NOT EXISTS members_name_fts_ad AFTER DELETE ON members BEGIN "
+    "INSERT INTO members_name_fts(members_name_fts, rowid, name) "
+    "VALUES ('delete', old.id, old.name); END",
+    "CREATE TRIGGER IF NOT EXISTS members_name_fts_au AFTER UPDATE OF name ON members "
+    "BEGIN "
+    "INSERT INTO members_name_fts(members_name_fts, rowid, name) "
+    "VALUES ('delete', old.id, old.name); "
+    "INSERT INTO members_name_fts(rowid, name) VALUES (new.id, new.name); END",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        for statement in POSTGRES_NAME_TRGM_DDL:
+            op.execute(statement)
+    elif dialect == "sqlite" and sqlite3.sqlite_version_info >= (3, 34, 0):
+        for statement in SQLITE_NAME_FTS_DDL:
+            op.execute(statement)
+        # Bestehende Zeilen in den Index übernehmen
+        op.execute("INSERT INTO members_name_fts(members_name_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_members_name_trgm")
+    elif dialect == "sqlite":
+        for trigger in ("ai", "ad", "au"):
+            op.execute(f"DROP TRIGGER IF EXISTS members_name_fts_{trigger}")
+        op.execute("DROP TABLE IF EXISTS members_name_fts")
@@ -0,0 +1,32 @@
+"""Add token_version to users
+
+Revision ID: 4fd62b9a467b
+Revises: 4005df710216
+Create Date: 2026-10-17 09:12:41.302117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4fd62b9a467b"
+down_revision: Union[str, Sequence[str], None] = "4005df710216"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "users",
+        sa.Column("token_version", sa.Integer(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("users", "token_version")
@@ -0,0 +1,59 @@
+"""Add member_stats summary table for GET /members/stats
+
+Revision ID: 5c81e0f3a6d2
+Revises: 2b7e5d94c1a3
+Create Date: 2026-10-17 18:05:52.640117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c81e0f3a6d2"
+down_revision: Union[str, Sequence[str], None] = "2b7e5d94c1a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    member_stats = op.create_table(
+        "member_stats",
+        sa.Column("city", sa.String(length=255), nullable=False),
+        sa.Column("active", sa.Boolean(), nullable=False),
+        sa.Column("birth_year", sa.Integer(), nullable=False),
+        sa.Column("member_count", sa.Integer(), nullable=False),
+        sa.Column("amount_total", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.PrimaryKeyConstraint("city", "active", "birth_year"),
+    )
+
+    # Bestehende Mitglieder einmalig aggregieren
+    members = sa.table(
+        "members",
+        sa.column("city", sa.String),
+        sa.column("active", sa.Boolean),
+        sa.column("birth_date", sa.Date),
+        sa.column("total_amount_received", sa.Numeric),
+    )
+    birth_year = sa.cast(sa.extract("year", members.c.birth_date), sa.Integer)
+    op.execute(
+        member_stats.insert().from_select(
+            ["city", "active", "birth_year", "member_count", "amount_total"],
+            sa.select(
+                members.c.city,
+                members.c.active,
+                birth_year,
+                sa.func.count(),
+                sa.func.coalesce(sa.func.sum(members.c.total_amount_received), 0),
+            ).group_by(members.c.city, members.c.active, birth_year),
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("member_stats")
@@ -0,0 +1,65 @@
+"""Add composite and partial indexes for member list filters
+
+Revision ID: 7e2a4b9c0d15
+Revises: 5c81e0f3a6d2
+Create Date: 2026-10-17 19:22:08.913540
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7e2a4b9c0d15"
+down_revision: Union[str, Sequence[str], None] = "5c81e0f3a6d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_members_city_postal_code", "members", ["city", "postal_code"], unique=False
+    )
+    # text_pattern_ops: LIKE 'präfix%' nutzt den Index unabhängig von der Collation
+    op.create_index(
+        "ix_members_postal_code_pattern",
+        "members",
+        ["postal_code"],
+        unique=False,
+        postgresql_ops={"postal_code": "text_pattern_ops"},
+    )
+    op.create_index(
+        "ix_members_join_date_id", "members", ["join_date", "id"], unique=False
+    )
+    op.create_index(
+        "ix_members_birth_date_id", "members", ["birth_date", "id"], unique=False
+    )
+    op.create_index(
+        "ix_members_total_amount_received_id",
+        "members",
+        ["total_amount_received", "id"],
+        unique=False,
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        op.create_index(
+            "ix_members_active_id",
+            "members",
+            ["id"],
+            unique=False,
+            postgresql_where=sa.text("active"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_members_active_id", table_name="members")
+    op.drop_index("ix_members_total_amount_received_id", table_name="members")
+    op.drop_index("ix_members_birth_date_id", table_name="members")
+    op.drop_index("ix_members_join_date_id", table_name="members")
+    op.drop_index("ix_members_postal_code_pattern", table_name="members")
+    op.drop_index("ix_members_city_postal_code", table_name="members")
@@ -0,0 +1,27 @@
+"""Add composite (name, id) index for keyset pagination of members
+
+Revision ID: 8d3f1c2a9b47
+Revises: c6ab222df22b
+Create Date: 2026-10-17 14:12:41.318502
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d3f1c2a9b47"
+down_revision: Union[str, Sequence[str], None] = "c6ab222df22b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_members_name_id", "members", ["name", "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_members_name_id", table_name="members")
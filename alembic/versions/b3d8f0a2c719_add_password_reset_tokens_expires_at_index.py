@@ -0,0 +1,35 @@
+"""Index password_reset_tokens.expires_at for the expiry sweeper
+
+Revision ID: b3d8f0a2c719
+Revises: 9a4c6e1b2f38
+Create Date: 2026-10-17 21:48:12.530662
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3d8f0a2c719"
+down_revision: Union[str, Sequence[str], None] = "9a4c6e1b2f38"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        op.f("ix_password_reset_tokens_expires_at"),
+        "password_reset_tokens",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_password_reset_tokens_expires_at"),
+        table_name="password_reset_tokens",
+    )
@@ -0,0 +1,33 @@
+"""Replace the (city, postal_code) member index with (city, id)
+
+Revision ID: d7f2b4e8a916
+Revises: c5e9a1d3b720
+Create Date: 2026-10-17 23:41:12.508236
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7f2b4e8a916"
+down_revision: Union[str, Sequence[str], None] = "c5e9a1d3b720"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Filter auf city mit ORDER BY id ... LIMIT kommt so ohne Sortierung aus;
+    # Präfixe auf postal_code deckt ix_members_postal_code_pattern ab
+    op.create_index("ix_members_city_id", "members", ["city", "id"], unique=False)
+    op.drop_index("ix_members_city_postal_code", table_name="members")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_members_city_postal_code", "members", ["city", "postal_code"], unique=False
+    )
+    op.drop_index("ix_members_city_id", table_name="members")
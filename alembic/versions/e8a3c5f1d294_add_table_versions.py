@@ -0,0 +1,36 @@
+"""Add table_versions change counter for the member list ETag
+
+Revision ID: e8a3c5f1d294
+Revises: d7f2b4e8a916
+Create Date: 2026-10-17 23:58:31.270914
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e8a3c5f1d294"
+down_revision: Union[str, Sequence[str], None] = "d7f2b4e8a916"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    table_versions = op.create_table(
+        "table_versions",
+        sa.Column("table_name", sa.String(length=64), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("table_name"),
+    )
+    # Zeile vorab anlegen, damit Schreibzugriffe nur noch UPDATE brauchen
+    op.bulk_insert(table_versions, [{"table_name": "members", "version": 0}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("table_versions")
@@ -1,21 +1,17 @@
 from fastapi import Depends, HTTPException, status
 
-from app.models.user import User
+from app.core.principal_cache import Principal
 
 # Wir importieren die get_current_user Funktion aus dem Auth Router
-from app.routers.auth import get_current_user
+from app.routers.auth import get_current_user, get_token_payload
+from app.routers.auth_async import get_current_user_async
 
 
-def require_admin(current_user: User = Depends(get_current_user)) -> User:
-    """
-    Dependency, die prüft, ob der eingeloggte Benutzer die Rolle 'Admin' hat.
-
-    Raises HTTPException 403 FORBIDDEN, falls die Rolle nicht 'Admin' ist.
-    Gibt das Benutzerobjekt zurück, falls die Autorisierung erfolgreich war.
-    """
-    # Prüft, ob der Benutzer eine Rolle und ob der Rollenname 'Admin' ist.
+def _ensure_admin(payload: dict, current_user: Principal) -> Principal:
+    # Tokens ohne `role`-Claim (vor Einführung ausgestellt) fallen auf den Principal zurück.
     # Da die Rolle über Alembic Seeding den Namen 'Admin' erhalten hat, ist dies die Quelle der Wahrheit.
-    if current_user.role and current_user.role.name == "Admin":
+    role_name = payload.get("role") or current_user.role_name
+    if role_name == "Admin":
         return current_user
 
     # Wird ausgelöst, wenn die Rolle nicht 'Admin' oder gar nicht vorhanden ist.
@@ -24,3 +20,30 @@ def require_admin(current_user: User = Depends(get_current_user)) -> User:
         detail="Sie haben keine Berechtigung, diese Aktion durchzuführen. Nur Administratoren sind erlaubt.",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def require_admin(
+    payload: dict = Depends(get_token_payload),
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
+    """
+    Dependency, die prüft, ob der eingeloggte Benutzer die Rolle 'Admin' hat.
+
+    Die Rolle stammt aus dem `role`-Claim des Tokens. get_current_user hat die
+    Token-Version bereits gegen den (gecachten) Stand des Benutzers geprüft, der
+    Claim ist also aktuell; ein Rollenwechsel entwertet ältere Tokens.
+
+    Raises HTTPException 403 FORBIDDEN, falls die Rolle nicht 'Admin' ist.
+    Gibt das Benutzerobjekt zurück, falls die Autorisierung erfolgreich war.
+    """
+    return _ensure_admin(payload, current_user)
+
+
+async def require_admin_async(
+    payload: dict = Depends(get_token_payload),
+    current_user: Principal = Depends(get_current_user_async),
+) -> Principal:
+    """
+    Wie require_admin, aber für die async Handler (DATABASE_MODE=async).
+    """
+    return _ensure_admin(payload, current_user)
@@ -1,3 +1,4 @@
+import os
 from typing import Optional
 
 from pydantic import Field
@@ -31,6 +32,29 @@ class Settings(BaseSettings):
 
     SQL_ECHO: bool = False
 
+    # Connection-Pool (pro Worker): size + max_overflow = maximale Verbindungen
+    DB_POOL_SIZE: int = 5
+    DB_POOL_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    # Verbindungen nach dieser Zeit erneuern (-1 = nie); pre_ping erkennt tote Verbindungen
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # Optionales Lese-Replikat für GET-Endpunkte; nach eigenem Schreibzugriff
+    # liest ein Client so lange vom Primary (Read-your-writes)
+    REPLICA_DATABASE_URL: Optional[str] = None
+    READ_YOUR_WRITES_SECONDS: int = 5
+
+    # Zeilen pro Block beim Streaming-Export (serverseitiger Cursor)
+    EXPORT_BATCH_SIZE: int = 1000
+    # Zeilen pro INSERT beim Bulk-Import
+    IMPORT_BATCH_SIZE: int = 1000
+
+    # "sync" (psycopg2, Threadpool) oder "async" (AsyncEngine, async Handler)
+    DATABASE_MODE: str = "sync"
+    # Optional; sonst aus DATABASE_URL abgeleitet (asyncpg / aiosqlite)
+    ASYNC_DATABASE_URL: Optional[str] = None
+
     # ========================
     # 3. Sicherheits-Einstellungen (JWT & Auth)
     # ========================
@@ -42,6 +66,64 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24
     PASSWORD_RESET_TOKEN_EXPIRE_MINUTES: int = 60
 
+    # Principal-Cache für get_current_user (pro Worker, 0 = deaktiviert)
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10_000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+
+    # Cache für GET /members/{id} (serialisiertes MemberRead, pro Worker, 0 = aus);
+    # die TTL begrenzt, wie lange Änderungen anderer Worker unsichtbar bleiben
+    MEMBER_CACHE_MAX_SIZE: int = 10_000
+    MEMBER_CACHE_TTL_SECONDS: int = 30
+
+    # X-Total-Count: exakte Zählungen je Filter kurz cachen; ab dieser Größe
+    # (laut Planer-Schätzung, nur Postgres) wird geschätzt statt gezählt
+    MEMBER_COUNT_CACHE_MAX_SIZE: int = 1_000
+    MEMBER_COUNT_CACHE_TTL_SECONDS: int = 10
+    MEMBER_COUNT_EXACT_LIMIT: int = 10_000
+
+    # Mitgliederlisten direkt per pydantic-core zu JSON-Bytes kodieren
+    # (ohne jsonable_encoder + json.dumps); wird in app.main pro App gesetzt
+    FAST_JSON_RESPONSES: bool = True
+
+    # Vollständige Neuberechnung von member_stats (Drift-Reparatur, 0 = aus)
+    MEMBER_STATS_RECOMPUTE_SECONDS: int = 3600
+
+    # Aufräumen abgelaufener Passwort-Reset-Tokens (0 = aus, dann per CLI)
+    RESET_TOKEN_SWEEP_SECONDS: int = 600
+    RESET_TOKEN_SWEEP_BATCH_SIZE: int = 1_000
+
+    # Verzeichnis der Lock-Dateien für Leader-Aufgaben ohne Postgres
+    LEADER_LOCK_DIR: str = "/tmp"
+
+    # Prozesspool für PBKDF2 (0 = inline im Request-Thread); standardmäßig
+    # ein kleiner Pool, damit Logins die API-Threads nicht blockieren
+    PASSWORD_HASH_WORKERS: int = min(2, os.cpu_count() or 1)
+    PASSWORD_HASH_MAX_CONCURRENCY: int = 4
+    PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS: float = 10.0
+
+    # PBKDF2-Zielkosten (None = passlib-Default) und Latenzbudget für die Kalibrierung
+    PASSWORD_HASH_ROUNDS: Optional[int] = None
+    PASSWORD_HASH_BUDGET_MS: int = 250
+
+    # Token-Sperrliste: Abgleich mit der DB / Aufräumen abgelaufener Einträge
+    # (Hintergrund-Task je Worker; 0 schaltet den periodischen Abgleich ab)
+    REVOCATION_SYNC_SECONDS: int = 5
+    REVOCATION_PRUNE_SECONDS: int = 300
+    REVOCATION_BLOOM_CAPACITY: int = 100_000
+
+    # Rate-Limits für Login/Register/Passwort-Reset (Token-Bucket)
+    # Backend: "memory" (pro Worker) oder "sqlite" (Datei, für mehrere Worker)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_SQLITE_PATH: str = "/tmp/csc-rate-limit.sqlite3"
+    RATE_LIMIT_IP_CAPACITY: int = 30
+    RATE_LIMIT_IP_PER_MINUTE: int = 30
+    RATE_LIMIT_IDENTITY_CAPACITY: int = 5
+    RATE_LIMIT_IDENTITY_PER_MINUTE: int = 5
+    # Reverse-Proxys (IPs/CIDRs, kommagetrennt), deren X-Forwarded-For vertraut
+    # wird; sonst zählt die Verbindungsadresse, hinter einem Proxy also dessen IP
+    RATE_LIMIT_TRUSTED_PROXIES: str = ""
+
     # ========================
     # 4. Mail-Einstellungen (Optional)
     # ========================
@@ -50,6 +132,24 @@ class Settings(BaseSettings):
     MAIL_USERNAME: Optional[str] = None
     MAIL_PASSWORD: Optional[str] = None
     MAIL_FROM: Optional[str] = None
+    MAIL_STARTTLS: bool = False
+    MAIL_TIMEOUT_SECONDS: float = 10.0
+
+    # E-Mail-Outbox (Versand durch `python -m app.scripts.email_worker`)
+    OUTBOX_BATCH_SIZE: int = 50
+    OUTBOX_POLL_SECONDS: float = 2.0
+    OUTBOX_MAX_ATTEMPTS: int = 6
+    # Backoff: OUTBOX_BACKOFF_SECONDS * 2^(Versuch-1), höchstens OUTBOX_BACKOFF_MAX_SECONDS
+    OUTBOX_BACKOFF_SECONDS: float = 30.0
+    OUTBOX_BACKOFF_MAX_SECONDS: float = 3600.0
+    # Geholte Nachrichten sind so lange für andere Worker gesperrt (Lease);
+    # muss länger sein als ein Block im schlimmsten Fall (Größe × MAIL_TIMEOUT)
+    OUTBOX_LEASE_SECONDS: float = 900.0
+    # Versendete/aufgegebene Nachrichten löscht der Reset-Token-Sweeper danach
+    OUTBOX_RETENTION_DAYS: int = 7
+
+    # Basis des Links in der Reset-Mail
+    PASSWORD_RESET_URL: str = "/auth/reset-password"
 
     # ========================
     # Pydantic Konfiguration
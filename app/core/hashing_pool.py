@@ -0,0 +1,112 @@
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+
+
+class PasswordHashPool:
+    """
+    Führt PBKDF2-Hashing/-Verifikation in einem eigenen Prozesspool aus.
+
+    PBKDF2 ist CPU-gebunden und hält den GIL; im Threadpool von FastAPI blockiert
+    ein Login-Sturm sonst die Threads, die auch `/members` bedienen. Der
+    aufrufende Thread wartet hier nur auf das Future (ohne GIL).
+
+    - `workers=0` rechnet inline im aufrufenden Thread (Entwicklung/Tests).
+    - `max_concurrency` begrenzt gleichzeitig laufende Jobs; weitere Aufrufer
+      warten höchstens `queue_timeout` Sekunden und erhalten dann 503.
+    """
+
+    def __init__(self, workers: int, max_concurrency: int, queue_timeout: float):
+        self.workers = workers
+        self.max_concurrency = max(1, max_concurrency)
+        self.queue_timeout = queue_timeout
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrency)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        self.waiting = 0
+        self.max_waiting = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    # "spawn" statt fork: der Webprozess hat bereits Threads/Locks
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._executor
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Führt `fn(*args)` aus (`fn` muss eine picklebare Modulfunktion sein)."""
+        if self.workers <= 0:
+            return fn(*args)
+
+        started = time.perf_counter()
+        with self._lock:
+            self.waiting += 1
+            self.max_waiting = max(self.max_waiting, self.waiting)
+        acquired = self._semaphore.acquire(timeout=self.queue_timeout)
+        with self._lock:
+            self.waiting -= 1
+            self.total_wait_seconds += time.perf_counter() - started
+            if not acquired:
+                self.rejected += 1
+            else:
+                self.in_flight += 1
+
+        if not acquired:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy, please retry shortly.",
+                headers={"Retry-After": "1"},
+            )
+
+        try:
+            return self._get_executor().submit(fn, *args).result()
+        finally:
+            self._semaphore.release()
+            with self._lock:
+                self.in_flight -= 1
+                self.completed += 1
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue-Tiefe und Durchsatz für /admin/metrics."""
+        finished = self.completed + self.rejected
+        return {
+            "workers": self.workers,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": (
+                round(self.total_wait_seconds / finished * 1000, 3) if finished else 0.0
+            ),
+        }
+
+
+# Prozessweite Instanz; Executor wird erst beim ersten Hash gestartet
+password_hash_pool = PasswordHashPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_concurrency=settings.PASSWORD_HASH_MAX_CONCURRENCY,
+    queue_timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS,
+)
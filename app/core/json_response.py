@@ -0,0 +1,27 @@
+from fastapi import Request, Response
+
+# Vom Handler gesetzte Header, die für den neuen Body neu berechnet werden
+_BODY_HEADERS = {"content-length", "content-type"}
+
+
+def fast_json_enabled(request: Request) -> bool:
+    """Schalter aus app.main (`app.state.fast_json_responses`), Default aus."""
+    return getattr(request.app.state, "fast_json_responses", False)
+
+
+def json_bytes_response(response: Response, body: bytes) -> Response:
+    """
+    Fertige JSON-Bytes als Response, inklusive der Header aus `response`.
+
+    Gibt ein Handler selbst eine Response zurück, übernimmt FastAPI die Header
+    des injizierten `response`-Parameters nicht; sie werden daher kopiert.
+    """
+    result = Response(
+        content=body,
+        status_code=response.status_code or 200,
+        media_type="application/json",
+    )
+    for key, value in response.headers.items():
+        if key not in _BODY_HEADERS:
+            result.headers.append(key, value)
+    return result
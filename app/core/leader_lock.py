@@ -0,0 +1,63 @@
+import fcntl
+import hashlib
+import os
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+
+def lock_key(name: str) -> int:
+    """Stabiler 64-Bit-Schlüssel für pg_advisory_lock aus einem Namen."""
+    digest = hashlib.sha1(name.encode()).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+def lock_path(name: str) -> str:
+    return os.path.join(settings.LEADER_LOCK_DIR, f"csc-{name}.lock")
+
+
+@contextmanager
+def leader_lock(engine: Engine, name: str, blocking: bool = False) -> Iterator[bool]:
+    """
+    Sperre über alle Worker: liefert True nur dem Halter.
+
+    Auf Postgres ein Session-Advisory-Lock auf einer eigenen Verbindung (gilt
+    auch über Hosts hinweg), sonst ein flock auf eine Datei in LEADER_LOCK_DIR
+    (mehrere Worker auf einem Host, z. B. SQLite). Stirbt der Halter, geben
+    Datenbank bzw. Kernel die Sperre frei. Mit `blocking=True` wird gewartet,
+    bis die Sperre frei ist (dann immer True).
+    """
+    if engine.dialect.name == "postgresql":
+        key = lock_key(name)
+        function = "pg_advisory_lock" if blocking else "pg_try_advisory_lock"
+        with engine.connect() as connection:
+            result = connection.execute(
+                text(f"SELECT {function}(:key)"), {"key": key}
+            ).scalar()
+            # pg_advisory_lock liefert void (None), kehrt aber erst mit Sperre zurück
+            acquired = blocking or bool(result)
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    connection.execute(
+                        text("SELECT pg_advisory_unlock(:key)"), {"key": key}
+                    )
+        return
+
+    with open(lock_path(name), "a") as handle:
+        try:
+            fcntl.flock(
+                handle, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+            )
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
@@ -0,0 +1,74 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+
+class CachedMember(NamedTuple):
+    """Fertig serialisiertes MemberRead samt Zeitstempel für Last-Modified."""
+
+    body: bytes
+    last_modified: Optional[datetime]
+
+
+class MemberCache(TTLCache):
+    """
+    Read-through-Cache für GET /members/{id}, indiziert über die Mitglieds-ID.
+
+    Gespeichert wird der JSON-Body, damit ein Treffer weder DB noch Pydantic
+    braucht. Jede Invalidierung erhöht `generation`; `fill` verwirft einen
+    Eintrag, der vor einer parallelen Änderung gelesen wurde.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.generation = 0
+
+    def fill(self, member_id: int, value: CachedMember, generation: int) -> None:
+        """Wie `set`, aber nur, falls seit `generation` nichts invalidiert wurde."""
+        if self.max_size <= 0:
+            return
+        expires_at = self._clock() + self.ttl_seconds if self.ttl_seconds else 0.0
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._data[member_id] = (expires_at, value)
+            self._data.move_to_end(member_id)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key) -> None:
+        with self._lock:
+            self.generation += 1
+            self._data.pop(key, None)
+
+    def invalidate_many(self, member_ids: Iterable[int]) -> None:
+        with self._lock:
+            self.generation += 1
+            for member_id in member_ids:
+                self._data.pop(member_id, None)
+
+    def invalidate_where(self, predicate: Callable[[Any], bool]) -> int:
+        with self._lock:
+            self.generation += 1
+        return super().invalidate_where(predicate)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            payload_bytes = sum(len(value.body) for _, value in self._data.values())
+        return {**super().stats(), "payload_bytes": payload_bytes}
+
+
+# Prozessweite Instanz (ein Cache pro Worker)
+member_cache = MemberCache(
+    max_size=settings.MEMBER_CACHE_MAX_SIZE,
+    ttl_seconds=settings.MEMBER_CACHE_TTL_SECONDS,
+)
+
+# Exakte Trefferzahlen der Mitgliederliste je Filter (X-Total-Count)
+member_count_cache = TTLCache(
+    max_size=settings.MEMBER_COUNT_CACHE_MAX_SIZE,
+    ttl_seconds=settings.MEMBER_COUNT_CACHE_TTL_SECONDS,
+)
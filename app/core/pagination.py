@@ -0,0 +1,43 @@
+import base64
+import binascii
+import json
+from typing import Any, Dict, Optional
+
+from fastapi import HTTPException, Request, Response, status
+
+
+def encode_cursor(data: Dict[str, Any]) -> str:
+    """Kodiert eine Position als opaken, URL-sicheren Cursor."""
+    raw = json.dumps(data, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Gegenstück zu encode_cursor; ungültige Cursor führen zu 400."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        data = None
+    if not isinstance(data, dict):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+    return data
+
+
+def set_cursor_headers(
+    request: Request,
+    response: Response,
+    next_cursor: Optional[str],
+    prev_cursor: Optional[str],
+) -> None:
+    """Setzt X-Next-Cursor/X-Prev-Cursor und einen passenden Link-Header."""
+    links = []
+    for rel, cursor in (("next", next_cursor), ("prev", prev_cursor)):
+        if cursor:
+            response.headers[f"X-{rel.capitalize()}-Cursor"] = cursor
+            url = request.url.include_query_params(cursor=cursor)
+            links.append(f'<{url}>; rel="{rel}"')
+    if links:
+        response.headers["Link"] = ", ".join(links)
@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    Schlanke, unveränderliche Sicht auf den eingeloggten Benutzer.
+
+    Wird statt des ORM-Objekts durch die Auth-Dependencies gereicht, damit
+    authentifizierte Requests bei einem Cache-Treffer keine DB-Abfrage brauchen.
+    """
+
+    id: int
+    username: str
+    email: str
+    role_name: Optional[str]
+    token_version: int = 0
+
+    @classmethod
+    def from_user(cls, user) -> "Principal":
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            role_name=user.role.name if user.role else None,
+            token_version=user.token_version or 0,
+        )
+
+
+class PrincipalCache(TTLCache):
+    """Principal-Cache, indiziert über das Token-Subject (Username)."""
+
+    def invalidate_user(self, username: str) -> None:
+        """Nach Passwort-Reset oder Rollenwechsel aufrufen."""
+        self.invalidate(username)
+
+    def invalidate_user_id(self, user_id: int) -> None:
+        """Wie `invalidate_user`, falls nur die ID bekannt ist."""
+        self.invalidate_where(lambda principal: principal.id == user_id)
+
+
+# Prozessweite Instanz (ein Cache pro Worker)
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
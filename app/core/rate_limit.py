@@ -0,0 +1,267 @@
+import ipaddress
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Protocol, Tuple, Union
+
+from fastapi import HTTPException, Request, status
+
+from app.core.config import settings
+
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """Token-Bucket: `capacity` Anfragen am Stück, danach `per_minute` pro Minute."""
+
+    capacity: int
+    per_minute: int
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.per_minute / 60.0
+
+
+def take_token(
+    tokens: float, updated_at: float, rule: RateLimitRule, now: float
+) -> Tuple[bool, float, float]:
+    """
+    Füllt den Bucket seit `updated_at` auf und entnimmt ein Token.
+
+    Gibt `(allowed, neue_tokens, retry_after_sekunden)` zurück.
+    """
+    tokens = min(
+        float(rule.capacity),
+        tokens + max(0.0, now - updated_at) * rule.refill_per_second,
+    )
+    if tokens >= 1.0:
+        return True, tokens - 1.0, 0.0
+    return False, tokens, (1.0 - tokens) / rule.refill_per_second
+
+
+class BucketStore(Protocol):
+    def consume(self, key: str, rule: RateLimitRule) -> Tuple[bool, float]: ...
+
+    def clear(self) -> None: ...
+
+
+class MemoryBucketStore:
+    """Buckets im Prozessspeicher (Default, ein Limit pro Worker)."""
+
+    def __init__(
+        self, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, rule: RateLimitRule) -> Tuple[bool, float]:
+        now = self._clock()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (float(rule.capacity), now))
+            allowed, tokens, retry_after = take_token(tokens, updated_at, rule, now)
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            # Lange ungenutzte Buckets sind ohnehin voll und können weg
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return allowed, retry_after
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+class SQLiteBucketStore:
+    """
+    Buckets in einer lokalen SQLite-Datei, geteilt von allen Workern eines Hosts.
+
+    Jede Entnahme läuft in einer `BEGIN IMMEDIATE`-Transaktion und ist damit
+    über Prozessgrenzen hinweg atomar.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+                "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def consume(self, key: str, rule: RateLimitRule) -> Tuple[bool, float]:
+        now = time.time()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM rate_limit_buckets WHERE key = ?",
+                (key,),
+            ).fetchone()
+            tokens, updated_at = row if row else (float(rule.capacity), now)
+            allowed, tokens, retry_after = take_token(tokens, updated_at, rule, now)
+            conn.execute(
+                "INSERT INTO rate_limit_buckets (key, tokens, updated_at) "
+                "VALUES (?, ?, ?) ON CONFLICT(key) DO UPDATE SET "
+                "tokens = excluded.tokens, updated_at = excluded.updated_at",
+                (key, tokens, now),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return allowed, retry_after
+
+    def clear(self) -> None:
+        self._connect().execute("DELETE FROM rate_limit_buckets")
+
+
+class RateLimiter:
+    """Prüft Buckets pro IP und pro Identität und zählt Ablehnungen."""
+
+    def __init__(
+        self, store: BucketStore, ip_rule: RateLimitRule, identity_rule: RateLimitRule
+    ):
+        self.store = store
+        self.ip_rule = ip_rule
+        self.identity_rule = identity_rule
+        self.allowed: Dict[str, int] = defaultdict(int)
+        self.rejected: Dict[str, int] = defaultdict(int)
+
+    def hit(self, scope: str, kind: str, value: str, rule: RateLimitRule) -> None:
+        """Entnimmt ein Token oder wirft 429 mit Retry-After."""
+        allowed, retry_after = self.store.consume(f"{scope}:{kind}:{value}", rule)
+        if allowed:
+            self.allowed[scope] += 1
+            return
+        self.rejected[f"{scope}:{kind}"] += 1
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please retry later.",
+            headers={"Retry-After": str(max(1, int(retry_after + 0.999)))},
+        )
+
+    def clear(self) -> None:
+        self.store.clear()
+        self.allowed.clear()
+        self.rejected.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": type(self.store).__name__,
+            "allowed": dict(self.allowed),
+            "rejected": dict(self.rejected),
+            "rejected_total": sum(self.rejected.values()),
+        }
+
+
+def build_rate_limiter() -> RateLimiter:
+    if settings.RATE_LIMIT_BACKEND == "sqlite":
+        store: BucketStore = SQLiteBucketStore(settings.RATE_LIMIT_SQLITE_PATH)
+    else:
+        store = MemoryBucketStore()
+    return RateLimiter(
+        store,
+        ip_rule=RateLimitRule(
+            settings.RATE_LIMIT_IP_CAPACITY, settings.RATE_LIMIT_IP_PER_MINUTE
+        ),
+        identity_rule=RateLimitRule(
+            settings.RATE_LIMIT_IDENTITY_CAPACITY,
+            settings.RATE_LIMIT_IDENTITY_PER_MINUTE,
+        ),
+    )
+
+
+rate_limiter = build_rate_limiter()
+
+
+async def _read_identity(request: Request, field: str) -> Optional[str]:
+    # FastAPI hat Form/JSON zu diesem Zeitpunkt bereits gelesen (Starlette cached es)
+    try:
+        if request.headers.get("content-type", "").startswith("application/json"):
+            data = await request.json()
+        else:
+            data = await request.form()
+    except Exception:
+        return None
+    value = data.get(field) if hasattr(data, "get") else None
+    return str(value).strip().lower() if value else None
+
+
+@lru_cache(maxsize=8)
+def trusted_proxy_networks(value: str) -> Tuple[IPNetwork, ...]:
+    """Parst RATE_LIMIT_TRUSTED_PROXIES (einmal je Wert)."""
+    return tuple(
+        ipaddress.ip_network(item.strip(), strict=False)
+        for item in value.split(",")
+        if item.strip()
+    )
+
+
+def _is_trusted(host: str, networks: Tuple[IPNetwork, ...]) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in networks)
+
+
+def client_ip(request: Request, trusted: Optional[Tuple[IPNetwork, ...]] = None) -> str:
+    """
+    Adresse des Clients für das IP-Limit.
+
+    Kommt die Verbindung von einem vertrauenswürdigen Proxy
+    (RATE_LIMIT_TRUSTED_PROXIES), wird X-Forwarded-For von rechts gelesen und
+    die erste Adresse genommen, die kein vertrauenswürdiger Proxy ist; weiter
+    links stehende Einträge kann der Client selbst fälschen.
+    """
+    if trusted is None:
+        trusted = trusted_proxy_networks(settings.RATE_LIMIT_TRUSTED_PROXIES)
+    peer = request.client.host if request.client else "unknown"
+    if not trusted or not _is_trusted(peer, trusted):
+        return peer
+    forwarded = [
+        hop.strip()
+        for header in request.headers.getlist("x-forwarded-for")
+        for hop in header.split(",")
+        if hop.strip()
+    ]
+    for hop in reversed(forwarded):
+        if not _is_trusted(hop, trusted):
+            return hop
+    return forwarded[0] if forwarded else peer
+
+
+def rate_limit(scope: str, identity_field: Optional[str] = None):
+    """
+    Dependency-Factory für teure Auth-Endpunkte.
+
+    Läuft vor dem Handler und damit vor jedem Hashing oder DB-Zugriff;
+    abgelehnte Anfragen kosten nur einen Bucket-Lookup.
+    """
+
+    async def dependency(request: Request) -> None:
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+        rate_limiter.hit(scope, "ip", client_ip(request), rate_limiter.ip_rule)
+        if identity_field:
+            identity = await _read_identity(request, identity_field)
+            if identity:
+                rate_limiter.hit(
+                    scope, "identity", identity, rate_limiter.identity_rule
+                )
+
+    return dependency
@@ -0,0 +1,133 @@
+import hashlib
+import hmac
+import time
+from typing import Optional
+
+from jose import JWTError, jwt
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+# Kurzlebiges Cookie mit dem Ablaufzeitpunkt (Unix-Zeit) der Primary-Phase,
+# signiert und an das Subject des Tokens gebunden: "<until>.<hmac>"
+COOKIE_NAME = "csc_ryw"
+
+
+def token_subject(conn: HTTPConnection) -> Optional[str]:
+    """
+    Liest das Subject aus dem Bearer-Token, ohne die Signatur zu prüfen.
+
+    Es entscheidet nur, ob vom Primary gelesen wird; gefälschte Tokens
+    scheitern ohnehin an get_current_user.
+    """
+    authorization = conn.headers.get("authorization", "")
+    if not authorization.lower().startswith("bearer "):
+        return None
+    try:
+        return jwt.get_unverified_claims(authorization[7:]).get("sub")
+    except JWTError:
+        return None
+
+
+def cookie_signature(until: str, subject: Optional[str]) -> str:
+    """HMAC (SECRET_KEY) über Ablaufzeitpunkt und Subject des Cookies."""
+    message = f"{subject or ''}|{until}".encode()
+    return hmac.new(settings.SECRET_KEY.encode(), message, hashlib.sha256).hexdigest()[
+        :32
+    ]
+
+
+def cookie_prefers_primary(conn: HTTPConnection, now: Optional[float] = None) -> bool:
+    """
+    True, solange das Read-your-writes-Cookie des Clients gilt.
+
+    Das Cookie reist mit dem Client und wirkt damit auch, wenn der nächste
+    Request auf einem anderen Worker landet. Nur vom Server signierte Werte
+    für das Subject des aktuellen Tokens zählen; ein Client kann sich so nicht
+    selbst auf den Primary legen, sondern nur durch eigene Schreibzugriffe.
+    """
+    until, _, signature = conn.cookies.get(COOKIE_NAME, "").rpartition(".")
+    expected = cookie_signature(until, token_subject(conn))
+    if not hmac.compare_digest(signature, expected):
+        return False
+    try:
+        until_value = float(until)
+    except ValueError:
+        return False
+    now = time.time() if now is None else now
+    return now < until_value <= now + settings.READ_YOUR_WRITES_SECONDS + 1
+
+
+class ReadYourWrites(TTLCache):
+    """
+    Merkt sich Benutzer, die gerade geschrieben haben (pro Worker).
+
+    Solange ein Eintrag lebt, liest der Benutzer vom Primary statt vom Replikat
+    und sieht damit seine eigenen Änderungen trotz Replikationsverzug.
+    Schreibzugriffe ohne Token (Registrierung, Passwort-Reset) markieren den
+    betroffenen Benutzernamen direkt über `mark_subject`. Über mehrere Worker
+    hinweg trägt das Cookie `COOKIE_NAME` die Markierung (siehe Middleware).
+    """
+
+    def mark_subject(self, subject: str) -> None:
+        self.set(subject, True)
+
+    def mark(self, conn: HTTPConnection) -> None:
+        subject = token_subject(conn)
+        if subject:
+            self.mark_subject(subject)
+
+    def prefers_primary(self, conn: HTTPConnection) -> bool:
+        if cookie_prefers_primary(conn):
+            return True
+        subject = token_subject(conn)
+        return bool(subject and self.get(subject))
+
+
+read_your_writes = ReadYourWrites(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.READ_YOUR_WRITES_SECONDS,
+)
+
+
+def marker_cookie(subject: Optional[str], now: Optional[float] = None) -> str:
+    seconds = settings.READ_YOUR_WRITES_SECONDS
+    until = f"{(time.time() if now is None else now) + seconds:.3f}"
+    value = f"{until}.{cookie_signature(until, subject)}"
+    return (
+        f"{COOKIE_NAME}={value}; Max-Age={seconds}; Path=/; HttpOnly; " "SameSite=Lax"
+    )
+
+
+class ReadYourWritesMiddleware:
+    """
+    Markiert den Benutzer nach jeder erfolgreichen schreibenden Anfrage.
+
+    Neben dem Eintrag im Worker-Speicher wird ein kurzlebiges Cookie gesetzt,
+    damit auch andere uvicorn-Worker den Client vom Primary bedienen.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                conn = HTTPConnection(scope)
+                read_your_writes.mark(conn)
+                subject = token_subject(conn)
+                if subject and settings.READ_YOUR_WRITES_SECONDS > 0:
+                    MutableHeaders(scope=message).append(
+                        "set-cookie", marker_cookie(subject)
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
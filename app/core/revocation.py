@@ -0,0 +1,133 @@
+import hashlib
+import math
+import threading
+import time
+from typing import Any, Dict, Iterable, Tuple
+
+from app.core.config import settings
+
+
+class BloomFilter:
+    """
+    Kompakter Bloom-Filter für Strings (Double Hashing über BLAKE2b).
+
+    Keine falsch-negativen Treffer; falsch-positive Treffer mit der Rate
+    `error_rate` bei `capacity` Einträgen.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size_bits = max(
+            8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        self.num_hashes = max(1, round(self.size_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.size_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size_bits for i in range(self.num_hashes))
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item)
+        )
+
+
+class RevocationFilter:
+    """
+    In-Memory-Spiegel der persistierten Sperrliste (`revoked_tokens`).
+
+    Der Bloom-Filter beantwortet den Normalfall "nicht gesperrt" ohne
+    Dict-Zugriff; nur bei einem (evtl. falsch-positiven) Treffer entscheidet
+    das exakte Set. Abgelaufene JTIs werden beim Prunen entfernt, der
+    Bloom-Filter wird dann neu aufgebaut.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.initial_capacity = capacity
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+        self._reset(capacity)
+
+    def _reset(self, capacity: int) -> None:
+        self._bloom = BloomFilter(capacity, self.error_rate)
+        self._exact: Dict[str, float] = {}
+        self.last_synced_id = 0
+        self.last_synced_at = 0.0
+        self.last_pruned_at = time.monotonic()
+        self.checks = 0
+        self.bloom_positives = 0
+        self.revoked_hits = 0
+
+    def add(self, jti: str, expires_at: float) -> None:
+        """Sperrt `jti` bis `expires_at` (Unix-Timestamp)."""
+        with self._lock:
+            if jti in self._exact:
+                return
+            self._exact[jti] = expires_at
+            if len(self._exact) > self._bloom.capacity:
+                self._rebuild(self._bloom.capacity * 2)
+            else:
+                self._bloom.add(jti)
+
+    def add_many(self, entries: Iterable[Tuple[str, float]]) -> None:
+        for jti, expires_at in entries:
+            self.add(jti, expires_at)
+
+    def is_revoked(self, jti: str) -> bool:
+        self.checks += 1
+        if jti not in self._bloom:
+            return False
+        self.bloom_positives += 1
+        expires_at = self._exact.get(jti)
+        if expires_at is None:
+            return False
+        self.revoked_hits += 1
+        return True
+
+    def prune(self, now: float) -> int:
+        """Entfernt abgelaufene JTIs; gibt die Anzahl entfernter Einträge zurück."""
+        with self._lock:
+            expired = [jti for jti, exp in self._exact.items() if exp <= now]
+            for jti in expired:
+                del self._exact[jti]
+            if expired:
+                self._rebuild(max(self.initial_capacity, len(self._exact) * 2))
+            self.last_pruned_at = time.monotonic()
+            return len(expired)
+
+    def _rebuild(self, capacity: int) -> None:
+        bloom = BloomFilter(capacity, self.error_rate)
+        for jti in self._exact:
+            bloom.add(jti)
+        self._bloom = bloom
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset(self.initial_capacity)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "revoked_tokens": len(self._exact),
+            "bloom_capacity": self._bloom.capacity,
+            "bloom_bytes": len(self._bloom._bits),
+            "bloom_hashes": self._bloom.num_hashes,
+            "checks": self.checks,
+            "bloom_positives": self.bloom_positives,
+            "revoked_hits": self.revoked_hits,
+            "last_synced_id": self.last_synced_id,
+        }
+
+
+# Prozessweite Instanz; wird vom TokenRevocationService mit der DB abgeglichen
+revocation_filter = RevocationFilter(capacity=settings.REVOCATION_BLOOM_CAPACITY)
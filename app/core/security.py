@@ -2,6 +2,7 @@ import hashlib
 import os
 import secrets
 from datetime import UTC, datetime, timedelta
+from typing import Optional
 
 from dotenv import load_dotenv
 from fastapi import Depends, HTTPException, status
@@ -9,11 +10,33 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
+from app.core.config import settings
+from app.core.hashing_pool import password_hash_pool
+
 load_dotenv()
 
+
+def build_crypt_context(rounds: Optional[int] = None) -> CryptContext:
+    """
+    Builds the password CryptContext.
+
+    With `rounds` set, new hashes use exactly that PBKDF2 cost and stored hashes
+    below it are reported by `needs_update` (rehash on next successful login).
+    """
+    if rounds is None:
+        return CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+    return CryptContext(
+        schemes=["pbkdf2_sha256"],
+        deprecated="auto",
+        pbkdf2_sha256__default_rounds=rounds,
+        pbkdf2_sha256__min_rounds=rounds,
+    )
+
+
 # --- Security configuration ---
 bearer_scheme = HTTPBearer(auto_error=True)
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# Zielkosten über `python -m app.scripts.calibrate_password_hash` ermitteln
+pwd_context = build_crypt_context(settings.PASSWORD_HASH_ROUNDS)
 
 SECRET_KEY = os.getenv("SECRET_KEY")
 if not SECRET_KEY:
@@ -24,21 +47,64 @@ ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 60))
 
 
 # --- Password hashing ---
+# Die _-Funktionen laufen im Hash-Prozesspool und müssen daher Modulfunktionen sein.
+def _hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def _verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     """Hashes a user's password using a strong one-way algorithm (PBKDF2)."""
-    return pwd_context.hash(password)
+    return password_hash_pool.run(_hash_password, password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifies a plain-text password against its stored hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hash_pool.run(_verify_password, plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """
+    Verifies a password with a single PBKDF2 run.
+
+    Returns `(valid, new_hash)`; `new_hash` is set when the stored hash is below
+    the configured target cost and should replace it.
+    """
+    return password_hash_pool.run(
+        _verify_and_update_password, plain_password, hashed_password
+    )
 
 
 # --- JWT token creation ---
-def create_access_token(username: str) -> str:
-    """Generates a signed JWT access token for authentication."""
+def create_access_token(
+    username: str, role: Optional[str] = None, token_version: int = 0
+) -> str:
+    """
+    Generates a signed JWT access token for authentication.
+
+    The token carries the role name (`role`) and the user's token version
+    (`ver`), so authorization checks need no database round trip. The random
+    `jti` identifies the token for logout/revocation.
+    """
     expire = datetime.now(UTC) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    payload = {"sub": username, "exp": expire}
+    payload = {
+        "sub": username,
+        "exp": expire,
+        "role": role,
+        "ver": token_version,
+        "jti": secrets.token_hex(16),
+    }
     return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
 
@@ -1,4 +1,6 @@
 # Re-exports for convenience. Keeps legacy imports working (e.g. `from app.db import SessionLocal`)
+from .async_database import get_async_db
 from .database import Base, SessionLocal, engine, get_db
+from .replica import get_read_db
 
-__all__ = ["engine", "SessionLocal", "Base", "get_db"]
+__all__ = ["engine", "SessionLocal", "Base", "get_db", "get_async_db", "get_read_db"]
@@ -0,0 +1,73 @@
+from typing import AsyncGenerator, Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.core.config import settings
+from app.db.pool import pool_options
+
+# Sync-Treiber -> passender Async-Treiber
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """Leitet aus einer Sync-URL (psycopg2/pysqlite) die Async-URL ab."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}' URLs")
+    return parsed.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(
+        hide_password=False
+    )
+
+
+# Engine wird erst bei Bedarf erzeugt, damit der Sync-Modus keinen Async-Treiber braucht
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine
+    if _async_engine is None:
+        url = settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL)
+        _async_engine = create_async_engine(
+            url, echo=settings.SQL_ECHO, **pool_options(url, async_engine=True)
+        )
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(
+            bind=get_async_engine(), autoflush=False, expire_on_commit=False
+        )
+    return _async_session_factory
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yields an async database session (DATABASE_MODE=async)."""
+    async with get_async_session_factory()() as session:
+        yield session
+
+
+def peek_async_engine() -> Optional[AsyncEngine]:
+    """Die AsyncEngine, falls sie bereits erzeugt wurde (ohne sie anzulegen)."""
+    return _async_engine
+
+
+async def dispose_async_engine() -> None:
+    """Schließt den Async-Pool (Shutdown)."""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
@@ -0,0 +1,124 @@
+import os
+import time
+from typing import Any, Dict, Optional, Set
+
+from sqlalchemy import select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from app.core.leader_lock import leader_lock
+from app.models.app_state import AppState
+from app.scripts.seed import seed, seed_fingerprint
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+LOCK_NAME = "startup"
+SEED_FINGERPRINT_KEY = "seed_fingerprint"
+
+
+class StartupReport:
+    """Was der letzte Start dieses Workers an der Datenbank getan hat (/admin/metrics)."""
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        self.checked = False
+        self.migrated = False
+        self.seeded = False
+        self.locked = False
+        self.revision: Optional[str] = None
+        self.duration_seconds = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "checked": self.checked,
+            "migrated": self.migrated,
+            "seeded": self.seeded,
+            "waited_for_lock": self.locked,
+            "revision": self.revision,
+            "duration_ms": round(self.duration_seconds * 1000, 3),
+        }
+
+
+startup_report = StartupReport()
+
+
+def alembic_config() -> Config:
+    return Config(os.path.join(PROJECT_ROOT, "alembic.ini"))
+
+
+def head_revisions(config: Config) -> Set[str]:
+    return set(ScriptDirectory.from_config(config).get_heads())
+
+
+def current_revisions(connection: Connection) -> Set[str]:
+    return set(MigrationContext.configure(connection).get_current_heads())
+
+
+def stored_fingerprint(connection: Connection) -> Optional[str]:
+    return connection.execute(
+        select(AppState.value).where(AppState.key == SEED_FINGERPRINT_KEY)
+    ).scalar()
+
+
+def migrate(engine: Engine, config: Config) -> None:
+    """`alembic upgrade head` im laufenden Prozess, in einer Transaktion."""
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
+
+
+def run_seed(engine: Engine, fingerprint: str) -> None:
+    with Session(bind=engine) as db:
+        seed(db)
+        db.merge(AppState(key=SEED_FINGERPRINT_KEY, value=fingerprint))
+        db.commit()
+
+
+def prepare_database(engine: Engine) -> StartupReport:
+    """
+    Bringt Schema und Seed-Daten beim Start auf den aktuellen Stand.
+
+    Der Normalfall (Revision = head, gespeicherter Seed-Fingerprint aktuell)
+    kostet zwei Abfragen auf einer Verbindung. Nur sonst wird die Startsperre
+    (app.core.leader_lock) blockierend genommen: ein Worker migriert und seedet,
+    die übrigen warten und finden danach alles aktuell vor.
+    """
+    started = time.perf_counter()
+    report = startup_report
+    report.clear()
+
+    config = alembic_config()
+    heads = head_revisions(config)
+    fingerprint = seed_fingerprint()
+
+    with engine.connect() as connection:
+        current = (
+            current_revisions(connection) == heads
+            and stored_fingerprint(connection) == fingerprint
+        )
+
+    if not current:
+        report.locked = True
+        with leader_lock(engine, LOCK_NAME, blocking=True):
+            # Ein anderer Worker kann inzwischen fertig geworden sein
+            with engine.connect() as connection:
+                revisions = current_revisions(connection)
+            if revisions != heads:
+                migrate(engine, config)
+                report.migrated = True
+
+            with engine.connect() as connection:
+                stored = stored_fingerprint(connection)
+            if stored != fingerprint:
+                run_seed(engine, fingerprint)
+                report.seeded = True
+
+    report.checked = True
+    report.revision = ",".join(sorted(heads))
+    report.duration_seconds = time.perf_counter() - started
+    return report
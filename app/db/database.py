@@ -2,11 +2,15 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from app.core.config import settings
+from app.db.pool import pool_options
 
 # 1. Create SQLAlchemy engine
 # Verwende settings direkt, um unnötige Zwischenvariablen zu vermeiden
 engine = create_engine(
-    settings.DATABASE_URL, echo=settings.SQL_ECHO, future=True  # SQLAlchemy 2.0 Stil
+    settings.DATABASE_URL,
+    echo=settings.SQL_ECHO,
+    future=True,  # SQLAlchemy 2.0 Stil
+    **pool_options(settings.DATABASE_URL),
 )
 
 # 2. Create session factory
@@ -0,0 +1,129 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.core.config import settings
+
+
+class PoolStats:
+    """
+    Zähler für Connection-Checkouts eines Pools (pro Worker).
+
+    Erfasst, wie lange Requests auf eine freie Verbindung warten und wie oft
+    das mit `QueuePool limit ... timed out` endet.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def record(self, wait_seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.total_wait_seconds = 0.0
+            self.max_wait_seconds = 0.0
+
+    def stats(self, pool: Optional[Pool] = None) -> Dict[str, Any]:
+        """Zähler plus aktueller Füllstand von `pool` (für /admin/db-pool)."""
+        attempts = self.checkouts + self.timeouts
+        result: Dict[str, Any] = {
+            "checkouts": self.checkouts,
+            "checkout_timeouts": self.timeouts,
+            "avg_wait_ms": (
+                round(self.total_wait_seconds / attempts * 1000, 3) if attempts else 0.0
+            ),
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+        }
+        if isinstance(pool, QueuePool):
+            result.update(
+                {
+                    "pool_size": pool.size(),
+                    "checked_out": pool.checkedout(),
+                    "checked_in": pool.checkedin(),
+                    "overflow": max(0, pool.overflow()),
+                    "max_overflow": pool._max_overflow,
+                }
+            )
+        return result
+
+
+class _CheckoutStatsMixin:
+    """
+    Zählt Wartezeit und Timeouts beim Checkout in `checkout_stats`.
+
+    Die Zähler gehören zum Pool (also zur Engine), damit Primary, Replikat und
+    async Engine getrennt ausgewiesen werden; `recreate` (z. B. bei dispose)
+    übernimmt sie.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_stats = PoolStats()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.checkout_stats = self.checkout_stats
+        return pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.checkout_stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.checkout_stats.record(time.perf_counter() - started)
+        return connection
+
+
+class InstrumentedQueuePool(_CheckoutStatsMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_CheckoutStatsMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_pool_stats(engine: Any) -> Dict[str, Any]:
+    """Checkout-Zähler und Füllstand des Pools einer (sync) Engine."""
+    stats = getattr(engine.pool, "checkout_stats", None) or PoolStats()
+    return stats.stats(engine.pool)
+
+
+def pool_options(url: str, async_engine: bool = False) -> Dict[str, Any]:
+    """
+    Pool-Parameter aus den Settings für `create_engine`/`create_async_engine`.
+
+    In-Memory-SQLite behält den Default-Pool (eine Verbindung pro Thread).
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (
+        None,
+        "",
+        ":memory:",
+    ):
+        return {}
+    return {
+        "poolclass": (
+            InstrumentedAsyncQueuePool if async_engine else InstrumentedQueuePool
+        ),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_POOL_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
@@ -0,0 +1,66 @@
+from typing import Generator, Optional
+
+from fastapi import Depends, Request
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+from app.core.config import settings
+from app.core.read_your_writes import read_your_writes
+from app.db.database import get_db
+from app.db.pool import pool_options
+
+
+class RoutingSession(Session):
+    """
+    Liest vom Replikat und schreibt auf den Primary.
+
+    Flushes und DML-Statements (INSERT/UPDATE/DELETE) gehen immer an den
+    Primary, z. B. wenn die Revocation-Synchronisierung abgelaufene Einträge
+    in einem lesenden Request aufräumt.
+    """
+
+    def __init__(self, primary: Engine, replica: Engine, **kwargs):
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.replica = replica
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or isinstance(clause, UpdateBase):
+            return self.primary
+        return self.replica
+
+
+# Optionales Lese-Replikat; ohne REPLICA_DATABASE_URL läuft alles über den Primary
+replica_engine: Optional[Engine] = (
+    create_engine(
+        settings.REPLICA_DATABASE_URL,
+        echo=settings.SQL_ECHO,
+        **pool_options(settings.REPLICA_DATABASE_URL),
+    )
+    if settings.REPLICA_DATABASE_URL
+    else None
+)
+
+
+def get_read_db(
+    request: Request, db: Session = Depends(get_db)
+) -> Generator[Session, None, None]:
+    """
+    Session für rein lesende Requests (Mitgliederliste, Mitglied, Export).
+
+    Liest vom Replikat, außer der Client hat innerhalb der letzten
+    READ_YOUR_WRITES_SECONDS selbst geschrieben; dann die Primary-Session.
+    """
+    if replica_engine is None or read_your_writes.prefers_primary(request):
+        yield db
+        return
+
+    session = RoutingSession(
+        primary=db.get_bind(), replica=replica_engine, autoflush=False
+    )
+    try:
+        yield session
+    finally:
+        session.close()
@@ -1,44 +1,76 @@
+import asyncio
 import os
-import subprocess
 from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 
-from app.routers import auth, members, password_reset
+from app.core.config import settings
+from app.core.hashing_pool import password_hash_pool
+from app.core.read_your_writes import ReadYourWritesMiddleware
+from app.db import engine
+from app.db.async_database import dispose_async_engine
+from app.db.bootstrap import prepare_database
+from app.routers import admin, auth, members, password_reset
+from app.services.member_stats import recompute_periodically
+from app.services.reset_token_sweeper import sweep_periodically
+from app.services.token_revocation_service import sync_periodically, sync_revocations
+
+# DATABASE_MODE=async: Auth- und Mitglieder-Router laufen als async Handler
+if settings.DATABASE_MODE == "async":
+    from app.routers import auth_async as auth, members_async as members
 
 
 # --- Startup/Shutdown Logic ---
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Run migrations and seed on startup (production only)"""
+    """Bring schema and seed data up to date on startup (production only)"""
     if os.getenv("ENVIRONMENT") == "production":
         try:
-            print("🔧 Running database migrations...")
-            subprocess.run(["alembic", "upgrade", "head"], check=True, timeout=60)
-
-            print("🌱 Running seed script...")
-            # FIX: Nutze -m flag für korrekten Python-Pfad
-            subprocess.run(
-                ["python", "-m", "app.scripts.seed"],  # GEÄNDERT
-                check=True,
-                timeout=30,
-                cwd="/app",  # NEU: Arbeitsverzeichnis setzen
+            report = await run_in_threadpool(prepare_database, engine)
+            print(
+                f"✅ Startup checks finished in {report.stats()['duration_ms']} ms "
+                f"(migrated: {report.migrated}, seeded: {report.seeded})"
             )
-
-            print("✅ Startup tasks completed!")
-        except subprocess.TimeoutExpired:
-            print("⚠️ Startup tasks timed out, continuing anyway...")
         except Exception as e:
             print(f"⚠️ Startup tasks failed: {e}, continuing anyway...")
+        try:
+            # Sperrliste vor dem ersten Request füllen, danach im Hintergrund
+            await run_in_threadpool(sync_revocations, force=True)
+        except Exception as e:
+            print(f"⚠️ Revocation sync failed: {e}")
+
+    background_tasks = []
+    if settings.MEMBER_STATS_RECOMPUTE_SECONDS > 0:
+        background_tasks.append(
+            asyncio.create_task(
+                recompute_periodically(settings.MEMBER_STATS_RECOMPUTE_SECONDS)
+            )
+        )
+    if settings.REVOCATION_SYNC_SECONDS > 0:
+        background_tasks.append(
+            asyncio.create_task(sync_periodically(settings.REVOCATION_SYNC_SECONDS))
+        )
+    if settings.RESET_TOKEN_SWEEP_SECONDS > 0:
+        background_tasks.append(
+            asyncio.create_task(sweep_periodically(settings.RESET_TOKEN_SWEEP_SECONDS))
+        )
 
     yield
+    for task in background_tasks:
+        task.cancel()
+    password_hash_pool.shutdown()
+    await dispose_async_engine()
     print("👋 Shutting down...")
 
 
 app = FastAPI(title="CSC Backend", version="1.0.0", lifespan=lifespan)
 
+# Mitgliederlisten per pydantic-core direkt zu JSON-Bytes (app.core.json_response)
+app.state.fast_json_responses = settings.FAST_JSON_RESPONSES
+
 # --- CORS ---
 app.add_middleware(
     CORSMiddleware,
@@ -48,12 +80,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Schreibende Clients lesen kurzzeitig vom Primary statt vom Replikat
+app.add_middleware(ReadYourWritesMiddleware)
+
 # --- Router einbinden ---
 app.include_router(auth.router, prefix="/auth", tags=["Auth"])
 app.include_router(members.router, prefix="/members", tags=["Members"])
 app.include_router(
     password_reset.router, prefix="/auth", tags=["Authentication & Password Reset"]
 )
+app.include_router(admin.router, prefix="/admin", tags=["Admin"])
 
 
 # --- Healthcheck / Root ---
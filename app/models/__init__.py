@@ -1,11 +1,21 @@
+from .app_state import AppState
+from .email_outbox import EmailOutbox
 from .member import Member
+from .member_stats import MemberStats
 from .password_reset_token import PasswordResetToken
+from .revoked_token import RevokedToken
 from .role import Role
+from .table_version import TableVersion
 from .user import User
 
 __all__ = [
     "User",
     "Role",
     "Member",
+    "MemberStats",
     "PasswordResetToken",
+    "RevokedToken",
+    "EmailOutbox",
+    "AppState",
+    "TableVersion",
 ]
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, DateTime, String, func
+
+from app.db import Base
+
+
+class AppState(Base):
+    """
+    Schlüssel/Wert-Einträge über den Zustand der Installation.
+
+    Fields
+    - key: primary key, z. B. "seed_fingerprint"
+    - value: zuletzt gespeicherter Wert
+    - updated_at: Zeitpunkt der letzten Änderung
+    """
+
+    __tablename__ = "app_state"
+
+    key = Column(String(64), primary_key=True)
+    value = Column(String(255), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
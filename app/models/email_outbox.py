@@ -0,0 +1,41 @@
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, func
+
+from app.db import Base
+
+
+class EmailOutbox(Base):
+    """
+    Transaktionale Outbox für ausgehende E-Mails.
+
+    Wird in derselben Transaktion wie der auslösende Datensatz geschrieben
+    (z. B. PasswordResetToken) und von `app.scripts.email_worker` versendet.
+
+    Fields
+    - id: primary key, Versandreihenfolge
+    - recipient / subject / body: Nachricht; `body` wird nach dem Versand geleert
+    - status: pending | sent | failed
+    - attempts: bisherige Zustellversuche
+    - next_attempt_at: frühester nächster Versuch (Backoff bzw. Lease eines
+      Workers); bei sent/failed der Abschluss, nach dem der Sweeper löscht
+    - last_error: Fehler des letzten Versuchs
+    """
+
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # Worker holt fällige Nachrichten: status = 'pending' AND next_attempt_at <= now;
+        # der Sweeper löscht über denselben Index alte 'sent'/'failed'-Zeilen
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    recipient = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    body = Column(Text, nullable=False)
+    status = Column(String(16), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    sent_at = Column(DateTime(timezone=True), nullable=True)
@@ -1,10 +1,48 @@
-from sqlalchemy import Boolean, Column, Date, DateTime, Integer, Numeric, String, func
+import sqlite3
+
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    column,
+    event,
+    func,
+    table,
+    text,
+    true,
+)
 
 from app.db import Base
 
 
 class Member(Base):
     __tablename__ = "members"
+    __table_args__ = (
+        # Keyset-Pagination sortiert nach (name, id)
+        Index("ix_members_name_id", "name", "id"),
+        # Filter der Mitgliederliste (Migrationen 7e2a4b9c0d15, d7f2b4e8a916);
+        # `id` hinter der Filterspalte liefert bei Gleichheit (city, birth_date)
+        # die Sortierung der Keyset-Pagination direkt aus dem Index
+        Index("ix_members_city_id", "city", "id"),
+        Index(
+            "ix_members_postal_code_pattern",
+            "postal_code",
+            postgresql_ops={"postal_code": "text_pattern_ops"},
+        ),
+        Index("ix_members_join_date_id", "join_date", "id"),
+        Index("ix_members_birth_date_id", "birth_date", "id"),
+        Index("ix_members_total_amount_received_id", "total_amount_received", "id"),
+        # Partieller Index nur über aktive Mitglieder (Standardansicht)
+        Index("ix_members_active_id", "id", postgresql_where=text("active")).ddl_if(
+            dialect="postgresql"
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
@@ -16,7 +54,7 @@ class Member(Base):
     phone = Column(String(50), nullable=True)
 
     join_date = Column(Date, server_default=func.current_date(), nullable=False)
-    active = Column(Boolean, server_default="true", nullable=False)
+    active = Column(Boolean, server_default=true(), nullable=False)
     total_amount_received = Column(
         Numeric(10, 2), server_default="0.00", nullable=False
     )
@@ -26,3 +64,58 @@ class Member(Base):
 
     def __repr__(self) -> str:
         return f"<Member(id={self.id}, name={self.name}, email={self.email})>"
+
+
+# ----------------------------------------------------------------------
+# Beschleunigte Teilstring-Suche auf `name`; Migration 2b7e5d94c1a3 enthält eine
+# eingefrorene Kopie dieser DDL, Änderungen hier brauchen eine neue Migration
+# ----------------------------------------------------------------------
+
+# FTS5 mit Trigram-Tokenizer gibt es ab SQLite 3.34
+SQLITE_TRIGRAM_SUPPORTED = sqlite3.sqlite_version_info >= (3, 34, 0)
+
+# Externe-Content-Tabelle über members.name, per Trigger synchron gehalten
+members_name_fts = table(
+    "members_name_fts", column("rowid", Integer), column("members_name_fts")
+)
+
+SQLITE_NAME_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS members_name_fts USING fts5("
+    "name, content='members', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS members_name_fts_ai AFTER INSERT ON members BEGIN "
+    "INSERT INTO members_name_fts(rowid, name) VALUES (new.id, new.name); END",
+    "CREATE TRIGGER IF NOT EXISTS members_name_fts_ad AFTER DELETE ON members BEGIN "
+    "INSERT INTO members_name_fts(members_name_fts, rowid, name) "
+    "VALUES ('delete', old.id, old.name); END",
+    "CREATE TRIGGER IF NOT EXISTS members_name_fts_au AFTER UPDATE OF name ON members "
+    "BEGIN "
+    "INSERT INTO members_name_fts(members_name_fts, rowid, name) "
+    "VALUES ('delete', old.id, old.name); "
+    "INSERT INTO members_name_fts(rowid, name) VALUES (new.id, new.name); END",
+]
+
+POSTGRES_NAME_TRGM_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_members_name_trgm "
+    "ON members USING gin (name gin_trgm_ops)",
+]
+
+# Auch für Base.metadata.create_all (Tests, Benchmarks, frische Datenbanken)
+for statement in POSTGRES_NAME_TRGM_DDL:
+    event.listen(
+        Member.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="postgresql"),
+    )
+if SQLITE_TRIGRAM_SUPPORTED:
+    for statement in SQLITE_NAME_FTS_DDL:
+        event.listen(
+            Member.__table__,
+            "after_create",
+            DDL(statement).execute_if(dialect="sqlite"),
+        )
+    event.listen(
+        Member.__table__,
+        "before_drop",
+        DDL("DROP TABLE IF EXISTS members_name_fts").execute_if(dialect="sqlite"),
+    )
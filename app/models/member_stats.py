@@ -0,0 +1,26 @@
+from sqlalchemy import Boolean, Column, Integer, Numeric, String
+
+from app.db import Base
+
+
+class MemberStats(Base):
+    """
+    Vorberechnete Mitglieder-Aggregate je Gruppe (Stadt, aktiv, Geburtsjahr).
+
+    Wird von MemberService bei jedem Schreibzugriff in derselben Transaktion
+    fortgeschrieben und periodisch komplett neu berechnet; GET /members/stats
+    liest nur diese Tabelle (O(Gruppen) statt O(Mitglieder)).
+
+    Fields
+    - city / active / birth_year: Gruppenschlüssel (zusammengesetzter PK)
+    - member_count: Anzahl Mitglieder der Gruppe
+    - amount_total: Summe von total_amount_received der Gruppe
+    """
+
+    __tablename__ = "member_stats"
+
+    city = Column(String(255), primary_key=True)
+    active = Column(Boolean, primary_key=True)
+    birth_year = Column(Integer, primary_key=True)
+    member_count = Column(Integer, nullable=False, default=0)
+    amount_total = Column(Numeric(14, 2), nullable=False, default=0)
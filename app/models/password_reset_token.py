@@ -12,7 +12,7 @@ class PasswordResetToken(Base):
     - id: primary key
     - hashed_token: deterministic hash of the token sent to the user (e.g. SHA256 hex)
     - user_id: FK to users.id
-    - expires_at: timezone-aware expiration timestamp
+    - expires_at: timezone-aware expiration timestamp (indexed for the sweeper)
     - user: relationship back to User
     """
 
@@ -23,7 +23,7 @@ class PasswordResetToken(Base):
     user_id = Column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
-    expires_at = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
 
     # relationship to User; User must define `reset_tokens = relationship(..., back_populates="user")`
     user = relationship("User", back_populates="reset_tokens")
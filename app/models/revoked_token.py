@@ -0,0 +1,25 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, func
+
+from app.db import Base
+
+
+class RevokedToken(Base):
+    """
+    Persistierte Sperrliste für einzelne Access-Tokens (Logout).
+
+    Fields
+    - id: primary key, monoton steigend (inkrementeller Abgleich der Worker)
+    - jti: eindeutige Token-ID aus dem `jti`-Claim
+    - user_id: FK to users.id
+    - expires_at: Ablauf des gesperrten Tokens; danach kann der Eintrag weg
+    """
+
+    __tablename__ = "revoked_tokens"
+
+    id = Column(Integer, primary_key=True, index=True)
+    jti = Column(String(64), unique=True, index=True, nullable=False)
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    expires_at = Column(DateTime(timezone=True), index=True, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,21 @@
+from sqlalchemy import BigInteger, Column, String
+
+from app.db import Base
+
+
+class TableVersion(Base):
+    """
+    Änderungszähler je Tabelle, z. B. für das ETag der Mitgliederliste.
+
+    Jeder Schreibzugriff zählt `version` in seiner Transaktion hoch; Leser
+    vergleichen nur diese eine Zeile statt die Tabelle zu aggregieren.
+
+    Fields
+    - table_name: primary key, Name der beobachteten Tabelle
+    - version: steigt mit jeder Änderung
+    """
+
+    __tablename__ = "table_versions"
+
+    table_name = Column(String(64), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
@@ -18,6 +18,11 @@ class User(Base):
         Integer, ForeignKey("roles.id"), nullable=False, server_default="2", default=2
     )
     role = relationship("Role", back_populates="users")
+    # Wird bei Passwort-Reset/Rollenwechsel erhöht und entwertet ältere JWTs
+    token_version = Column(Integer, nullable=False, server_default="0", default=0)
+
+    def bump_token_version(self) -> None:
+        self.token_version = (self.token_version or 0) + 1
 
     def __repr__(self):
         return f"<User(id={self.id}, username={self.username}, email={self.email})>"
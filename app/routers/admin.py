@@ -0,0 +1,62 @@
+from fastapi import APIRouter, Depends
+
+from app.core.auth_utils import require_admin
+from app.core.config import settings
+from app.core.hashing_pool import password_hash_pool
+from app.core.member_cache import member_cache, member_count_cache
+from app.core.principal_cache import Principal, principal_cache
+from app.core.rate_limit import rate_limiter
+from app.core.revocation import revocation_filter
+from app.db import engine
+from app.db.async_database import peek_async_engine
+from app.db.bootstrap import startup_report
+from app.db.pool import engine_pool_stats
+from app.db.replica import replica_engine
+from app.services.reset_token_sweeper import reset_token_sweeper
+
+router = APIRouter()
+
+
+def db_pool_stats() -> dict:
+    """Checkout-Zähler und Füllstand der Connection-Pools dieses Workers."""
+    result = {"sync": engine_pool_stats(engine)}
+    if replica_engine is not None:
+        result["replica"] = engine_pool_stats(replica_engine)
+    async_engine = peek_async_engine()
+    if async_engine is not None:
+        result["async"] = engine_pool_stats(async_engine.sync_engine)
+    return result
+
+
+@router.get("/metrics")
+def read_metrics(admin_user: Principal = Depends(require_admin)):
+    """
+    Returns in-process runtime counters of this worker (Admin only).
+    """
+    return {
+        "principal_cache": principal_cache.stats(),
+        "member_cache": member_cache.stats(),
+        "member_count_cache": member_count_cache.stats(),
+        "password_hashing": password_hash_pool.stats(),
+        "token_revocation": revocation_filter.stats(),
+        "rate_limit": rate_limiter.stats(),
+        "reset_token_sweeper": reset_token_sweeper.stats(),
+        "db_pool": db_pool_stats(),
+        "startup": startup_report.stats(),
+    }
+
+
+@router.get("/db-pool")
+def read_db_pool(admin_user: Principal = Depends(require_admin)):
+    """
+    Returns connection pool usage of this worker (Admin only).
+
+    Compare `checked_out`/`overflow` with DB_POOL_SIZE + DB_POOL_MAX_OVERFLOW
+    and watch `checkout_timeouts` when sizing the pool against the worker count.
+    """
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_POOL_MAX_OVERFLOW,
+        "pool_timeout_seconds": settings.DB_POOL_TIMEOUT_SECONDS,
+        **db_pool_stats(),
+    }
@@ -1,6 +1,6 @@
 import os  # NEU: Für die Abfrage der Umgebungsvariable
+from datetime import datetime, timezone
 
-from fastapi import BackgroundTasks  # BackgroundTasks NEU
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import (
     HTTPAuthorizationCredentials,
@@ -8,14 +8,17 @@ from fastapi.security import (
     OAuth2PasswordRequestForm,
 )
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from app.core.principal_cache import Principal, principal_cache
+from app.core.rate_limit import rate_limit
+from app.core.read_your_writes import read_your_writes
 from app.core.security import (
     ALGORITHM,
     SECRET_KEY,
     create_access_token,
     get_password_hash,
-    verify_password,
+    verify_and_update_password,
 )
 from app.db import get_db
 
@@ -29,12 +32,20 @@ from app.services.password_reset_service import (  # NEU: Service
     PasswordResetService,
     get_password_reset_service,
 )
+from app.services.token_revocation_service import (
+    TokenRevocationService,
+    get_token_revocation_service,
+)
 
 router = APIRouter()
 bearer_scheme = HTTPBearer(auto_error=True)
 
 
-@router.post("/register", status_code=201)
+@router.post(
+    "/register",
+    status_code=201,
+    dependencies=[Depends(rate_limit("register", identity_field="username"))],
+)
 def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
     """
     Register a new user with username, email and password.
@@ -68,36 +79,45 @@ def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
     db.add(new_user)
     db.commit()
     db.refresh(new_user)
+    # Der erste Login/`/auth/me` soll den neuen Benutzer nicht auf dem Replikat suchen
+    read_your_writes.mark_subject(new_user.username)
 
     print(f"✅ Registered new user: {new_user.username} ({new_user.email})")
 
     return {"message": f"User '{new_user.username}' successfully registered."}
 
 
-@router.post("/login")
+@router.post(
+    "/login", dependencies=[Depends(rate_limit("login", identity_field="username"))]
+)
 def login(
     form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
 ):
     """
     Authenticate user and return JWT token if credentials are valid.
     """
-    # ... (Ihre bestehende Logik) ...
     user = db.query(User).filter(User.username == form_data.username).first()
 
     if not user:
         raise HTTPException(status_code=401, detail="Invalid username or password")
 
-    # Debug output for login troubleshooting
-    print(f"👤 Login attempt for: {form_data.username}")
-    print(f"🔍 Stored hash: {user.hashed_password[:20]}...")
-    print(
-        f"🔑 Password valid: {verify_password(form_data.password, user.hashed_password)}"
+    # Genau eine PBKDF2-Verifikation pro Versuch; veraltete Hashes werden dabei
+    # transparent auf die konfigurierten Zielkosten angehoben.
+    valid, new_hash = verify_and_update_password(
+        form_data.password, user.hashed_password
     )
-
-    if not verify_password(form_data.password, user.hashed_password):
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid username or password")
 
-    access_token = create_access_token(user.username)
+    if new_hash:
+        user.hashed_password = new_hash
+        db.commit()
+
+    access_token = create_access_token(
+        user.username,
+        role=user.role.name if user.role else None,
+        token_version=user.token_version or 0,
+    )
     return {"access_token": access_token, "token_type": "bearer"}
 
 
@@ -106,10 +126,13 @@ def login(
 # ----------------------------------------------------------------------
 
 
-@router.post("/password-reset-request", status_code=status.HTTP_200_OK)
+@router.post(
+    "/password-reset-request",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(rate_limit("password-reset", identity_field="email"))],
+)
 def password_reset_request(
     request: PasswordResetRequest,
-    background_tasks: BackgroundTasks,
     service: PasswordResetService = Depends(get_password_reset_service),
 ):
     """
@@ -118,7 +141,7 @@ def password_reset_request(
     """
 
     # Der Service gibt entweder den Klartext-Token (im Testmodus) oder die Erfolgsmeldung zurück
-    result = service.initiate_reset(request.email, background_tasks)
+    result = service.initiate_reset(request.email)
 
     # 🚨 FIX für KeyError: 'test_token'
     # Wenn wir den Klartext-Token zurückbekommen, verpacken wir ihn für den Test-Client
@@ -133,7 +156,11 @@ def password_reset_request(
     return {"message": result}
 
 
-@router.post("/reset-password", status_code=status.HTTP_200_OK)
+@router.post(
+    "/reset-password",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(rate_limit("reset-password"))],
+)
 def finalize_password_reset(
     reset_data: PasswordReset,
     service: PasswordResetService = Depends(get_password_reset_service),
@@ -155,33 +182,94 @@ def finalize_password_reset(
 # ----------------------------------------------------------------------
 
 
-def get_current_user(
+async def get_token_payload(
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-    db: Session = Depends(get_db),
-):
+) -> dict:
     """
-    Retrieve and verify current user from JWT token.
+    Decode and verify the JWT signature/expiry (pure CPU, no database access).
+
+    Declared `async` so FastAPI runs it on the event loop instead of
+    dispatching it to the threadpool.
     """
-    # ... (Ihre bestehende Logik) ...
     token = credentials.credentials
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise HTTPException(status_code=401, detail="Token missing username")
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
+    if payload.get("sub") is None:
+        raise HTTPException(status_code=401, detail="Token missing username")
+    return payload
 
-    user = db.query(User).filter(User.username == username).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
 
-    return user
+def get_current_user(
+    payload: dict = Depends(get_token_payload),
+    db: Session = Depends(get_db),
+) -> Principal:
+    """
+    Retrieve and verify current user from JWT token.
+
+    The principal (id, username, email, role, token version) is served from the
+    in-process principal cache; the database is only queried on a cache miss.
+    Tokens issued before the user's last password reset, role change or
+    revoke-all carry an outdated `ver` claim and are rejected; single tokens
+    revoked via logout are caught by the in-memory revocation filter.
+    Cache misses are always read from the primary: a lagging replica could
+    otherwise put an outdated token version back into the cache.
+    """
+    username: str = payload["sub"]
+
+    principal = principal_cache.get(username)
+    if principal is None:
+        # Rolle direkt mitladen, damit require_admin keinen zweiten Query auslöst
+        user = (
+            db.query(User)
+            .options(joinedload(User.role))
+            .filter(User.username == username)
+            .first()
+        )
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        principal = Principal.from_user(user)
+        principal_cache.set(username, principal)
+
+    if payload.get("ver", 0) != principal.token_version:
+        raise HTTPException(status_code=401, detail="Token has been revoked")
+
+    jti = payload.get("jti")
+    if jti and TokenRevocationService.is_revoked(jti):
+        raise HTTPException(status_code=401, detail="Token has been revoked")
+
+    return principal
 
 
 @router.get("/me")
-def read_current_user(user: User = Depends(get_current_user)):
+def read_current_user(user: Principal = Depends(get_current_user)):
     """
     Return the currently authenticated user.
     """
     return {"id": user.id, "username": user.username, "email": user.email}
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(
+    payload: dict = Depends(get_token_payload),
+    user: Principal = Depends(get_current_user),
+    service: TokenRevocationService = Depends(get_token_revocation_service),
+):
+    """
+    Revoke the access token used for this request.
+    """
+    if payload.get("jti"):
+        expires_at = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+        service.revoke_token(payload["jti"], user.id, expires_at)
+
+
+@router.post("/logout-all", status_code=status.HTTP_204_NO_CONTENT)
+def logout_all_sessions(
+    user: Principal = Depends(get_current_user),
+    service: TokenRevocationService = Depends(get_token_revocation_service),
+):
+    """
+    Revoke every access token issued to the current user so far.
+    """
+    service.revoke_all_for_user(user.id)
@@ -0,0 +1,197 @@
+import os
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from starlette.concurrency import run_in_threadpool
+
+from app.core.principal_cache import Principal, principal_cache
+from app.core.rate_limit import rate_limit
+from app.core.security import create_access_token, verify_and_update_password
+from app.db import get_async_db
+from app.models.user import User
+from app.routers.auth import get_token_payload
+from app.schemas.common import PasswordReset, PasswordResetRequest
+from app.schemas.user import UserCreate
+from app.services.password_reset_service import (
+    AsyncPasswordResetService,
+    get_async_password_reset_service,
+)
+from app.services.token_revocation_service import TokenRevocationService
+from app.services.user_service import async_user_service
+
+# Async-Gegenstück zu app.routers.auth (DATABASE_MODE=async)
+router = APIRouter()
+
+
+@router.post(
+    "/register",
+    status_code=201,
+    dependencies=[Depends(rate_limit("register", identity_field="username"))],
+)
+async def register_user(
+    user_data: UserCreate, db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Register a new user with username, email and password.
+    """
+    new_user = await async_user_service.create_user(db, user_data)
+    return {"message": f"User '{new_user.username}' successfully registered."}
+
+
+@router.post(
+    "/login", dependencies=[Depends(rate_limit("login", identity_field="username"))]
+)
+async def login(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Authenticate user and return JWT token if credentials are valid.
+    """
+    user = (
+        await db.execute(
+            select(User)
+            .options(joinedload(User.role))
+            .where(User.username == form_data.username)
+        )
+    ).scalar_one_or_none()
+
+    if not user:
+        raise HTTPException(status_code=401, detail="Invalid username or password")
+
+    # Der Hash-Pool wartet blockierend auf sein Future -> nicht im Event-Loop
+    valid, new_hash = await run_in_threadpool(
+        verify_and_update_password, form_data.password, user.hashed_password
+    )
+    if not valid:
+        raise HTTPException(status_code=401, detail="Invalid username or password")
+
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
+
+    access_token = create_access_token(
+        user.username,
+        role=user.role.name if user.role else None,
+        token_version=user.token_version or 0,
+    )
+    return {"access_token": access_token, "token_type": "bearer"}
+
+
+@router.post(
+    "/password-reset-request",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(rate_limit("password-reset", identity_field="email"))],
+)
+async def password_reset_request(
+    request: PasswordResetRequest,
+    service: AsyncPasswordResetService = Depends(get_async_password_reset_service),
+):
+    """
+    Startet den Passwort-Reset-Prozess.
+    Gibt den Klartext-Token als 'test_token' zurück, wenn TESTING=1 gesetzt ist.
+    """
+    result = await service.initiate_reset(request.email)
+
+    if (
+        os.getenv("TESTING") == "1"
+        and result != "If the email exists, a reset link has been sent."
+    ):
+        return {"test_token": result}
+
+    return {"message": result}
+
+
+@router.post(
+    "/reset-password",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(rate_limit("reset-password"))],
+)
+async def finalize_password_reset(
+    reset_data: PasswordReset,
+    service: AsyncPasswordResetService = Depends(get_async_password_reset_service),
+):
+    """
+    Validiert den Token und setzt das neue Passwort für den Benutzer.
+    """
+    user = await service.finalize_reset(reset_data)
+    return {"message": f"Password for user {user.username} successfully updated."}
+
+
+async def get_current_user_async(
+    payload: dict = Depends(get_token_payload),
+    db: AsyncSession = Depends(get_async_db),
+) -> Principal:
+    """
+    Async variant of `app.routers.auth.get_current_user`.
+
+    Same principal cache and token-version check; the periodic revocation sync
+    reuses the sync service on the session's underlying connection.
+    """
+    username: str = payload["sub"]
+
+    principal = principal_cache.get(username)
+    if principal is None:
+        user = (
+            await db.execute(
+                select(User)
+                .options(joinedload(User.role))
+                .where(User.username == username)
+            )
+        ).scalar_one_or_none()
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        principal = Principal.from_user(user)
+        principal_cache.set(username, principal)
+
+    if payload.get("ver", 0) != principal.token_version:
+        raise HTTPException(status_code=401, detail="Token has been revoked")
+
+    jti = payload.get("jti")
+    if jti and TokenRevocationService.is_revoked(jti):
+        raise HTTPException(status_code=401, detail="Token has been revoked")
+
+    return principal
+
+
+@router.get("/me")
+async def read_current_user(user: Principal = Depends(get_current_user_async)):
+    """
+    Return the currently authenticated user.
+    """
+    return {"id": user.id, "username": user.username, "email": user.email}
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    payload: dict = Depends(get_token_payload),
+    user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Revoke the access token used for this request.
+    """
+    if payload.get("jti"):
+        expires_at = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+        await db.run_sync(
+            lambda session: TokenRevocationService(session).revoke_token(
+                payload["jti"], user.id, expires_at
+            )
+        )
+
+
+@router.post("/logout-all", status_code=status.HTTP_204_NO_CONTENT)
+async def logout_all_sessions(
+    user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Revoke every access token issued to the current user so far.
+    """
+    await db.run_sync(
+        lambda session: TokenRevocationService(session).revoke_all_for_user(user.id)
+    )
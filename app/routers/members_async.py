@@ -0,0 +1,275 @@
+from typing import List, Literal, Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.auth_utils import require_admin_async
+from app.core.conditional import (
+    etag_matches,
+    http_date,
+    not_modified,
+    not_modified_since,
+    weak_etag,
+)
+from app.core.json_response import fast_json_enabled, json_bytes_response
+from app.core.pagination import set_cursor_headers
+from app.core.principal_cache import Principal
+from app.db import get_async_db
+from app.routers.auth_async import get_current_user_async
+from app.schemas.member import (
+    MemberBulkResult,
+    MemberBulkUpdate,
+    MemberCreate,
+    MemberFilter,
+    MemberImportReport,
+    MemberRead,
+    MemberSelection,
+    MemberStatsRead,
+    MemberUpdate,
+    dump_member_list,
+)
+from app.services.member_export import EXPORT_MEDIA_TYPES, aiter_export
+from app.services.member_import import MemberImporter, import_format_for, parse_rows
+from app.services.member_service import (
+    AsyncMemberService,
+    get_async_member_service,
+    parse_member_fields,
+)
+from app.services.member_stats import read_member_stats
+
+# Async-Gegenstück zu app.routers.members (DATABASE_MODE=async)
+router = APIRouter(prefix="/members", tags=["Members"])
+
+
+@router.get("/", response_model=List[MemberRead])
+async def read_members(
+    request: Request,
+    response: Response,
+    criteria: MemberFilter = Depends(),
+    limit: int = Query(
+        100, ge=1, le=1000, description="Maximum number of results to return."
+    ),
+    order_by: Literal["id", "name"] = Query(
+        "id", description="Sort key; `name` sorts by (name, id)."
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Opaque cursor from X-Next-Cursor / X-Prev-Cursor."
+    ),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated subset of member fields, e.g. `id,name`."
+    ),
+    include_total: bool = Query(
+        False, description="Add X-Total-Count (exact or planner estimate)."
+    ),
+    member_service: AsyncMemberService = Depends(get_async_member_service),
+    user=Depends(get_current_user_async),
+):
+    """
+    Retrieves all members or filters them based on optional query parameters
+    (name substring, city, postal code prefix, active flag, join/birth date
+    ranges and total_amount_received thresholds).
+
+    Results are paged by keyset: the cursors for the following and previous
+    page are returned in the X-Next-Cursor / X-Prev-Cursor and Link headers.
+    A weak ETag built from the members change counter answers If-None-Match
+    with 304 before any rows are loaded. With fast JSON responses enabled
+    (app.main), the page is encoded straight to bytes by pydantic-core.
+    `fields` loads and returns only the listed columns. `include_total` adds
+    X-Total-Count, with X-Total-Count-Type telling whether it is `exact` or
+    `estimated`.
+    """
+    selected = parse_member_fields(fields)
+    version = await member_service.get_members_version()
+    etag = weak_etag(version, request.url.query)
+    if etag_matches(request, etag):
+        return not_modified({"ETag": etag})
+    response.headers["ETag"] = etag
+
+    page = await member_service.get_members_page(
+        criteria=criteria,
+        limit=limit,
+        order_by=order_by,
+        cursor=cursor,
+        fields=selected,
+    )
+    set_cursor_headers(request, response, page.next_cursor, page.prev_cursor)
+    if include_total:
+        total, exact = await member_service.count_members(criteria)
+        response.headers["X-Total-Count"] = str(total)
+        response.headers["X-Total-Count-Type"] = "exact" if exact else "estimated"
+    if selected or fast_json_enabled(request):
+        return json_bytes_response(response, dump_member_list(page.items, selected))
+    return page.items
+
+
+@router.get("/export")
+async def export_members(
+    export_format: Literal["ndjson", "csv"] = Query(
+        "ndjson", alias="format", description="Export format."
+    ),
+    criteria: MemberFilter = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+    admin_user: Principal = Depends(require_admin_async),
+):
+    """
+    Streams all matching members as NDJSON or CSV (Admin only).
+    """
+    bind = db.bind
+
+    async def body():
+        async with AsyncSession(bind=bind) as session:
+            async for chunk in aiter_export(session, export_format, criteria):
+                yield chunk
+
+    return StreamingResponse(
+        body(),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f"attachment; filename=members.{export_format}"
+        },
+    )
+
+
+@router.get("/stats", response_model=MemberStatsRead)
+async def read_stats(
+    db: AsyncSession = Depends(get_async_db),
+    admin_user: Principal = Depends(require_admin_async),
+):
+    """
+    Returns member counts by city, active/inactive totals, the sum of
+    total_amount_received and the age distribution (Admin only).
+    """
+    return await db.run_sync(read_member_stats)
+
+
+@router.get("/{member_id}", response_model=MemberRead)
+async def read_member(
+    request: Request,
+    member_id: int,
+    member_service: AsyncMemberService = Depends(get_async_member_service),
+    user=Depends(get_current_user_async),
+):
+    """
+    Retrieves a single member by ID.
+
+    Sends Last-Modified (updated_at, else created_at) and answers a matching
+    If-Modified-Since with 304. The serialized member is served from a per-id
+    in-process cache that is evicted on every write.
+    """
+    cached = await member_service.get_member_payload(member_id)
+    if cached is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Member not found"
+        )
+
+    headers = {}
+    if cached.last_modified is not None:
+        headers["Last-Modified"] = http_date(cached.last_modified)
+        if not_modified_since(request, cached.last_modified):
+            return not_modified(headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+@router.post("/", response_model=MemberRead, status_code=status.HTTP_201_CREATED)
+async def create_member(
+    member: MemberCreate,
+    member_service: AsyncMemberService = Depends(get_async_member_service),
+    admin_user: Principal = Depends(require_admin_async),
+):
+    """
+    Creates a new member (Admin only).
+    """
+    return await member_service.create_member(member)
+
+
+@router.post("/import", response_model=MemberImportReport)
+async def import_members(
+    file: UploadFile = File(..., description="CSV (with header) or NDJSON file."),
+    import_format: Optional[Literal["ndjson", "csv"]] = Query(
+        None, alias="format", description="Defaults to the file extension."
+    ),
+    db: AsyncSession = Depends(get_async_db),
+    admin_user: Principal = Depends(require_admin_async),
+):
+    """
+    Creates members in bulk from a CSV or NDJSON upload (Admin only).
+
+    Rows are validated against MemberCreate and inserted in batches; the
+    report lists every row as created, duplicate_email or invalid.
+    """
+    rows = parse_rows(file.file, import_format or import_format_for(file.filename))
+    return await db.run_sync(lambda session: MemberImporter(session).run(rows))
+
+
+@router.post("/bulk-update", response_model=MemberBulkResult)
+async def bulk_update_members(
+    bulk: MemberBulkUpdate,
+    member_service: AsyncMemberService = Depends(get_async_member_service),
+    admin_user: Principal = Depends(require_admin_async),
+):
+    """
+    Applies one patch to all members selected by `ids` and/or `filter` (Admin only).
+    """
+    ids = await member_service.bulk_update(bulk)
+    return MemberBulkResult(count=len(ids), ids=ids)
+
+
+@router.post("/bulk-delete", response_model=MemberBulkResult)
+async def bulk_delete_members(
+    selection: MemberSelection,
+    member_service: AsyncMemberService = Depends(get_async_member_service),
+    admin_user: Principal = Depends(require_admin_async),
+):
+    """
+    Deletes all members selected by `ids` and/or `filter` (Admin only).
+    """
+    ids = await member_service.bulk_delete(selection)
+    return MemberBulkResult(count=len(ids), ids=ids)
+
+
+@router.put("/{member_id}", response_model=MemberRead)
+async def update_member(
+    member_id: int,
+    member_update: MemberUpdate,
+    member_service: AsyncMemberService = Depends(get_async_member_service),
+    admin_user: Principal = Depends(require_admin_async),
+):
+    """
+    Updates an existing member by ID (Admin only).
+    """
+    db_member = await member_service.get_member_by_id(member_id)
+    if not db_member:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Member not found"
+        )
+
+    return await member_service.update_member(db_member, member_update)
+
+
+@router.delete("/{member_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_member(
+    member_id: int,
+    member_service: AsyncMemberService = Depends(get_async_member_service),
+    admin_user: Principal = Depends(require_admin_async),
+):
+    """
+    Deletes a member by ID (Admin only).
+    """
+    db_member = await member_service.get_member_by_id(member_id)
+    if not db_member:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Member not found"
+        )
+
+    await member_service.delete_member(db_member)
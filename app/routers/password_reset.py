@@ -1,8 +1,9 @@
 import logging
 import os
 
-from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi import APIRouter, Depends
 
+from app.core.rate_limit import rate_limit
 from app.schemas.common import PasswordReset, PasswordResetRequest
 
 # NEU: Service importieren
@@ -18,21 +19,22 @@ router = APIRouter(
 logger = logging.getLogger(__name__)
 
 
-@router.post("/forgot-password", status_code=200)
+@router.post(
+    "/forgot-password",
+    status_code=200,
+    dependencies=[Depends(rate_limit("password-reset", identity_field="email"))],
+)
 def forgot_password(
     email_request: PasswordResetRequest,
-    background_tasks: BackgroundTasks = None,
     # NEU: Service-Dependency injizieren
     service: PasswordResetService = Depends(get_password_reset_service),
 ):
     """
-    Initiates the password reset process by generating a token and simulating sending an email.
+    Initiates the password reset process by generating a token and queueing the reset email.
     """
 
     # Logik an den Service delegieren
-    result_message = service.initiate_reset(
-        email=email_request.email, background_tasks=background_tasks
-    )
+    result_message = service.initiate_reset(email=email_request.email)
 
     if os.getenv("TESTING") == "1":
         return {"message": "Reset link sent (test mode).", "test_token": result_message}
@@ -40,7 +42,11 @@ def forgot_password(
     return {"message": result_message}
 
 
-@router.post("/reset-password", status_code=200)
+@router.post(
+    "/reset-password",
+    status_code=200,
+    dependencies=[Depends(rate_limit("reset-password"))],
+)
 def reset_password(
     reset_data: PasswordReset,
     # NEU: Service-Dependency injizieren
@@ -1,7 +1,16 @@
 from datetime import date
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
 
-from pydantic import BaseModel, ConfigDict, EmailStr
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    TypeAdapter,
+    create_model,
+    model_validator,
+)
 
 
 class MemberBase(BaseModel):
@@ -40,3 +49,146 @@ class MemberRead(MemberBase):
     total_amount_received: float
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class _StoredMemberRead(MemberRead):
+    # Gespeicherte Adressen wurden beim Schreiben geprüft; die erneute
+    # EmailStr-Validierung (email-validator, reines Python) entfällt
+    email: str
+
+
+MemberReadList = TypeAdapter(List[_StoredMemberRead])
+
+# Erlaubte Werte für `?fields=` (Reihenfolge wie in MemberRead)
+MEMBER_READ_FIELDS: Tuple[str, ...] = tuple(MemberRead.model_fields)
+
+
+@lru_cache(maxsize=128)
+def member_fields_adapter(fields: Tuple[str, ...]) -> TypeAdapter:
+    """
+    TypeAdapter für eine Liste von Teil-Mitgliedern mit genau `fields`.
+
+    Das Modell wird aus den Feldern von MemberRead erzeugt und pro
+    Feldkombination gecacht.
+    """
+    model = create_model(
+        "MemberReadPartial",
+        __config__=ConfigDict(from_attributes=True),
+        **{
+            name: (_StoredMemberRead.model_fields[name].annotation, ...)
+            for name in fields
+        },
+    )
+    return TypeAdapter(List[model])
+
+
+def dump_member_list(
+    members: Iterable[Any], fields: Optional[Tuple[str, ...]] = None
+) -> bytes:
+    """
+    Kodiert ORM-Objekte (oder Zeilen) in einem Durchlauf durch pydantic-core zu JSON-Bytes.
+
+    Ersetzt den Standardweg von FastAPI (response_model-Validierung samt
+    EmailStr, Serialisierung, json.dumps); die Ausgabe ist byte-identisch.
+    Mit `fields` werden nur diese Felder ausgegeben.
+    """
+    adapter = member_fields_adapter(fields) if fields else MemberReadList
+    validated = adapter.validate_python(list(members), from_attributes=True)
+    return adapter.dump_json(validated)
+
+
+class MemberImportRow(BaseModel):
+    row: int  # 1-basiert, ohne CSV-Kopfzeile
+    status: Literal["created", "duplicate_email", "invalid"]
+    id: Optional[int] = None
+    email: Optional[str] = None
+    errors: List[str] = []
+
+
+class MemberImportReport(BaseModel):
+    created: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    rows: List[MemberImportRow] = []
+
+
+class MemberFilter(BaseModel):
+    """
+    Filter für Liste, Export und Bulk-Auswahl (alle Kriterien UND-verknüpft).
+
+    Die Routen lesen ihn per `Depends()` direkt aus den Query-Parametern.
+    """
+
+    name: Optional[str] = Field(None, description="Search by member name (substring).")
+    birth_date: Optional[date] = Field(
+        None, description="Search by exact birth date (YYYY-MM-DD)."
+    )
+    active: Optional[bool] = None
+    city: Optional[str] = Field(None, description="Exact city.")
+    postal_code_prefix: Optional[str] = Field(
+        None, description="Postal codes starting with this prefix."
+    )
+    joined_before: Optional[date] = None
+    joined_after: Optional[date] = None
+    born_before: Optional[date] = None
+    born_after: Optional[date] = None
+    min_amount_received: Optional[float] = Field(
+        None, description="total_amount_received >= this value."
+    )
+    max_amount_received: Optional[float] = Field(
+        None, description="total_amount_received <= this value."
+    )
+
+
+class MemberSelection(BaseModel):
+    ids: Optional[List[int]] = Field(None, max_length=10_000)
+    filter: Optional[MemberFilter] = None
+
+    @model_validator(mode="after")
+    def require_selection(self) -> "MemberSelection":
+        # Schutz vor versehentlichen Operationen auf der ganzen Tabelle
+        criteria = self.filter.model_dump(exclude_none=True) if self.filter else {}
+        if not self.ids and not criteria:
+            raise ValueError("Either `ids` or at least one `filter` field is required")
+        return self
+
+
+# Spalten von `members` ohne NOT NULL (siehe app.models.member)
+NULLABLE_MEMBER_FIELDS = frozenset({"phone"})
+
+
+class MemberBulkUpdate(MemberSelection):
+    patch: MemberUpdate
+
+    @model_validator(mode="after")
+    def check_patch(self) -> "MemberBulkUpdate":
+        fields = self.patch.model_dump(exclude_unset=True)
+        if not fields:
+            raise ValueError("`patch` must set at least one field")
+        if "email" in fields:
+            # E-Mail ist eindeutig und kann nicht für mehrere Mitglieder gleich sein
+            raise ValueError("`email` cannot be bulk-updated")
+        # Explizites null nur für Spalten, die in `members` NULL erlauben
+        nulled = sorted(
+            field
+            for field, value in fields.items()
+            if value is None and field not in NULLABLE_MEMBER_FIELDS
+        )
+        if nulled:
+            raise ValueError(f"`patch` cannot set {', '.join(nulled)} to null")
+        return self
+
+
+class MemberBulkResult(BaseModel):
+    count: int
+    ids: List[int]
+
+
+class MemberStatsRead(BaseModel):
+    total: int = 0
+    active: int = 0
+    inactive: int = 0
+    amount_total: float = 0.0  # Summe von total_amount_received
+    by_city: Dict[str, int] = {}
+    # Alter im laufenden Jahr, in Zehnerschritten ("30-39": 12)
+    age_distribution: Dict[str, int] = {}
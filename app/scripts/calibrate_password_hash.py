@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Calibrates the PBKDF2 cost for this machine.
+
+Measures how long pbkdf2_sha256 takes here and prints the number of rounds that
+fits the latency budget from `PASSWORD_HASH_BUDGET_MS` (or --budget-ms).
+Set the result as `PASSWORD_HASH_ROUNDS`; existing hashes below that cost are
+rehashed transparently on the user's next successful login.
+
+Usage:
+  # on the deployment hardware:
+  python -m app.scripts.calibrate_password_hash [--budget-ms 250]
+"""
+
+import argparse
+import statistics
+import time
+
+from passlib.hash import pbkdf2_sha256
+
+from app.core.config import settings
+
+PROBE_ROUNDS = 20_000
+SAMPLES = 5
+# passlib-Default; darunter wird gewarnt
+MIN_RECOMMENDED_ROUNDS = 29_000
+
+
+def measure_ms(rounds: int, samples: int = SAMPLES) -> float:
+    """Median duration of one hash at the given cost in milliseconds."""
+    handler = pbkdf2_sha256.using(rounds=rounds)
+    durations = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        handler.hash("calibration-password")
+        durations.append((time.perf_counter() - started) * 1000)
+    return statistics.median(durations)
+
+
+def calibrate(budget_ms: float) -> int:
+    """Rounds (multiple of 1000) whose hash time stays within `budget_ms`."""
+    ms_per_round = measure_ms(PROBE_ROUNDS) / PROBE_ROUNDS
+    return max(1000, int(budget_ms / ms_per_round) // 1000 * 1000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate PBKDF2 rounds.")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=settings.PASSWORD_HASH_BUDGET_MS,
+        help="target duration of one hash/verify in milliseconds",
+    )
+    args = parser.parse_args()
+
+    rounds = calibrate(args.budget_ms)
+    actual_ms = measure_ms(rounds)
+
+    print(f"Budget:   {args.budget_ms:.0f} ms per hash")
+    print(f"Measured: {actual_ms:.1f} ms at {rounds} rounds")
+    if settings.PASSWORD_HASH_ROUNDS:
+        current_ms = measure_ms(settings.PASSWORD_HASH_ROUNDS)
+        print(
+            f"Current:  {current_ms:.1f} ms at {settings.PASSWORD_HASH_ROUNDS} rounds"
+        )
+    if rounds < MIN_RECOMMENDED_ROUNDS:
+        print(
+            f"⚠️ Below {MIN_RECOMMENDED_ROUNDS} rounds – consider a larger budget "
+            "or faster hardware."
+        )
+    print(f"\nPASSWORD_HASH_ROUNDS={rounds}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Sends the queued emails from the `email_outbox` table.
+
+Runs as its own process next to the web workers, so slow or unreachable SMTP
+servers never block a request. Messages are sent in batches over one reused
+SMTP connection (MAIL_* settings); failures are retried with exponential
+backoff up to OUTBOX_MAX_ATTEMPTS. Several workers may run in parallel on
+Postgres.
+
+Usage:
+  python -m app.scripts.email_worker          # poll forever
+  python -m app.scripts.email_worker --once   # drain what is due, then exit
+"""
+
+import argparse
+
+from app.db import SessionLocal
+from app.services.email_outbox import OutboxSender
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--once", action="store_true", help="Drain all due messages and exit."
+    )
+    args = parser.parse_args()
+
+    sender = OutboxSender(SessionLocal)
+    if not args.once:
+        print("📬 Email outbox worker started")
+        sender.run_forever()
+        return
+
+    total = 0
+    try:
+        while True:
+            drained = sender.drain_once()
+            total += drained
+            if drained < sender.batch_size:
+                break
+    finally:
+        sender.connection.close()
+    print(f"📬 Processed {total} outbox message(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Generates a large synthetic dataset for load tests and benchmarks.
+
+Members get realistic German names, cities with matching postal code ranges,
+birth/join dates, payment amounts and phone numbers; users get the Admin or
+User role. The same arguments always produce the same rows (--seed), so
+benchmark databases can be rebuilt exactly.
+
+Rows are bulk-loaded in batches: COPY on Postgres (psycopg2), executemany
+elsewhere (SQLite). Into an empty members table the secondary indexes and the
+name search index are dropped first and rebuilt once at the end, as is
+`member_stats`. Users share one password hash, so PBKDF2 runs once instead of
+once per user.
+
+Usage:
+  python -m app.scripts.generate_data --members 1000000 --users 1000
+  # fresh SQLite file for a benchmark:
+  python -m app.scripts.generate_data --database-url sqlite:////tmp/load.db \\
+      --create-schema --members 1000000
+  # append more rows later without email collisions:
+  python -m app.scripts.generate_data --members 100000 --offset 1000000
+"""
+
+import argparse
+import csv
+import io
+import random
+import time
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from sqlalchemy import Table, create_engine, insert, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.security import get_password_hash
+from app.db import Base
+from app.models.member import (
+    POSTGRES_NAME_TRGM_DDL,
+    SQLITE_NAME_FTS_DDL,
+    SQLITE_TRIGRAM_SUPPORTED,
+    Member,
+)
+from app.models.role import Role
+from app.models.user import User
+from app.services.member_stats import recompute_member_stats
+
+# Stichtag statt date.today(), damit die Daten reproduzierbar bleiben
+REFERENCE_DATE = date(2026, 1, 1)
+DEFAULT_PASSWORD = "loadtest-password"
+
+# fmt: off
+FIRST_NAMES = (
+    "Anna", "Ben", "Clara", "David", "Elena", "Felix", "Greta", "Hannah",
+    "Jonas", "Julia", "Karl", "Lea", "Leon", "Lina", "Lukas", "Marie",
+    "Maximilian", "Mia", "Noah", "Paul", "Sophie", "Tim", "Emma", "Finn",
+    "Ida", "Jan", "Laura", "Moritz", "Nina", "Ole", "Paula", "Sarah",
+    "Tobias", "Ute", "Yusuf", "Zoe", "Mehmet", "Katarzyna", "Jürgen", "Özlem",
+)
+LAST_NAMES = (
+    "Müller", "Schmidt", "Schneider", "Fischer", "Weber", "Meyer", "Wagner",
+    "Becker", "Schulz", "Hoffmann", "Schäfer", "Koch", "Bauer", "Richter",
+    "Klein", "Wolf", "Schröder", "Neumann", "Schwarz", "Zimmermann", "Braun",
+    "Krüger", "Hofmann", "Hartmann", "Lange", "Schmitt", "Werner", "Krause",
+    "Meier", "Lehmann", "Yilmaz", "Kowalski", "Nowak", "Peters", "Vogel",
+)
+STREETS = (
+    "Hauptstraße", "Schulstraße", "Gartenstraße", "Bahnhofstraße", "Dorfstraße",
+    "Bergstraße", "Birkenweg", "Lindenstraße", "Kirchstraße", "Waldstraße",
+    "Ringstraße", "Schillerstraße", "Goethestraße", "Am Sportplatz", "Mühlenweg",
+)
+# fmt: on
+# Stadt, kleinste und größte Postleitzahl, Gewicht (grob nach Einwohnern)
+CITIES = (
+    ("Berlin", 10115, 14199, 37),
+    ("Hamburg", 20095, 22769, 19),
+    ("München", 80331, 81929, 15),
+    ("Köln", 50667, 51149, 11),
+    ("Frankfurt am Main", 60306, 60599, 8),
+    ("Stuttgart", 70173, 70629, 6),
+    ("Düsseldorf", 40210, 40629, 6),
+    ("Leipzig", 4103, 4357, 6),
+    ("Dortmund", 44135, 44388, 6),
+    ("Dresden", 1067, 1328, 6),
+    ("Hannover", 30159, 30669, 5),
+    ("Nürnberg", 90402, 90491, 5),
+    ("Bremen", 28195, 28779, 6),
+)
+
+MEMBER_COLUMNS = (
+    "name",
+    "email",
+    "birth_date",
+    "address",
+    "city",
+    "postal_code",
+    "phone",
+    "join_date",
+    "active",
+    "total_amount_received",
+)
+USER_COLUMNS = ("username", "email", "hashed_password", "role_id", "token_version")
+
+_UMLAUTS = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+
+
+def ascii_slug(value: str) -> str:
+    return value.lower().translate(_UMLAUTS).replace(" ", "")
+
+
+def _rng(seed: int, offset: int) -> random.Random:
+    return random.Random(f"{seed}:{offset}")
+
+
+def member_rows(
+    count: int, seed: int = 0, offset: int = 0, today: date = REFERENCE_DATE
+) -> Iterator[Dict[str, Any]]:
+    """
+    Erzeugt `count` Mitglieder mit den Indizes offset .. offset+count-1.
+
+    Die E-Mail enthält den Index und ist damit über Läufe mit verschiedenen
+    Offsets eindeutig.
+    """
+    rng = _rng(seed, offset)
+    cum_weights = []
+    total = 0
+    for city in CITIES:
+        total += city[3]
+        cum_weights.append(total)
+    oldest = date(1940, 1, 1).toordinal()
+    youngest = date(today.year - 16, today.month, 1).toordinal()
+    earliest_join = date(2005, 1, 1).toordinal()
+
+    for i in range(offset, offset + count):
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES)
+        city, low, high, _ = rng.choices(CITIES, cum_weights=cum_weights)[0]
+        birth = rng.randint(oldest, youngest)
+        # Eintritt frühestens mit 16 und nicht vor 2005
+        join = rng.randint(max(birth + 16 * 365, earliest_join), today.toordinal())
+        amount = 0.0 if rng.random() < 0.3 else min(rng.lognormvariate(4, 1), 99_999)
+        yield {
+            "name": f"{first} {last}",
+            "email": f"{ascii_slug(first)}.{ascii_slug(last)}.{i}@example.org",
+            "birth_date": date.fromordinal(birth),
+            "address": f"{rng.choice(STREETS)} {rng.randint(1, 180)}",
+            "city": city,
+            "postal_code": f"{rng.randint(low, high):05d}",
+            "phone": (
+                f"0{rng.randint(151, 179)}-{rng.randint(1_000_000, 9_999_999)}"
+                if rng.random() < 0.7
+                else None
+            ),
+            "join_date": date.fromordinal(join),
+            "active": rng.random() < 0.88,
+            "total_amount_received": Decimal(f"{amount:.2f}"),
+        }
+
+
+def user_rows(
+    count: int,
+    hashed_password: str,
+    admin_role_id: int,
+    user_role_id: int,
+    seed: int = 0,
+    offset: int = 0,
+    admin_ratio: float = 0.05,
+) -> Iterator[Dict[str, Any]]:
+    """Erzeugt `count` Benutzer; alle teilen sich `hashed_password`."""
+    rng = _rng(seed + 1, offset)
+    for i in range(offset, offset + count):
+        first = ascii_slug(rng.choice(FIRST_NAMES))
+        last = ascii_slug(rng.choice(LAST_NAMES))
+        yield {
+            "username": f"{first}.{last}.{i}",
+            "email": f"{first}.{last}.{i}@users.example.org",
+            "hashed_password": hashed_password,
+            "role_id": admin_role_id if rng.random() < admin_ratio else user_role_id,
+            "token_version": 0,
+        }
+
+
+def ensure_roles(engine: Engine) -> Dict[str, int]:
+    """Legt die Rollen Admin/User an, falls sie fehlen; liefert Name -> ID."""
+    with Session(bind=engine) as db:
+        roles = {role.name: role.id for role in db.scalars(select(Role))}
+        for name in ("Admin", "User"):
+            if name not in roles:
+                role = Role(name=name)
+                db.add(role)
+                db.flush()
+                roles[name] = role.id
+        db.commit()
+    return roles
+
+
+def _batches(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict]]:
+    batch: List[Dict[str, Any]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _copy_batch(connection, table: Table, columns: Sequence[str], batch) -> None:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # Leere, nicht gequotete Felder liest COPY ... CSV als NULL
+    writer.writerows(
+        ["" if row[c] is None else row[c] for c in columns] for row in batch
+    )
+    buffer.seek(0)
+    with connection.connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+
+
+def bulk_load(
+    engine: Engine,
+    table: Table,
+    columns: Sequence[str],
+    rows: Iterable[Dict[str, Any]],
+    total: int,
+    batch_size: int,
+    label: str,
+) -> int:
+    """
+    Lädt `rows` blockweise (eine Transaktion pro Block) mit Fortschrittsausgabe.
+
+    COPY, wenn der Treiber psycopg2 ist, sonst INSERT per executemany.
+    """
+    use_copy = (
+        engine.dialect.name == "postgresql" and engine.dialect.driver == "psycopg2"
+    )
+    started = time.perf_counter()
+    loaded = 0
+    with engine.connect() as connection:
+        if engine.dialect.name == "sqlite":
+            # Nur für diese Verbindung: kein fsync pro Block
+            connection.exec_driver_sql("PRAGMA synchronous = OFF")
+        for batch in _batches(rows, batch_size):
+            if use_copy:
+                _copy_batch(connection, table, columns, batch)
+            else:
+                connection.execute(insert(table), batch)
+            connection.commit()
+            loaded += len(batch)
+            rate = loaded / max(time.perf_counter() - started, 1e-9)
+            print(
+                f"  {label}: {loaded:>10,}/{total:,} ({rate:,.0f} rows/s)", flush=True
+            )
+    return loaded
+
+
+@contextmanager
+def deferred_member_indexes(engine: Engine, enabled: bool = True) -> Iterator[None]:
+    """
+    Erstladen ohne Index-Pflege: Sekundärindizes und Namenssuche von `members`
+    werden entfernt und nach dem Laden in einem Durchgang neu aufgebaut.
+
+    Nur für eine leere Tabelle gedacht (Zeile für Zeile gepflegte B-Bäume und
+    der FTS-Trigger kosten sonst ein Vielfaches des eigentlichen INSERTs).
+    """
+    if not enabled:
+        yield
+        return
+
+    indexes = list(Member.__table__.indexes)
+    dialect = engine.dialect.name
+    with engine.begin() as connection:
+        for index in indexes:
+            index.drop(connection, checkfirst=True)
+        if dialect == "postgresql":
+            connection.execute(text("DROP INDEX IF EXISTS ix_members_name_trgm"))
+        elif dialect == "sqlite" and SQLITE_TRIGRAM_SUPPORTED:
+            connection.execute(text("DROP TRIGGER IF EXISTS members_name_fts_ai"))
+
+    try:
+        yield
+    finally:
+        started = time.perf_counter()
+        with engine.begin() as connection:
+            for index in indexes:
+                index.create(connection, checkfirst=True)
+            if dialect == "postgresql":
+                # CREATE INDEX ... USING gin (name gin_trgm_ops)
+                connection.execute(text(POSTGRES_NAME_TRGM_DDL[1]))
+            elif dialect == "sqlite" and SQLITE_TRIGRAM_SUPPORTED:
+                connection.execute(
+                    text(
+                        "INSERT INTO members_name_fts(members_name_fts) "
+                        "VALUES ('rebuild')"
+                    )
+                )
+                # AFTER INSERT-Trigger wieder anlegen
+                connection.execute(text(SQLITE_NAME_FTS_DDL[1]))
+        print(f"  indexes rebuilt in {time.perf_counter() - started:.1f}s", flush=True)
+
+
+def generate(
+    engine: Engine,
+    members: int,
+    users: int,
+    seed: int = 0,
+    offset: int = 0,
+    batch_size: int = 10_000,
+    admin_ratio: float = 0.05,
+    password: str = DEFAULT_PASSWORD,
+) -> Dict[str, Any]:
+    """Erzeugt und lädt Mitglieder und Benutzer; liefert Mengen und Laufzeiten."""
+    report: Dict[str, Any] = {"members": 0, "users": 0}
+    started = time.perf_counter()
+
+    if users:
+        roles = ensure_roles(engine)
+        rows = user_rows(
+            users,
+            get_password_hash(password),
+            roles["Admin"],
+            roles["User"],
+            seed=seed,
+            offset=offset,
+            admin_ratio=admin_ratio,
+        )
+        report["users"] = bulk_load(
+            engine, User.__table__, USER_COLUMNS, rows, users, batch_size, "users"
+        )
+
+    if members:
+        with engine.connect() as connection:
+            empty = connection.scalar(select(Member.id).limit(1)) is None
+        rows = member_rows(members, seed=seed, offset=offset)
+        with deferred_member_indexes(engine, enabled=empty):
+            report["members"] = bulk_load(
+                engine,
+                Member.__table__,
+                MEMBER_COLUMNS,
+                rows,
+                members,
+                batch_size,
+                "members",
+            )
+        stats_started = time.perf_counter()
+        with Session(bind=engine) as db:
+            report["stats_groups"] = recompute_member_stats(db)
+        report["stats_seconds"] = time.perf_counter() - stats_started
+
+    report["seconds"] = time.perf_counter() - started
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--members", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--offset",
+        type=int,
+        default=0,
+        help="Index of the first generated row (append to an existing dataset).",
+    )
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--admin-ratio", type=float, default=0.05)
+    parser.add_argument(
+        "--password", default=DEFAULT_PASSWORD, help="Password of all generated users."
+    )
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument(
+        "--create-schema",
+        action="store_true",
+        help="Create missing tables first (fresh SQLite files; use Alembic on Postgres).",
+    )
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url)
+    try:
+        if args.create_schema:
+            Base.metadata.create_all(engine)
+        report = generate(
+            engine,
+            members=args.members,
+            users=args.users,
+            seed=args.seed,
+            offset=args.offset,
+            batch_size=args.batch_size,
+            admin_ratio=args.admin_ratio,
+            password=args.password,
+        )
+    finally:
+        engine.dispose()
+
+    print(
+        f"✅ Generated {report['members']:,} members and {report['users']:,} users "
+        f"in {report['seconds']:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
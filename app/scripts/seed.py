@@ -11,15 +11,25 @@ Usage:
 
 Make sure to run migrations first:
   docker-compose exec app alembic upgrade head
+
+In production the app runs `seed()` itself at startup whenever
+`seed_fingerprint()` differs from the one stored in `app_state`
+(see app.db.bootstrap).
 """
 
+import hashlib
 from datetime import date
 
+from sqlalchemy.orm import Session
+
 from app.core.security import get_password_hash
 from app.db import SessionLocal
 from app.models.member import Member
 from app.models.role import Role
 from app.models.user import User
+from app.services.member_stats import add_member_values, apply_stats_delta, new_delta
+
+ADMIN_USERNAME = "admin"
 
 EXAMPLE_MEMBERS = [
     {
@@ -52,66 +62,81 @@ EXAMPLE_MEMBERS = [
 ]
 
 
+def seed_fingerprint() -> str:
+    """Ändert sich, sobald sich die Seed-Daten ändern (neuer Seed-Lauf nötig)."""
+    data = repr((("Member", "Admin"), ADMIN_USERNAME, EXAMPLE_MEMBERS))
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def seed(db: Session) -> None:
+    """Legt Rollen, Admin und Beispielmitglieder an, falls sie fehlen."""
+    # WICHTIG: Erstelle BEIDE Rollen
+    member_role = db.query(Role).filter(Role.name == "Member").first()
+    if not member_role:
+        member_role = Role(name="Member")
+        db.add(member_role)
+        db.commit()
+        db.refresh(member_role)
+        print("Created Role 'Member'")
+
+    admin_role = db.query(Role).filter(Role.name == "Admin").first()
+    if not admin_role:
+        admin_role = Role(name="Admin")
+        db.add(admin_role)
+        db.commit()
+        db.refresh(admin_role)
+        print("Created Role 'Admin'")
+
+    # Admin user mit Admin-Rolle!
+    admin = db.query(User).filter(User.username == ADMIN_USERNAME).first()
+    if not admin:
+        admin = User(
+            username=ADMIN_USERNAME,
+            email="admin@example.com",
+            hashed_password=get_password_hash("adminpass"),
+            role=admin_role,  # <- GEÄNDERT: Admin-Rolle!
+        )
+        db.add(admin)
+        db.commit()
+        db.refresh(admin)
+        print("Created admin user (username=admin, password=adminpass) with Admin role")
+    elif admin.role.name != "Admin":
+        # Falls Admin bereits existiert aber falsche Rolle hat
+        admin.role = admin_role
+        db.commit()
+        print("Updated admin user to Admin role")
+
+    # Seed Members
+    existing_count = db.query(Member).count()
+    if existing_count == 0:
+        stats = new_delta()
+        for m in EXAMPLE_MEMBERS:
+            if db.query(Member).filter(Member.email == m["email"]).first():
+                continue
+            member = Member(
+                name=m["name"],
+                email=m["email"],
+                birth_date=m["birth_date"],
+                address=m["address"],
+                city=m["city"],
+                postal_code=m["postal_code"],
+                phone=m.get("phone"),
+            )
+            db.add(member)
+            add_member_values(stats, m, +1)
+        # member_stats in derselben Transaktion fortschreiben
+        apply_stats_delta(db, stats)
+        db.commit()
+        print(f"Seeded {len(EXAMPLE_MEMBERS)} example members")
+    else:
+        print(f"{existing_count} members already present, skipping member seeding.")
+    print("Seed finished.")
+
+
 def main():
     db = SessionLocal()
     try:
-        # WICHTIG: Erstelle BEIDE Rollen
-        member_role = db.query(Role).filter(Role.name == "Member").first()
-        if not member_role:
-            member_role = Role(name="Member")
-            db.add(member_role)
-            db.commit()
-            db.refresh(member_role)
-            print("Created Role 'Member'")
-
-        admin_role = db.query(Role).filter(Role.name == "Admin").first()
-        if not admin_role:
-            admin_role = Role(name="Admin")
-            db.add(admin_role)
-            db.commit()
-            db.refresh(admin_role)
-            print("Created Role 'Admin'")
-
-        # Admin user mit Admin-Rolle!
-        admin = db.query(User).filter(User.username == "admin").first()
-        if not admin:
-            admin = User(
-                username="admin",
-                email="admin@example.com",
-                hashed_password=get_password_hash("adminpass"),
-                role=admin_role,  # <- GEÄNDERT: Admin-Rolle!
-            )
-            db.add(admin)
-            db.commit()
-            db.refresh(admin)
-            print("Created admin user (username=admin, password=adminpass) with Admin role")
-        elif admin.role.name != "Admin":
-            # Falls Admin bereits existiert aber falsche Rolle hat
-            admin.role = admin_role
-            db.commit()
-            print("Updated admin user to Admin role")
-
-        # Seed Members
-        existing_count = db.query(Member).count()
-        if existing_count == 0:
-            for m in EXAMPLE_MEMBERS:
-                if db.query(Member).filter(Member.email == m["email"]).first():
-                    continue
-                member = Member(
-                    name=m["name"],
-                    email=m["email"],
-                    birth_date=m["birth_date"],
-                    address=m["address"],
-                    city=m["city"],
-                    postal_code=m["postal_code"],
-                    phone=m.get("phone"),
-                )
-                db.add(member)
-            db.commit()
-            print(f"Seeded {len(EXAMPLE_MEMBERS)} example members")
-        else:
-            print(f"{existing_count} members already present, skipping member seeding.")
-        print("Seed finished.")
+        seed(db)
     except Exception as e:
         print("Seed failed:", e)
     finally:
@@ -119,4 +144,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Deletes expired password reset tokens in bounded batches, then sent or
+failed email outbox messages older than OUTBOX_RETENTION_DAYS.
+
+Same sweep as the in-process timer (RESET_TOKEN_SWEEP_SECONDS), for cron jobs
+or when the timer is disabled. Takes the same leader lock, so it never runs
+concurrently with a web worker's sweep.
+
+Usage:
+  python -m app.scripts.sweep_reset_tokens [--batch-size 1000] [--max-batches N]
+"""
+
+import argparse
+
+from app.core.config import settings
+from app.services.reset_token_sweeper import reset_token_sweeper
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.RESET_TOKEN_SWEEP_BATCH_SIZE
+    )
+    parser.add_argument("--max-batches", type=int, default=None)
+    args = parser.parse_args()
+
+    purged = reset_token_sweeper.sweep_as_leader(
+        batch_size=args.batch_size, max_batches=args.max_batches
+    )
+    if purged is None:
+        print("⏭️ Another worker is sweeping, skipping")
+        return
+
+    stats = reset_token_sweeper.stats()
+    print(
+        f"🧹 Purged {purged} expired reset tokens / old outbox messages in "
+        f"{stats['batches']} batch(es) "
+        f"(avg {stats['avg_batch_ms']} ms, max {stats['max_batch_ms']} ms)"
+    )
+
+
+if __name__ == "__main__":
+    main()
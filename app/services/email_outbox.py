@@ -0,0 +1,260 @@
+import smtplib
+import time
+from datetime import datetime, timedelta, timezone
+from email.message import EmailMessage
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.email_outbox import EmailOutbox
+
+
+def enqueue_email(db: Session, recipient: str, subject: str, body: str) -> EmailOutbox:
+    """
+    Legt eine Nachricht in der Outbox ab (ohne Commit).
+
+    Der Aufrufer committet sie zusammen mit dem auslösenden Datensatz; geht
+    die Transaktion schief, wird auch keine Mail verschickt.
+    """
+    message = EmailOutbox(
+        recipient=recipient,
+        subject=subject,
+        body=body,
+        status="pending",
+        attempts=0,
+        next_attempt_at=datetime.now(timezone.utc),
+    )
+    db.add(message)
+    return message
+
+
+def password_reset_email(token: str) -> Tuple[str, str]:
+    """Betreff und Text der Reset-Mail."""
+    link = f"{settings.PASSWORD_RESET_URL}?token={token}"
+    body = (
+        "Hallo,\n\n"
+        "für Ihr Konto wurde ein neues Passwort angefordert. Über diesen Link "
+        f"können Sie es setzen:\n\n{link}\n\n"
+        "Falls Sie das nicht waren, können Sie diese Nachricht ignorieren.\n"
+    )
+    return "Passwort zurücksetzen", body
+
+
+def backoff_seconds(attempts: int) -> float:
+    """Wartezeit nach dem `attempts`-ten Fehlversuch (exponentiell, gedeckelt)."""
+    delay = settings.OUTBOX_BACKOFF_SECONDS * 2 ** max(0, attempts - 1)
+    return min(delay, settings.OUTBOX_BACKOFF_MAX_SECONDS)
+
+
+def connection_lost(error: Exception) -> bool:
+    """Socket-Fehler oder Verbindungsabbruch (SMTPException erbt von OSError)."""
+    return isinstance(error, smtplib.SMTPServerDisconnected) or not isinstance(
+        error, smtplib.SMTPException
+    )
+
+
+class ClaimedMessage(NamedTuple):
+    """Stand einer geholten Nachricht; der Versand läuft ohne offene Transaktion."""
+
+    id: int
+    recipient: str
+    subject: str
+    body: str
+    attempts: int
+
+
+class SMTPConnection:
+    """
+    Eine über mehrere Batches offen gehaltene SMTP-Verbindung (MAIL_*).
+
+    Vor der Wiederverwendung prüft ein NOOP, ob der Server die Verbindung
+    noch hält; sonst wird neu verbunden.
+    """
+
+    def __init__(self, factory: Optional[Callable[[], smtplib.SMTP]] = None):
+        self._factory = factory or self._connect
+        self._smtp: Optional[smtplib.SMTP] = None
+
+    @staticmethod
+    def _connect() -> smtplib.SMTP:
+        if not settings.MAIL_SERVER:
+            raise smtplib.SMTPException("MAIL_SERVER is not configured")
+        smtp = smtplib.SMTP(
+            settings.MAIL_SERVER,
+            settings.MAIL_PORT or 25,
+            timeout=settings.MAIL_TIMEOUT_SECONDS,
+        )
+        if settings.MAIL_STARTTLS:
+            smtp.starttls()
+        if settings.MAIL_USERNAME:
+            smtp.login(settings.MAIL_USERNAME, settings.MAIL_PASSWORD or "")
+        return smtp
+
+    def get(self) -> smtplib.SMTP:
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.reset()
+        self._smtp = self._factory()
+        return self._smtp
+
+    def reset(self) -> None:
+        """Verwirft die Verbindung; die nächste Nachricht verbindet neu."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+
+    close = reset
+
+
+class OutboxSender:
+    """
+    Versendet fällige Outbox-Nachrichten blockweise.
+
+    Ein Block wird mit FOR UPDATE SKIP LOCKED gelesen (Postgres) und durch ein
+    bedingtes Vorschieben von `next_attempt_at` um OUTBOX_LEASE_SECONDS
+    verleast, sodass auch mehrere Worker auf SQLite nichts doppelt senden; dann
+    wird committet, sodass während des SMTP-Versands keine Sperren gehalten
+    werden. Das Ergebnis wird je Nachricht festgeschrieben. Stirbt ein Worker,
+    läuft die Lease ab und die Nachrichten werden erneut geholt.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        connection: Optional[SMTPConnection] = None,
+        batch_size: Optional[int] = None,
+    ):
+        self.session_factory = session_factory
+        self.connection = connection or SMTPConnection()
+        self.batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+
+    def _due_ids(self, db: Session, now: datetime) -> List[int]:
+        query = (
+            select(EmailOutbox.id)
+            .where(
+                EmailOutbox.status == "pending",
+                EmailOutbox.next_attempt_at <= now,
+            )
+            .order_by(EmailOutbox.id)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        return list(db.scalars(query))
+
+    def claim(self, db: Session) -> List[ClaimedMessage]:
+        """
+        Holt und verleast einen Block fälliger Nachrichten (mit Commit).
+
+        Die Lease ist ein bedingtes UPDATE: nur Zeilen, die beim Schreiben
+        noch fällig sind, werden vorgeschoben und zurückgegeben. Ohne SKIP
+        LOCKED (SQLite) kann so ein zweiter Worker, der dieselben Kandidaten
+        gelesen hat, sie nicht noch einmal holen.
+        """
+        now = datetime.now(timezone.utc)
+        ids = self._due_ids(db, now)
+        if not ids:
+            db.commit()
+            return []
+        lease_until = now + timedelta(seconds=settings.OUTBOX_LEASE_SECONDS)
+        rows = db.execute(
+            update(EmailOutbox)
+            .where(
+                EmailOutbox.id.in_(ids),
+                EmailOutbox.status == "pending",
+                EmailOutbox.next_attempt_at <= now,
+            )
+            .values(next_attempt_at=lease_until)
+            .returning(
+                EmailOutbox.id,
+                EmailOutbox.recipient,
+                EmailOutbox.subject,
+                EmailOutbox.body,
+                EmailOutbox.attempts,
+            )
+            .execution_options(synchronize_session=False)
+        ).all()
+        db.commit()
+        return sorted(ClaimedMessage(*row) for row in rows)
+
+    def _send(self, message: ClaimedMessage) -> None:
+        email = EmailMessage()
+        email["From"] = (
+            settings.MAIL_FROM or settings.MAIL_USERNAME or "noreply@localhost"
+        )
+        email["To"] = message.recipient
+        email["Subject"] = message.subject
+        email.set_content(message.body)
+        self.connection.get().send_message(email)
+
+    def _sent(self, db: Session, message: ClaimedMessage) -> None:
+        now = datetime.now(timezone.utc)
+        # Der Reset-Link soll nicht länger als nötig in der DB liegen
+        self._record(
+            db, message, status="sent", sent_at=now, next_attempt_at=now, body=""
+        )
+
+    def _failed(self, db: Session, message: ClaimedMessage, error: Exception) -> None:
+        attempts = message.attempts + 1
+        values = {
+            "attempts": attempts,
+            "last_error": f"{type(error).__name__}: {error}"[:1000],
+        }
+        if attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+            values.update(
+                status="failed", next_attempt_at=datetime.now(timezone.utc), body=""
+            )
+        else:
+            values["next_attempt_at"] = datetime.now(timezone.utc) + timedelta(
+                seconds=backoff_seconds(attempts)
+            )
+        self._record(db, message, **values)
+
+    @staticmethod
+    def _record(db: Session, message: ClaimedMessage, **values) -> None:
+        db.execute(
+            update(EmailOutbox).where(EmailOutbox.id == message.id).values(**values)
+        )
+        db.commit()
+
+    def drain_once(self) -> int:
+        """Verarbeitet höchstens einen Block; liefert die Anzahl geholter Nachrichten."""
+        with self.session_factory() as db:
+            batch = self.claim(db)
+            for message in batch:
+                try:
+                    self._send(message)
+                except (smtplib.SMTPException, OSError) as e:
+                    if connection_lost(e):
+                        # Nächste Nachricht verbindet neu; bei abgelehnten
+                        # Empfängern o. Ä. bleibt die Verbindung bestehen
+                        self.connection.reset()
+                    self._failed(db, message, e)
+                    continue
+                self._sent(db, message)
+            return len(batch)
+
+    def run_forever(self, poll_seconds: Optional[float] = None) -> None:
+        poll_seconds = poll_seconds or settings.OUTBOX_POLL_SECONDS
+        try:
+            while True:
+                try:
+                    drained = self.drain_once()
+                except Exception as e:
+                    # z. B. DB kurz nicht erreichbar: später erneut versuchen
+                    print(f"⚠️ Outbox drain failed: {e}")
+                    drained = 0
+                # Volle Blöcke direkt nacheinander, sonst warten
+                if drained < self.batch_size:
+                    time.sleep(poll_seconds)
+        finally:
+            self.connection.close()
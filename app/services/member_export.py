@@ -0,0 +1,80 @@
+import csv
+import io
+from typing import AsyncIterator, Iterator, List, Optional, Sequence
+
+from sqlalchemy import Select, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.member import Member
+from app.schemas.member import MemberFilter, MemberRead
+from app.services.member_service import filter_members
+
+# Gleiche Felder und Serialisierung wie GET /members
+EXPORT_FIELDS: List[str] = list(MemberRead.model_fields)
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def build_export_query(
+    criteria: Optional[MemberFilter] = None, dialect: Optional[str] = None
+) -> Select:
+    """
+    SELECT über die Exportspalten (ohne ORM-Objekte), mit den Filtern von get_members.
+
+    `stream_results` + `yield_per` lesen über einen serverseitigen Cursor in
+    Blöcken, statt die ganze Tabelle in den Speicher zu holen.
+    """
+    columns = [Member.__table__.c[field] for field in EXPORT_FIELDS]
+    query = filter_members(select(*columns), criteria, dialect)
+    return query.order_by(Member.id).execution_options(
+        stream_results=True, yield_per=settings.EXPORT_BATCH_SIZE
+    )
+
+
+def encode_batch(rows: Sequence[Row], export_format: str) -> str:
+    """Kodiert einen Block Zeilen als NDJSON bzw. CSV (ohne Kopfzeile)."""
+    members = [MemberRead.model_validate(row._mapping) for row in rows]
+    if export_format == "ndjson":
+        return "".join(member.model_dump_json() + "\n" for member in members)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for member in members:
+        values = member.model_dump(mode="json")
+        writer.writerow(values[field] for field in EXPORT_FIELDS)
+    return buffer.getvalue()
+
+
+def csv_header() -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(EXPORT_FIELDS)
+    return buffer.getvalue()
+
+
+def iter_export(
+    session: Session,
+    export_format: str,
+    criteria: Optional[MemberFilter] = None,
+) -> Iterator[str]:
+    """Liefert den Export blockweise; der erste Block geht vor der letzten Zeile raus."""
+    if export_format == "csv":
+        yield csv_header()
+    query = build_export_query(criteria, session.get_bind().dialect.name)
+    for rows in session.execute(query).partitions():
+        yield encode_batch(rows, export_format)
+
+
+async def aiter_export(
+    session: AsyncSession,
+    export_format: str,
+    criteria: Optional[MemberFilter] = None,
+) -> AsyncIterator[str]:
+    """Async-Variante von iter_export (AsyncSession.stream)."""
+    if export_format == "csv":
+        yield csv_header()
+    query = build_export_query(criteria, session.get_bind().dialect.name)
+    result = await session.stream(query)
+    async for rows in result.partitions():
+        yield encode_batch(rows, export_format)
@@ -0,0 +1,145 @@
+import codecs
+import csv
+import json
+from collections import defaultdict
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.member import Member
+from app.schemas.member import MemberCreate, MemberImportReport, MemberImportRow
+from app.services.member_stats import add_member_values, apply_stats_delta, new_delta
+
+ParsedRow = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def import_format_for(filename: Optional[str]) -> str:
+    """CSV für `*.csv`, sonst NDJSON."""
+    return "csv" if (filename or "").lower().endswith(".csv") else "ndjson"
+
+
+def parse_rows(stream: IO[bytes], import_format: str) -> Iterator[ParsedRow]:
+    """
+    Liest CSV/NDJSON zeilenweise aus dem Upload: `(zeile, daten, fehler)`.
+
+    Die Datei wird nie komplett in den Speicher geladen; leere CSV-Felder
+    gelten als nicht gesetzt (DB-Default greift).
+    """
+    text = codecs.getreader("utf-8-sig")(stream)
+    if import_format == "csv":
+        for number, record in enumerate(csv.DictReader(text), start=1):
+            yield number, {k: v for k, v in record.items() if k and v != ""}, None
+        return
+
+    number = 0
+    for line in text:
+        if not line.strip():
+            continue
+        number += 1
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield number, None, f"Invalid JSON: {exc.msg}"
+            continue
+        if isinstance(data, dict):
+            yield number, data, None
+        else:
+            yield number, None, "Each line must be a JSON object"
+
+
+def _validation_errors(exc: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    ]
+
+
+class MemberImporter:
+    """
+    Legt Mitglieder blockweise an (ein INSERT ... RETURNING pro Block).
+
+    Statt commit/refresh pro Mitglied wird je IMPORT_BATCH_SIZE Zeilen einmal
+    auf bestehende E-Mails geprüft und per executemany (insertmanyvalues)
+    eingefügt.
+    """
+
+    def __init__(self, db: Session, batch_size: Optional[int] = None):
+        self.db = db
+        self.batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+        self.report = MemberImportReport()
+
+    def run(self, rows: Iterable[ParsedRow]) -> MemberImportReport:
+        batch: List[Tuple[int, MemberCreate]] = []
+        for number, data, error in rows:
+            if error is None:
+                try:
+                    batch.append((number, MemberCreate.model_validate(data)))
+                except ValidationError as exc:
+                    self._invalid(number, _validation_errors(exc))
+            else:
+                self._invalid(number, [error])
+
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+                batch = []
+
+        if batch:
+            self._flush(batch)
+        self.report.rows.sort(key=lambda row: row.row)
+        return self.report
+
+    def _invalid(self, number: int, errors: List[str]) -> None:
+        self.report.invalid += 1
+        self.report.rows.append(
+            MemberImportRow(row=number, status="invalid", errors=errors)
+        )
+
+    def _duplicate(self, number: int, email: str) -> None:
+        self.report.duplicates += 1
+        self.report.rows.append(
+            MemberImportRow(row=number, status="duplicate_email", email=email)
+        )
+
+    def _flush(self, batch: List[Tuple[int, MemberCreate]]) -> None:
+        emails = [member.email for _, member in batch]
+        taken = set(
+            self.db.scalars(select(Member.email).where(Member.email.in_(emails)))
+        )
+
+        # executemany braucht identische Spalten je Statement
+        groups: Dict[Tuple[str, ...], List[Tuple[int, Dict[str, Any]]]] = defaultdict(
+            list
+        )
+        for number, member in batch:
+            if member.email in taken:
+                self._duplicate(number, member.email)
+                continue
+            taken.add(member.email)
+            values = member.model_dump(exclude_none=True)
+            groups[tuple(sorted(values))].append((number, values))
+
+        created = []
+        stats = new_delta()
+        for group in groups.values():
+            result = self.db.execute(
+                insert(Member).returning(Member.id, Member.email),
+                [values for _, values in group],
+            )
+            ids = {row.email: row.id for row in result}
+            created.extend(
+                (number, ids[values["email"]], values["email"])
+                for number, values in group
+            )
+            for _, values in group:
+                add_member_values(stats, values, +1)
+        apply_stats_delta(self.db, stats)
+        self.db.commit()
+
+        for number, member_id, email in created:
+            self.report.created += 1
+            self.report.rows.append(
+                MemberImportRow(row=number, status="created", id=member_id, email=email)
+            )
@@ -1,12 +1,352 @@
 from datetime import date
-from typing import List, Optional
+from typing import Any, List, NamedTuple, Optional, Tuple
 
-from fastapi import Depends  # NEU: Depends importieren
+from fastapi import Depends, HTTPException, status  # NEU: Depends importieren
+from sqlalchemy import (
+    Delete,
+    Select,
+    Update,
+    delete,
+    func,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.db import get_db  # NEU: get_db importieren
-from app.models.member import Member
-from app.schemas.member import MemberCreate, MemberUpdate
+from app.core.config import settings
+from app.core.member_cache import CachedMember, member_cache, member_count_cache
+from app.core.pagination import decode_cursor, encode_cursor
+from app.db import get_async_db, get_db, get_read_db  # NEU: get_db importieren
+from app.db.replica import RoutingSession
+from app.models.member import SQLITE_TRIGRAM_SUPPORTED, Member, members_name_fts
+from app.schemas.member import (
+    MEMBER_READ_FIELDS,
+    MemberBulkUpdate,
+    MemberCreate,
+    MemberFilter,
+    MemberRead,
+    MemberSelection,
+    MemberUpdate,
+)
+from app.services.member_stats import (
+    STATS_COLUMNS,
+    apply_stats_delta,
+    bump_members_version,
+    change_delta,
+    member_values,
+    members_version_query,
+    selection_delta,
+)
+
+# Sortierschlüssel für die Keyset-Pagination; `id` macht jeden Schlüssel eindeutig
+MEMBER_SORT_KEYS = {
+    "id": (Member.id,),
+    "name": (Member.name, Member.id),
+}
+
+
+def valid_cursor_key(key: Any, columns: Tuple[Any, ...]) -> bool:
+    """Prüft den Schlüssel eines Cursors: passende Länge und Typ je Spalte."""
+    if not isinstance(key, list) or len(key) != len(columns):
+        return False
+    return all(
+        isinstance(value, column.type.python_type) and not isinstance(value, bool)
+        for value, column in zip(key, columns)
+    )
+
+
+class MemberPage(NamedTuple):
+    """Eine Seite der Mitgliederliste samt opaken Cursorn für Vor/Zurück."""
+
+    items: List[Member]
+    next_cursor: Optional[str]
+    prev_cursor: Optional[str]
+
+
+def name_search_clause(name: str, dialect: Optional[str] = None):
+    """
+    Fall-unabhängige Teilstring-Suche auf `name`.
+
+    Postgres beantwortet das ILIKE über den pg_trgm-GIN-Index; auf SQLite wird
+    ab drei Zeichen die FTS5-Trigram-Tabelle abgefragt (ein Trigram-Phrasen-
+    treffer ist genau ein Teilstring-Treffer). Kürzere Suchbegriffe und andere
+    Backends fallen auf das einfache ILIKE zurück.
+    """
+    if dialect == "sqlite" and SQLITE_TRIGRAM_SUPPORTED and len(name) >= 3:
+        phrase = '"' + name.replace('"', '""') + '"'
+        return Member.id.in_(
+            select(members_name_fts.c.rowid).where(
+                members_name_fts.c.members_name_fts.op("MATCH")(phrase)
+            )
+        )
+    # % und _ aus der Eingabe sind Literale, keine Platzhalter
+    escaped = name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return Member.name.ilike(f"%{escaped}%", escape="\\")
+
+
+def member_filter_clauses(
+    criteria: Optional[MemberFilter], dialect: Optional[str] = None
+) -> list:
+    """
+    WHERE-Bedingungen eines MemberFilter.
+
+    Jede Bedingung hat einen passenden Index (siehe Member.__table_args__);
+    der Präfix auf postal_code nutzt unter Postgres text_pattern_ops.
+    """
+    if criteria is None:
+        return []
+    clauses = []
+    if criteria.name:
+        clauses.append(name_search_clause(criteria.name, dialect))
+    if criteria.birth_date:
+        # Exakter Vergleich des Geburtsdatums
+        clauses.append(Member.birth_date == criteria.birth_date)
+    if criteria.active is not None:
+        clauses.append(Member.active == criteria.active)
+    if criteria.city:
+        clauses.append(Member.city == criteria.city)
+    if criteria.postal_code_prefix:
+        clauses.append(
+            Member.postal_code.startswith(criteria.postal_code_prefix, autoescape=True)
+        )
+    if criteria.joined_before:
+        clauses.append(Member.join_date < criteria.joined_before)
+    if criteria.joined_after:
+        clauses.append(Member.join_date > criteria.joined_after)
+    if criteria.born_before:
+        clauses.append(Member.birth_date < criteria.born_before)
+    if criteria.born_after:
+        clauses.append(Member.birth_date > criteria.born_after)
+    if criteria.min_amount_received is not None:
+        clauses.append(Member.total_amount_received >= criteria.min_amount_received)
+    if criteria.max_amount_received is not None:
+        clauses.append(Member.total_amount_received <= criteria.max_amount_received)
+    return clauses
+
+
+def filter_members(
+    query: Select,
+    criteria: Optional[MemberFilter] = None,
+    dialect: Optional[str] = None,
+) -> Select:
+    return query.where(*member_filter_clauses(criteria, dialect))
+
+
+def build_members_query(
+    name: Optional[str] = None,
+    birth_date: Optional[date] = None,
+    limit: int = 100,
+    dialect: Optional[str] = None,
+) -> Select:
+    """Baut das SELECT für die Mitgliederliste (geteilt von Sync- und Async-Service)."""
+    criteria = MemberFilter(name=name, birth_date=birth_date)
+    return filter_members(select(Member), criteria, dialect).limit(limit)
+
+
+def estimate_members_count(
+    db: Session, criteria: Optional[MemberFilter] = None
+) -> Optional[int]:
+    """
+    Schätzung der Trefferzahl durch den Postgres-Planer (None auf anderen Backends).
+
+    Ungefiltert aus `pg_class.reltuples`, gefiltert aus der Zeilenschätzung
+    von EXPLAIN; beides kostet keinen Tabellenscan.
+    """
+    dialect = db.get_bind().dialect
+    if dialect.name != "postgresql":
+        return None
+    clauses = member_filter_clauses(criteria, dialect.name)
+    if not clauses:
+        reltuples = db.scalar(
+            text(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = 'members'::regclass"
+            )
+        )
+        # -1: Tabelle wurde noch nie analysiert
+        return reltuples if reltuples is not None and reltuples >= 0 else None
+    statement, params = explain_statement(select(Member.id).where(*clauses), dialect)
+    plan = db.connection().exec_driver_sql(statement, params).scalar()
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def explain_statement(query: Select, dialect: Any) -> Tuple[str, Any]:
+    """
+    `EXPLAIN (FORMAT JSON)` für `query` als Treiber-SQL samt Parametern.
+
+    Filterwerte bleiben gebundene Parameter und werden nie in das SQL
+    eingesetzt; das Format der Parameter folgt dem paramstyle des Treibers.
+    """
+    compiled = query.compile(
+        dialect=dialect, compile_kwargs={"render_postcompile": True}
+    )
+    params: Any = compiled.params
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+    return f"EXPLAIN (FORMAT JSON) {compiled.string}", params
+
+
+def count_members(
+    db: Session, criteria: Optional[MemberFilter] = None
+) -> Tuple[int, bool]:
+    """
+    Trefferzahl für X-Total-Count; liefert `(anzahl, exakt)`.
+
+    Exakte Zählungen werden je Filter und Änderungszähler von `members`
+    gecacht; jeder Schreibzugriff macht die Einträge damit ungültig. Schätzt
+    der Planer mehr als MEMBER_COUNT_EXACT_LIMIT Treffer, wird die Schätzung
+    geliefert statt gezählt.
+    """
+    version = db.scalar(members_version_query()) or 0
+    criteria_key = criteria.model_dump_json(exclude_none=True) if criteria else "{}"
+    key = f"{version}:{criteria_key}"
+    cached = member_count_cache.get(key)
+    if cached is not None:
+        return cached, True
+
+    estimate = estimate_members_count(db, criteria)
+    if estimate is not None and estimate > settings.MEMBER_COUNT_EXACT_LIMIT:
+        return estimate, False
+
+    dialect = db.get_bind().dialect.name
+    total = db.scalar(filter_members(select(func.count(Member.id)), criteria, dialect))
+    member_count_cache.set(key, total)
+    return total, True
+
+
+def selection_clauses(
+    selection: MemberSelection, dialect: Optional[str] = None
+) -> list:
+    """WHERE-Bedingungen für eine Bulk-Auswahl (IDs und/oder Filter)."""
+    clauses = []
+    if selection.ids:
+        clauses.append(Member.id.in_(selection.ids))
+    return clauses + member_filter_clauses(selection.filter, dialect)
+
+
+def build_bulk_update(bulk: MemberBulkUpdate, dialect: Optional[str] = None) -> Update:
+    """Ein einziges UPDATE ... RETURNING id über die ganze Auswahl."""
+    return (
+        update(Member)
+        .where(*selection_clauses(bulk, dialect))
+        .values(**bulk.patch.model_dump(exclude_unset=True))
+        .returning(Member.id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def build_bulk_delete(
+    selection: MemberSelection, dialect: Optional[str] = None
+) -> Delete:
+    """Ein einziges DELETE ... RETURNING id über die ganze Auswahl."""
+    return (
+        delete(Member)
+        .where(*selection_clauses(selection, dialect))
+        .returning(Member.id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def parse_member_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Prüft `?fields=id,name` gegen die Felder von MemberRead.
+
+    Liefert die Felder in der Reihenfolge von MemberRead (ohne Duplikate) oder
+    None, wenn alle Felder gewünscht sind.
+    """
+    if fields is None:
+        return None
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = sorted(requested.difference(MEMBER_READ_FIELDS))
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"Unknown fields: {', '.join(unknown)}"
+                if unknown
+                else "No fields selected"
+            ),
+        )
+    return tuple(field for field in MEMBER_READ_FIELDS if field in requested)
+
+
+def build_members_page_query(
+    criteria: Optional[MemberFilter] = None,
+    limit: int = 100,
+    order_by: str = "id",
+    cursor: Optional[str] = None,
+    dialect: Optional[str] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+) -> Tuple[Select, bool]:
+    """
+    Baut das Keyset-SELECT für eine Seite; liefert `(query, rückwärts)`.
+
+    Statt OFFSET wird ab dem Schlüssel im Cursor weitergelesen, daher kostet
+    jede Seite über den Index (name, id) bzw. den Primärschlüssel gleich viel.
+    Es wird ein Datensatz mehr geladen, um zu erkennen, ob es weitergeht.
+    Mit `fields` werden nur diese Spalten (plus Sortierschlüssel für den
+    Cursor) als Zeilen statt ORM-Objekte geladen.
+    """
+    columns = MEMBER_SORT_KEYS[order_by]
+    if fields:
+        keys = dict.fromkeys([*fields, *(column.key for column in columns)])
+        base = select(*(getattr(Member, key) for key in keys))
+    else:
+        base = select(Member)
+    query = filter_members(base, criteria, dialect)
+    backwards = False
+
+    if cursor:
+        position = decode_cursor(cursor)
+        key = position.get("k")
+        if position.get("o") != order_by or not valid_cursor_key(key, columns):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
+        backwards = bool(position.get("b"))
+        if len(columns) == 1:
+            column, value = columns[0], key[0]
+        else:
+            column, value = tuple_(*columns), tuple_(*key)
+        query = query.where(column < value if backwards else column > value)
+
+    ordering = [c.desc() if backwards else c.asc() for c in columns]
+    return query.order_by(*ordering).limit(limit + 1), backwards
+
+
+def make_members_page(
+    rows: List[Any], limit: int, order_by: str, backwards: bool, has_cursor: bool
+) -> MemberPage:
+    """Schneidet die Zusatzzeile ab und erzeugt die Cursor für Vor/Zurück."""
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if backwards:
+        rows.reverse()
+
+    def cursor_for(member: Any, before: bool) -> str:
+        key = [getattr(member, column.key) for column in MEMBER_SORT_KEYS[order_by]]
+        return encode_cursor({"o": order_by, "k": key, "b": before})
+
+    if not rows:
+        return MemberPage(rows, None, None)
+    # Rückwärts geblättert: die Folgeseite existiert immer; vorwärts die vorige
+    has_next = has_more or backwards
+    has_prev = has_more if backwards else has_cursor
+    return MemberPage(
+        rows,
+        cursor_for(rows[-1], before=False) if has_next else None,
+        cursor_for(rows[0], before=True) if has_prev else None,
+    )
+
+
+def serialize_member(member: Member) -> CachedMember:
+    """Serialisiert ein Mitglied einmalig für den Detail-Cache."""
+    return CachedMember(
+        body=MemberRead.model_validate(member).model_dump_json().encode(),
+        last_modified=member.updated_at or member.created_at,
+    )
 
 
 class MemberService:
@@ -17,10 +357,34 @@ class MemberService:
     def __init__(self, db: Session):
         self.db = db
 
+    @property
+    def dialect(self) -> str:
+        return self.db.get_bind().dialect.name
+
     def get_member_by_id(self, member_id: int) -> Optional[Member]:
         """Ruft ein Mitglied anhand der ID ab."""
         return self.db.query(Member).filter(Member.id == member_id).first()
 
+    def get_member_payload(self, member_id: int) -> Optional[CachedMember]:
+        """
+        Serialisiertes Mitglied aus dem Cache, bei einem Fehlschlag aus der DB.
+
+        Nur Zeilen vom Primary füllen den Cache: ein nachhinkendes Replikat
+        könnte sonst direkt nach einer Invalidierung den alten Stand für die
+        ganze TTL zurückschreiben.
+        """
+        cached = member_cache.get(member_id)
+        if cached is not None:
+            return cached
+        generation = member_cache.generation
+        member = self.get_member_by_id(member_id)
+        if member is None:
+            return None
+        cached = serialize_member(member)
+        if not isinstance(self.db, RoutingSession):
+            member_cache.fill(member_id, cached, generation)
+        return cached
+
     def get_members(
         self,
         name: Optional[str] = None,
@@ -28,17 +392,36 @@ class MemberService:
         limit: int = 100,
     ) -> List[Member]:
         """Ruft Mitglieder ab, mit optionaler Filterung."""
-        query = self.db.query(Member)
+        query = build_members_query(
+            name=name, birth_date=birth_date, limit=limit, dialect=self.dialect
+        )
+        return list(self.db.scalars(query).all())
 
-        if name:
-            # Fall-unabhängige Suche nach Teilstring
-            query = query.filter(Member.name.ilike(f"%{name}%"))
+    def get_members_page(
+        self,
+        criteria: Optional[MemberFilter] = None,
+        limit: int = 100,
+        order_by: str = "id",
+        cursor: Optional[str] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> MemberPage:
+        """Ruft eine Seite der Mitgliederliste ab (Keyset-Pagination)."""
+        query, backwards = build_members_page_query(
+            criteria, limit, order_by, cursor, self.dialect, fields
+        )
+        result = self.db.execute(query) if fields else self.db.scalars(query)
+        rows = list(result.all())
+        return make_members_page(rows, limit, order_by, backwards, bool(cursor))
 
-        if birth_date:
-            # Exakter Vergleich des Geburtsdatums
-            query = query.filter(Member.birth_date == birth_date)
+    def get_members_version(self) -> int:
+        """Änderungszähler der Mitglieder (für das ETag der Liste)."""
+        return self.db.scalar(members_version_query()) or 0
 
-        return query.limit(limit).all()
+    def count_members(
+        self, criteria: Optional[MemberFilter] = None
+    ) -> Tuple[int, bool]:
+        """Exakte oder geschätzte Trefferzahl, siehe count_members()."""
+        return count_members(self.db, criteria)
 
     def create_member(self, member_data: MemberCreate) -> Member:
         """Erstellt ein neues Mitglied in der Datenbank."""
@@ -48,6 +431,7 @@ class MemberService:
 
         db_member = Member(**member_dict)
         self.db.add(db_member)
+        apply_stats_delta(self.db, change_delta(new=member_dict))
         self.db.commit()
         self.db.refresh(db_member)
         return db_member
@@ -55,25 +439,195 @@ class MemberService:
     def update_member(self, member: Member, update_data: MemberUpdate) -> Member:
         """Aktualisiert die Attribute eines bestehenden Mitglieds."""
 
+        before = member_values(member)
         # Iteriere nur über die gesetzten (nicht None) Werte im Update-Schema
         for key, value in update_data.model_dump(exclude_unset=True).items():
             setattr(member, key, value)
+        apply_stats_delta(self.db, change_delta(before, member_values(member)))
 
         # SQLAlchemy setzt func.now() (onupdate) automatisch für updated_at
+        member_id = member.id
         self.db.commit()
+        member_cache.invalidate(member_id)
         self.db.refresh(member)
         return member
 
+    def bulk_update(self, bulk: MemberBulkUpdate) -> List[int]:
+        """Wendet `bulk.patch` auf alle ausgewählten Mitglieder an; liefert deren IDs."""
+        patch = bulk.patch.model_dump(exclude_unset=True)
+        if STATS_COLUMNS.intersection(patch):
+            clauses = selection_clauses(bulk, self.dialect)
+            apply_stats_delta(self.db, selection_delta(self.db, clauses, patch))
+        else:
+            bump_members_version(self.db)
+        ids = sorted(self.db.scalars(build_bulk_update(bulk, self.dialect)))
+        self.db.commit()
+        member_cache.invalidate_many(ids)
+        return ids
+
+    def bulk_delete(self, selection: MemberSelection) -> List[int]:
+        """Löscht alle ausgewählten Mitglieder; liefert deren IDs."""
+        clauses = selection_clauses(selection, self.dialect)
+        apply_stats_delta(self.db, selection_delta(self.db, clauses))
+        ids = sorted(self.db.scalars(build_bulk_delete(selection, self.dialect)))
+        self.db.commit()
+        member_cache.invalidate_many(ids)
+        return ids
+
     def delete_member(self, member: Member) -> None:
         """Löscht ein Mitglied."""
         if isinstance(member, int):
             member = self.get_member_by_id(member)
             if member is None:
                 raise ValueError("Member not found")
+        member_id = member.id
+        apply_stats_delta(self.db, change_delta(old=member_values(member)))
         self.db.delete(member)
         self.db.commit()
+        member_cache.invalidate(member_id)
+
+
+class AsyncMemberService:
+    """
+    Async-Variante von MemberService für DATABASE_MODE=async (AsyncSession).
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @property
+    def dialect(self) -> str:
+        return self.db.get_bind().dialect.name
+
+    async def get_member_by_id(self, member_id: int) -> Optional[Member]:
+        """Ruft ein Mitglied anhand der ID ab."""
+        return await self.db.get(Member, member_id)
+
+    async def get_member_payload(self, member_id: int) -> Optional[CachedMember]:
+        """Serialisiertes Mitglied aus dem Cache, bei einem Fehlschlag aus der DB."""
+        cached = member_cache.get(member_id)
+        if cached is not None:
+            return cached
+        generation = member_cache.generation
+        member = await self.get_member_by_id(member_id)
+        if member is None:
+            return None
+        cached = serialize_member(member)
+        member_cache.fill(member_id, cached, generation)
+        return cached
+
+    async def get_members(
+        self,
+        name: Optional[str] = None,
+        birth_date: Optional[date] = None,
+        limit: int = 100,
+    ) -> List[Member]:
+        """Ruft Mitglieder ab, mit optionaler Filterung."""
+        query = build_members_query(
+            name=name, birth_date=birth_date, limit=limit, dialect=self.dialect
+        )
+        return list((await self.db.scalars(query)).all())
+
+    async def get_members_page(
+        self,
+        criteria: Optional[MemberFilter] = None,
+        limit: int = 100,
+        order_by: str = "id",
+        cursor: Optional[str] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> MemberPage:
+        """Ruft eine Seite der Mitgliederliste ab (Keyset-Pagination)."""
+        query, backwards = build_members_page_query(
+            criteria, limit, order_by, cursor, self.dialect, fields
+        )
+        if fields:
+            rows = list((await self.db.execute(query)).all())
+        else:
+            rows = list((await self.db.scalars(query)).all())
+        return make_members_page(rows, limit, order_by, backwards, bool(cursor))
+
+    async def get_members_version(self) -> int:
+        """Änderungszähler der Mitglieder (für das ETag der Liste)."""
+        return await self.db.scalar(members_version_query()) or 0
+
+    async def count_members(
+        self, criteria: Optional[MemberFilter] = None
+    ) -> Tuple[int, bool]:
+        """Exakte oder geschätzte Trefferzahl, siehe count_members()."""
+        return await self.db.run_sync(count_members, criteria)
+
+    async def create_member(self, member_data: MemberCreate) -> Member:
+        """Erstellt ein neues Mitglied in der Datenbank."""
+        member_dict = member_data.model_dump(exclude_none=True)
+        db_member = Member(**member_dict)
+        self.db.add(db_member)
+        delta = change_delta(new=member_dict)
+        await self.db.run_sync(apply_stats_delta, delta)
+        await self.db.commit()
+        await self.db.refresh(db_member)
+        return db_member
+
+    async def update_member(self, member: Member, update_data: MemberUpdate) -> Member:
+        """Aktualisiert die Attribute eines bestehenden Mitglieds."""
+        before = member_values(member)
+        for key, value in update_data.model_dump(exclude_unset=True).items():
+            setattr(member, key, value)
+        delta = change_delta(before, member_values(member))
+        await self.db.run_sync(apply_stats_delta, delta)
+
+        member_id = member.id
+        await self.db.commit()
+        member_cache.invalidate(member_id)
+        await self.db.refresh(member)
+        return member
+
+    async def bulk_update(self, bulk: MemberBulkUpdate) -> List[int]:
+        """Wendet `bulk.patch` auf alle ausgewählten Mitglieder an; liefert deren IDs."""
+        patch = bulk.patch.model_dump(exclude_unset=True)
+        if STATS_COLUMNS.intersection(patch):
+            clauses = selection_clauses(bulk, self.dialect)
+            await self.db.run_sync(
+                lambda db: apply_stats_delta(db, selection_delta(db, clauses, patch))
+            )
+        else:
+            await self.db.run_sync(bump_members_version)
+        ids = sorted(await self.db.scalars(build_bulk_update(bulk, self.dialect)))
+        await self.db.commit()
+        member_cache.invalidate_many(ids)
+        return ids
+
+    async def bulk_delete(self, selection: MemberSelection) -> List[int]:
+        """Löscht alle ausgewählten Mitglieder; liefert deren IDs."""
+        clauses = selection_clauses(selection, self.dialect)
+        await self.db.run_sync(
+            lambda db: apply_stats_delta(db, selection_delta(db, clauses))
+        )
+        ids = sorted(await self.db.scalars(build_bulk_delete(selection, self.dialect)))
+        await self.db.commit()
+        member_cache.invalidate_many(ids)
+        return ids
+
+    async def delete_member(self, member: Member) -> None:
+        """Löscht ein Mitglied."""
+        member_id = member.id
+        delta = change_delta(old=member_values(member))
+        await self.db.run_sync(apply_stats_delta, delta)
+        await self.db.delete(member)
+        await self.db.commit()
+        member_cache.invalidate(member_id)
 
 
 # Dependency, um den Service in den Routern zu injizieren
 def get_member_service(db: Session = Depends(get_db)) -> MemberService:
     return MemberService(db)
+
+
+# Für rein lesende Endpunkte (Replikat, falls konfiguriert)
+def get_read_member_service(db: Session = Depends(get_read_db)) -> MemberService:
+    return MemberService(db)
+
+
+def get_async_member_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncMemberService:
+    return AsyncMemberService(db)
@@ -0,0 +1,308 @@
+import asyncio
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy import (
+    Integer,
+    Select,
+    cast,
+    delete,
+    extract,
+    func,
+    insert,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.leader_lock import leader_lock
+from app.db import SessionLocal
+from app.models.member import Member
+from app.models.member_stats import MemberStats
+from app.models.table_version import TableVersion
+from app.schemas.member import MemberStatsRead
+
+StatsKey = Tuple[str, bool, int]
+# Gruppe -> [Anzahl, Betragssumme]
+StatsDelta = Dict[StatsKey, List[Any]]
+
+# Spalten, deren Änderung die Gruppe oder die Betragssumme verschiebt
+STATS_COLUMNS = frozenset({"city", "active", "birth_date", "total_amount_received"})
+
+# Leader-Sperre, damit nur ein Worker periodisch neu berechnet
+LOCK_NAME = "member-stats-recompute"
+
+_BIRTH_YEAR = cast(extract("year", Member.birth_date), Integer)
+
+
+def new_delta() -> StatsDelta:
+    return defaultdict(lambda: [0, Decimal(0)])
+
+
+def add_member_values(delta: StatsDelta, values: Mapping[str, Any], sign: int) -> None:
+    """
+    Zählt ein Mitglied (+1) bzw. zieht es ab (-1).
+
+    Fehlende Werte entsprechen den Server-Defaults (aktiv, Betrag 0).
+    """
+    active = values.get("active")
+    key = (
+        values["city"],
+        True if active is None else bool(active),
+        values["birth_date"].year,
+    )
+    entry = delta[key]
+    entry[0] += sign
+    entry[1] += sign * Decimal(str(values.get("total_amount_received") or 0))
+
+
+def member_values(member: Member) -> Dict[str, Any]:
+    return {column: getattr(member, column) for column in STATS_COLUMNS}
+
+
+def change_delta(
+    old: Optional[Mapping[str, Any]] = None, new: Optional[Mapping[str, Any]] = None
+) -> StatsDelta:
+    """Delta für ein einzelnes Mitglied: anlegen (new), löschen (old) oder ändern."""
+    delta = new_delta()
+    if old is not None:
+        add_member_values(delta, old, -1)
+    if new is not None:
+        add_member_values(delta, new, +1)
+    return delta
+
+
+def _group_query(clauses: list = ()) -> Select:
+    return (
+        select(
+            Member.city,
+            Member.active,
+            _BIRTH_YEAR,
+            func.count(),
+            func.coalesce(func.sum(Member.total_amount_received), 0),
+        )
+        .where(*clauses)
+        .group_by(Member.city, Member.active, _BIRTH_YEAR)
+    )
+
+
+def selection_delta(
+    db: Session, clauses: list, patch: Optional[Mapping[str, Any]] = None
+) -> StatsDelta:
+    """
+    Delta für eine Bulk-Auswahl aus einem GROUP BY über die betroffenen Mitglieder.
+
+    Ohne `patch` werden die Gruppen abgezogen (Löschen); mit `patch` werden
+    sie in die Gruppen mit den gepatchten Werten verschoben. Muss vor dem
+    UPDATE/DELETE laufen.
+    """
+    delta = new_delta()
+    for city, active, birth_year, count, amount in db.execute(_group_query(clauses)):
+        old = delta[(city, bool(active), int(birth_year))]
+        old[0] -= count
+        old[1] -= Decimal(str(amount))
+        if patch is None:
+            continue
+        new_key = (
+            patch.get("city", city),
+            bool(patch.get("active", active)),
+            patch["birth_date"].year if "birth_date" in patch else int(birth_year),
+        )
+        new = delta[new_key]
+        new[0] += count
+        if "total_amount_received" in patch:
+            new[1] += count * Decimal(str(patch["total_amount_received"]))
+        else:
+            new[1] += Decimal(str(amount))
+    return delta
+
+
+def _upsert(dialect: str, model: Any = MemberStats):
+    if dialect == "postgresql":
+        return postgresql.insert(model)
+    if dialect == "sqlite":
+        return sqlite.insert(model)
+    return None
+
+
+def bump_members_version(db: Session) -> None:
+    """
+    Zählt den Änderungszähler von `members` hoch (ohne Commit).
+
+    Die Zeile bleibt bis zum Commit gesperrt; gleichzeitige Schreibzugriffe auf
+    Mitglieder committen dadurch nacheinander, Leser warten nicht.
+    """
+    table_name = Member.__tablename__
+    statement = _upsert(db.get_bind().dialect.name, TableVersion)
+    if statement is not None:
+        db.execute(
+            statement.values(table_name=table_name, version=1).on_conflict_do_update(
+                index_elements=[TableVersion.table_name],
+                set_={"version": TableVersion.version + 1},
+            )
+        )
+        return
+    result = db.execute(
+        update(TableVersion)
+        .where(TableVersion.table_name == table_name)
+        .values(version=TableVersion.version + 1)
+    )
+    if result.rowcount == 0:
+        db.execute(insert(TableVersion).values(table_name=table_name, version=1))
+
+
+def members_version_query() -> Select:
+    """Liest den Änderungszähler von `members` (eine Zeile per Primärschlüssel)."""
+    return select(TableVersion.version).where(
+        TableVersion.table_name == Member.__tablename__
+    )
+
+
+def apply_stats_delta(db: Session, delta: StatsDelta) -> None:
+    """
+    Schreibt ein Delta per Upsert in `member_stats` (ohne Commit).
+
+    Alle Schreibzugriffe auf Mitglieder laufen hierüber, daher wird hier auch
+    der Änderungszähler von `members` hochgezählt, auch bei leerem Delta.
+    """
+    bump_members_version(db)
+    rows = [
+        {
+            "city": city,
+            "active": active,
+            "birth_year": birth_year,
+            "member_count": count,
+            "amount_total": amount,
+        }
+        for (city, active, birth_year), (count, amount) in delta.items()
+        if count or amount
+    ]
+    if not rows:
+        return
+
+    statement = _upsert(db.get_bind().dialect.name)
+    if statement is not None:
+        statement = statement.on_conflict_do_update(
+            index_elements=[
+                MemberStats.city,
+                MemberStats.active,
+                MemberStats.birth_year,
+            ],
+            set_={
+                "member_count": MemberStats.member_count
+                + statement.excluded.member_count,
+                "amount_total": MemberStats.amount_total
+                + statement.excluded.amount_total,
+            },
+        )
+        db.execute(statement, rows)
+        return
+
+    # Andere Backends: UPDATE, bei fehlender Gruppe INSERT
+    for row in rows:
+        result = db.execute(
+            update(MemberStats)
+            .where(
+                MemberStats.city == row["city"],
+                MemberStats.active == row["active"],
+                MemberStats.birth_year == row["birth_year"],
+            )
+            .values(
+                member_count=MemberStats.member_count + row["member_count"],
+                amount_total=MemberStats.amount_total + row["amount_total"],
+            )
+        )
+        if result.rowcount == 0:
+            db.execute(insert(MemberStats), [row])
+
+
+def recompute_member_stats(db: Session) -> int:
+    """
+    Baut `member_stats` komplett aus `members` neu auf (Drift-Reparatur).
+
+    Die Gruppen laufen über Python statt INSERT ... SELECT, damit `active`
+    über den Boolean-Typ normalisiert wird (SQLite speichert den Server-Default
+    als Text 'true'). Eine Transaktion; liefert die Anzahl Gruppen.
+
+    Vor dem Lesen werden Änderungszähler und `member_stats` gesperrt (in der
+    Reihenfolge von apply_stats_delta): laufende Schreibzugriffe committen
+    vorher, neue warten bis nach dem Commit. So geht kein Delta verloren und
+    keines wird doppelt gezählt.
+    """
+    bump_members_version(db)
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("LOCK TABLE member_stats IN SHARE ROW EXCLUSIVE MODE"))
+    delta = new_delta()
+    for city, active, birth_year, count, amount in db.execute(_group_query()):
+        entry = delta[(city, bool(active), int(birth_year))]
+        entry[0] += count
+        entry[1] += Decimal(str(amount))
+    db.execute(delete(MemberStats))
+    apply_stats_delta(db, delta)
+    db.commit()
+    return len(delta)
+
+
+def recompute_as_leader(
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> Optional[int]:
+    """
+    Wie recompute_member_stats, aber nur mit der Leader-Sperre.
+
+    Liefert None, wenn gerade ein anderer Worker neu berechnet.
+    """
+    with session_factory() as db:
+        with leader_lock(db.get_bind(), LOCK_NAME) as leader:
+            if not leader:
+                return None
+            return recompute_member_stats(db)
+
+
+async def recompute_periodically(interval_seconds: float) -> None:
+    """Lifespan-Task: repariert Drift (z. B. direkte SQL-Änderungen) periodisch."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            groups = await run_in_threadpool(recompute_as_leader)
+            if groups is not None:
+                print(f"📊 member_stats recomputed ({groups} groups)")
+        except Exception as e:
+            print(f"⚠️ member_stats recompute failed: {e}")
+
+
+def summarize(rows: Iterable[MemberStats], today: date) -> MemberStatsRead:
+    """Verdichtet die Gruppenzeilen zu den Kennzahlen der API."""
+    stats = MemberStatsRead()
+    amount = Decimal(0)
+    by_city: Dict[str, int] = defaultdict(int)
+    by_age: Dict[int, int] = defaultdict(int)
+    for row in rows:
+        if row.member_count <= 0:
+            continue
+        stats.total += row.member_count
+        if row.active:
+            stats.active += row.member_count
+        else:
+            stats.inactive += row.member_count
+        amount += Decimal(str(row.amount_total))
+        by_city[row.city] += row.member_count
+        # Alter, das im laufenden Jahr erreicht wird, in Zehnerschritten
+        decade = max(0, today.year - row.birth_year) // 10 * 10
+        by_age[decade] += row.member_count
+
+    stats.amount_total = float(amount)
+    stats.by_city = dict(sorted(by_city.items()))
+    stats.age_distribution = {
+        f"{decade}-{decade + 9}": by_age[decade] for decade in sorted(by_age)
+    }
+    return stats
+
+
+def read_member_stats(db: Session, today: Optional[date] = None) -> MemberStatsRead:
+    rows = db.scalars(select(MemberStats).where(MemberStats.member_count > 0))
+    return summarize(rows, today or date.today())
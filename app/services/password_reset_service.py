@@ -1,19 +1,22 @@
-import logging
 import os
 from datetime import datetime, timedelta, timezone
-from typing import Optional
 
-from fastapi import BackgroundTasks, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import Depends, HTTPException, status
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+from starlette.concurrency import run_in_threadpool
 
+from app.core.principal_cache import principal_cache
+from app.core.read_your_writes import read_your_writes
 from app.core.security import generate_reset_token, get_password_hash, hash_reset_token
-from app.db import get_db
+from app.db import get_async_db, get_db
 from app.models.password_reset_token import PasswordResetToken
 from app.models.user import User
 from app.schemas.common import PasswordReset
+from app.services.email_outbox import enqueue_email, password_reset_email
 
 ACCESS_TOKEN_EXPIRE_MINUTES = 15
-logger = logging.getLogger(__name__)
 
 
 class PasswordResetService:
@@ -24,12 +27,11 @@ class PasswordResetService:
     def __init__(self, db: Session):
         self.db = db
 
-    def initiate_reset(
-        self, email: str, background_tasks: Optional[BackgroundTasks] = None
-    ) -> str:
+    def initiate_reset(self, email: str) -> str:
         """
-        Startet den Reset-Prozess: generiert Token, speichert Hash und simuliert E-Mail-Versand.
-        Gibt den Klartext-Token (nur im Testmodus) zurück.
+        Startet den Reset-Prozess: generiert Token, speichert Hash und legt die
+        Reset-Mail in der Outbox ab (eine Transaktion; versendet wird sie vom
+        Outbox-Worker). Gibt den Klartext-Token (nur im Testmodus) zurück.
         """
         user = self.db.query(User).filter(User.email == email).first()
 
@@ -48,22 +50,15 @@ class PasswordResetService:
         self.db.query(PasswordResetToken).filter(
             PasswordResetToken.user_id == user.id
         ).delete()
-        self.db.commit()
 
-        # Neuen Token speichern
-        new_token = PasswordResetToken(
-            hashed_token=hashed_token, user_id=user.id, expires_at=expires_at
+        # Neuen Token und Reset-Mail gemeinsam speichern
+        self.db.add(
+            PasswordResetToken(
+                hashed_token=hashed_token, user_id=user.id, expires_at=expires_at
+            )
         )
-        self.db.add(new_token)
+        enqueue_email(self.db, user.email, *password_reset_email(cleartext_token))
         self.db.commit()
-        self.db.refresh(new_token)
-
-        # Simulation: E-Mail-Versand
-        if background_tasks:
-            background_tasks.add_task(
-                logger.info,
-                f"SIMULATED EMAIL: Password reset link for {user.email}: /auth/reset-password?token={cleartext_token}",
-            )
 
         # Nur für lokale Tests/Debugging: Den echten Token zurückgeben
         if os.getenv("TESTING") == "1":
@@ -104,15 +99,114 @@ class PasswordResetService:
         user = reset_token_entry.user
         new_hashed_password = get_password_hash(reset_data.new_password)
         user.hashed_password = new_hashed_password
+        # Alle vor dem Reset ausgestellten Access-Tokens entwerten
+        user.bump_token_version()
 
         # Token löschen
         self.db.delete(reset_token_entry)
         self.db.commit()
         self.db.refresh(user)
 
+        # Gecachten Principal verwerfen, damit der nächste Request neu lädt
+        principal_cache.invalidate_user(user.username)
+        read_your_writes.mark_subject(user.username)
+
+        return user
+
+
+class AsyncPasswordResetService:
+    """
+    Async-Variante von PasswordResetService für DATABASE_MODE=async.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def initiate_reset(self, email: str) -> str:
+        """Wie PasswordResetService.initiate_reset."""
+        user = (
+            await self.db.execute(select(User).where(User.email == email))
+        ).scalar_one_or_none()
+
+        if not user:
+            return "If the email exists, a reset link has been sent."
+
+        cleartext_token = generate_reset_token()
+        expires_at = datetime.now(timezone.utc) + timedelta(
+            minutes=ACCESS_TOKEN_EXPIRE_MINUTES
+        )
+
+        await self.db.execute(
+            delete(PasswordResetToken).where(PasswordResetToken.user_id == user.id)
+        )
+        self.db.add(
+            PasswordResetToken(
+                hashed_token=hash_reset_token(cleartext_token),
+                user_id=user.id,
+                expires_at=expires_at,
+            )
+        )
+        enqueue_email(self.db, user.email, *password_reset_email(cleartext_token))
+        await self.db.commit()
+
+        if os.getenv("TESTING") == "1":
+            return cleartext_token
+
+        return "If the email exists, a reset link has been sent."
+
+    async def finalize_reset(self, reset_data: PasswordReset) -> User:
+        """Wie PasswordResetService.finalize_reset."""
+        reset_token_entry = (
+            await self.db.execute(
+                select(PasswordResetToken)
+                .options(joinedload(PasswordResetToken.user))
+                .where(
+                    PasswordResetToken.hashed_token
+                    == hash_reset_token(reset_data.token)
+                )
+            )
+        ).scalar_one_or_none()
+
+        if not reset_token_entry:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Ungültiger oder abgelaufener Reset-Link.",
+            )
+
+        if reset_token_entry.expires_at.replace(tzinfo=timezone.utc) < datetime.now(
+            timezone.utc
+        ):
+            await self.db.delete(reset_token_entry)
+            await self.db.commit()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Ungültiger oder abgelaufener Reset-Link.",
+            )
+
+        user = reset_token_entry.user
+        # PBKDF2 darf den Event-Loop nicht blockieren
+        user.hashed_password = await run_in_threadpool(
+            get_password_hash, reset_data.new_password
+        )
+        user.bump_token_version()
+
+        await self.db.delete(reset_token_entry)
+        await self.db.commit()
+        await self.db.refresh(user)
+
+        principal_cache.invalidate_user(user.username)
+
+        read_your_writes.mark_subject(user.username)
+
         return user
 
 
 # Dependency, um den Service in den Routern zu injizieren
 def get_password_reset_service(db: Session = Depends(get_db)) -> PasswordResetService:
     return PasswordResetService(db)
+
+
+def get_async_password_reset_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncPasswordResetService:
+    return AsyncPasswordResetService(db)
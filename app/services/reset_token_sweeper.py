@@ -0,0 +1,171 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import ScalarSelect, delete, select
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.leader_lock import leader_lock
+from app.db import SessionLocal
+from app.models.email_outbox import EmailOutbox
+from app.models.password_reset_token import PasswordResetToken
+
+LOCK_NAME = "reset-token-sweeper"
+
+
+class ResetTokenSweeper:
+    """
+    Löscht abgelaufene Passwort-Reset-Tokens blockweise, danach versendete
+    oder aufgegebene Outbox-Nachrichten älter als OUTBOX_RETENTION_DAYS.
+
+    Jeder Block ist ein eigenes DELETE ... WHERE id IN (... LIMIT n) über den
+    Index auf `expires_at` bzw. (status, next_attempt_at) und wird sofort
+    committet, sodass Sperren kurz bleiben. Die Zähler gelten pro Worker
+    (/admin/metrics) und umfassen beide Tabellen.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.runs = 0
+            self.skipped = 0
+            self.batches = 0
+            self.rows_purged = 0
+            self.last_run_purged = 0
+            self.last_run_at: Optional[datetime] = None
+            self.total_batch_seconds = 0.0
+            self.last_batch_seconds = 0.0
+            self.max_batch_seconds = 0.0
+
+    def _record_batch(self, seconds: float, purged: int) -> None:
+        with self._lock:
+            self.batches += 1
+            self.rows_purged += purged
+            self.total_batch_seconds += seconds
+            self.last_batch_seconds = seconds
+            self.max_batch_seconds = max(self.max_batch_seconds, seconds)
+
+    def _delete_batch(self, db: Session, model: Any, ids: ScalarSelect) -> int:
+        started = time.perf_counter()
+        purged = db.execute(
+            delete(model)
+            .where(model.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.commit()
+        self._record_batch(time.perf_counter() - started, purged)
+        return purged
+
+    def sweep_batch(self, db: Session, now: datetime, batch_size: int) -> int:
+        """Löscht höchstens `batch_size` abgelaufene Tokens (mit Commit)."""
+        expired_ids = (
+            select(PasswordResetToken.id)
+            .where(PasswordResetToken.expires_at < now)
+            .order_by(PasswordResetToken.expires_at)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        return self._delete_batch(db, PasswordResetToken, expired_ids)
+
+    def purge_outbox_batch(self, db: Session, cutoff: datetime, batch_size: int) -> int:
+        """Löscht höchstens `batch_size` vor `cutoff` erledigte Nachrichten."""
+        done_ids = (
+            select(EmailOutbox.id)
+            .where(
+                EmailOutbox.status.in_(("sent", "failed")),
+                EmailOutbox.next_attempt_at < cutoff,
+            )
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        return self._delete_batch(db, EmailOutbox, done_ids)
+
+    def sweep(
+        self,
+        db: Session,
+        batch_size: Optional[int] = None,
+        max_batches: Optional[int] = None,
+    ) -> int:
+        """
+        Löscht je Tabelle Block für Block, bis ein Block nicht mehr voll ist.
+
+        `max_batches` begrenzt die Blöcke je Tabelle.
+        """
+        batch_size = batch_size or settings.RESET_TOKEN_SWEEP_BATCH_SIZE
+        now = datetime.now(timezone.utc)
+        outbox_cutoff = now - timedelta(days=settings.OUTBOX_RETENTION_DAYS)
+        total = 0
+        for purge_batch, cutoff in (
+            (self.sweep_batch, now),
+            (self.purge_outbox_batch, outbox_cutoff),
+        ):
+            batches = 0
+            while max_batches is None or batches < max_batches:
+                purged = purge_batch(db, cutoff, batch_size)
+                total += purged
+                batches += 1
+                if purged < batch_size:
+                    break
+        with self._lock:
+            self.runs += 1
+            self.last_run_purged = total
+            self.last_run_at = now
+        return total
+
+    def sweep_as_leader(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        **kwargs: Any,
+    ) -> Optional[int]:
+        """
+        Wie `sweep`, aber nur wenn dieser Prozess die Leader-Sperre bekommt.
+
+        Liefert None, wenn gerade ein anderer Worker aufräumt.
+        """
+        with session_factory() as db:
+            with leader_lock(db.get_bind(), LOCK_NAME) as leader:
+                if not leader:
+                    with self._lock:
+                        self.skipped += 1
+                    return None
+                return self.sweep(db, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """Gelöschte Zeilen und Blocklatenz für /admin/metrics."""
+        return {
+            "runs": self.runs,
+            "skipped_not_leader": self.skipped,
+            "batches": self.batches,
+            "rows_purged": self.rows_purged,
+            "last_run_purged": self.last_run_purged,
+            "last_run_at": self.last_run_at,
+            "avg_batch_ms": (
+                round(self.total_batch_seconds / self.batches * 1000, 3)
+                if self.batches
+                else 0.0
+            ),
+            "last_batch_ms": round(self.last_batch_seconds * 1000, 3),
+            "max_batch_ms": round(self.max_batch_seconds * 1000, 3),
+        }
+
+
+reset_token_sweeper = ResetTokenSweeper()
+
+
+async def sweep_periodically(interval_seconds: float) -> None:
+    """Lifespan-Task: räumt Reset-Tokens und die Outbox auf (ein Worker je Lauf)."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            purged = await run_in_threadpool(reset_token_sweeper.sweep_as_leader)
+            if purged:
+                print(f"🧹 Purged {purged} expired reset tokens / old outbox messages")
+        except Exception as e:
+            print(f"⚠️ Reset token sweep failed: {e}")
@@ -0,0 +1,132 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.principal_cache import principal_cache
+from app.core.read_your_writes import read_your_writes
+from app.core.revocation import revocation_filter
+from app.db import SessionLocal, get_db
+from app.models.revoked_token import RevokedToken
+from app.models.user import User
+
+
+def _as_timestamp(value: datetime) -> float:
+    # SQLite liefert naive Datetimes zurück; gespeichert wird immer UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class TokenRevocationService:
+    """
+    Kapselt Logout/Revoke-All und den Abgleich der In-Memory-Sperrliste.
+
+    Der Abgleich läuft im Hintergrund (sync_periodically), die Prüfung je
+    Request nur gegen den Speicher.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def is_revoked(jti: str) -> bool:
+        """Prüft ein Token gegen die In-Memory-Sperrliste (ohne DB-Zugriff)."""
+        return revocation_filter.is_revoked(jti)
+
+    @staticmethod
+    def sync_due() -> bool:
+        """True, wenn der letzte Abgleich länger als REVOCATION_SYNC_SECONDS her ist."""
+        elapsed = time.monotonic() - revocation_filter.last_synced_at
+        return elapsed >= settings.REVOCATION_SYNC_SECONDS
+
+    def sync_filter(self, force: bool = False) -> None:
+        """Lädt neu gesperrte JTIs (inkrementell über die ID) in den Filter."""
+        if not force and not self.sync_due():
+            return
+        now = time.monotonic()
+
+        if now - revocation_filter.last_pruned_at >= settings.REVOCATION_PRUNE_SECONDS:
+            # Vollständiger Neuabgleich fängt auch spät committete Zeilen mit kleiner ID
+            self.prune_expired()
+            revocation_filter.last_synced_id = 0
+
+        rows = (
+            self.db.query(RevokedToken.id, RevokedToken.jti, RevokedToken.expires_at)
+            .filter(RevokedToken.id > revocation_filter.last_synced_id)
+            .filter(RevokedToken.expires_at > datetime.now(timezone.utc))
+            .order_by(RevokedToken.id)
+            .all()
+        )
+        revocation_filter.add_many(
+            (row.jti, _as_timestamp(row.expires_at)) for row in rows
+        )
+        if rows:
+            revocation_filter.last_synced_id = rows[-1].id
+        revocation_filter.last_synced_at = now
+
+    def prune_expired(self) -> int:
+        """Entfernt abgelaufene Sperreinträge aus Speicher und Datenbank."""
+        revocation_filter.prune(time.time())
+        deleted = (
+            self.db.query(RevokedToken)
+            .filter(RevokedToken.expires_at <= datetime.now(timezone.utc))
+            .delete(synchronize_session=False)
+        )
+        self.db.commit()
+        return deleted
+
+    def revoke_token(self, jti: str, user_id: int, expires_at: datetime) -> None:
+        """Sperrt ein einzelnes Token (Logout)."""
+        exists = self.db.query(RevokedToken.id).filter(RevokedToken.jti == jti).first()
+        if not exists:
+            self.db.add(RevokedToken(jti=jti, user_id=user_id, expires_at=expires_at))
+            self.db.commit()
+        revocation_filter.add(jti, _as_timestamp(expires_at))
+
+    def revoke_all_for_user(self, user_id: int) -> None:
+        """Entwertet alle bisher ausgestellten Tokens über die Token-Version."""
+        user = self.db.query(User).filter(User.id == user_id).first()
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            )
+        user.bump_token_version()
+        self.db.commit()
+        principal_cache.invalidate_user(user.username)
+        read_your_writes.mark_subject(user.username)
+
+
+def sync_revocations(
+    session_factory: Callable[[], Session] = SessionLocal, force: bool = False
+) -> None:
+    """Gleicht die Sperrliste dieses Workers in einer eigenen Session ab."""
+    with session_factory() as db:
+        TokenRevocationService(db).sync_filter(force=force)
+
+
+async def sync_periodically(interval_seconds: float) -> None:
+    """
+    Lifespan-Task: lädt neue Sperren und räumt abgelaufene ab (je Worker).
+
+    Tokens, die ein anderer Worker gesperrt hat, werden so spätestens nach
+    REVOCATION_SYNC_SECONDS auch hier abgewiesen.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await run_in_threadpool(sync_revocations)
+        except Exception as e:
+            print(f"⚠️ Revocation sync failed: {e}")
+
+
+# Dependency, um den Service in den Routern zu injizieren
+def get_token_revocation_service(
+    db: Session = Depends(get_db),
+) -> TokenRevocationService:
+    return TokenRevocationService(db)
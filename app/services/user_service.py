@@ -1,9 +1,14 @@
 from fastapi import HTTPException, status
+from sqlalchemy import select
 from sqlalchemy.exc import (
     NoResultFound,  # Neu hinzugefügt für präzisere Fehlerbehandlung
 )
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from app.core.principal_cache import principal_cache
+from app.core.read_your_writes import read_your_writes
 from app.core.security import get_password_hash
 from app.models.role import Role
 from app.models.user import User
@@ -70,6 +75,78 @@ class UserService:
         db.refresh(new_user)
         return new_user
 
+    # ----------------------------------------------------
+    # Rollenwechsel
+    # ----------------------------------------------------
+    def assign_role(self, db: Session, user: User, role_name: str) -> User:
+        """Weist dem Benutzer eine andere Rolle zu und verwirft den Principal-Cache."""
+        try:
+            role = db.query(Role).filter(Role.name == role_name).one()
+        except NoResultFound:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Rolle '{role_name}' nicht gefunden.",
+            )
+
+        user.role = role
+        # Token mit der alten Rolle im `role`-Claim entwerten
+        user.bump_token_version()
+        db.commit()
+        db.refresh(user)
+
+        principal_cache.invalidate_user(user.username)
+
+        read_your_writes.mark_subject(user.username)
+        return user
+
+
+class AsyncUserService:
+    """Async-Variante von UserService für DATABASE_MODE=async."""
+
+    async def get_default_role(self, db: AsyncSession) -> Role:
+        """Sucht die Standardrolle ('User') in der Datenbank."""
+        try:
+            return (
+                await db.execute(select(Role).where(Role.name == "User"))
+            ).scalar_one()
+        except NoResultFound:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Standardrolle 'User' nicht in der Datenbank gefunden. Bitte Datenbank-Seeding prüfen.",
+            )
+
+    async def create_user(self, db: AsyncSession, user_data: UserCreate) -> User:
+        """
+        Erstellt einen neuen Benutzer und weist ihm die Standardrolle zu.
+
+        Gleicher API-Vertrag wie POST /auth/register im sync-Modus (400 bei
+        vergebenem Benutzernamen), damit DATABASE_MODE das Verhalten nicht ändert.
+        """
+        existing_user = (
+            await db.execute(select(User.id).where(User.username == user_data.username))
+        ).first()
+        if existing_user:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Username is already taken",
+            )
+
+        default_role = await self.get_default_role(db)
+        # PBKDF2 darf den Event-Loop nicht blockieren
+        hashed_pw = await run_in_threadpool(get_password_hash, user_data.password)
+
+        new_user = User(
+            username=user_data.username,
+            email=user_data.email,
+            hashed_password=hashed_pw,
+            role_id=default_role.id,
+        )
+        db.add(new_user)
+        await db.commit()
+        await db.refresh(new_user)
+        return new_user
+
 
 # Globales Service-Objekt für Dependency Injection
 user_service = UserService()
+async_user_service = AsyncUserService()
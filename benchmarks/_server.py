@@ -0,0 +1,151 @@
+"""
+Shared helpers for the benchmark scripts in this directory.
+
+Each benchmark boots a real uvicorn process against a throw-away SQLite file so
+the numbers include the full HTTP/threadpool path, not just the service layer.
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import httpx
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-not-for-production")
+
+from app.core.security import get_password_hash  # noqa: E402
+from app.db import Base  # noqa: E402
+from app.models import Member, Role, User  # noqa: E402
+
+ADMIN_USERNAME = "bench_admin"
+ADMIN_PASSWORD = "bench-admin-pass"
+
+
+def temp_sqlite_url() -> str:
+    fd, path = tempfile.mkstemp(prefix="csc-bench-", suffix=".db")
+    os.close(fd)
+    return f"sqlite:///{path}"
+
+
+def prepare_database(url: str, members: int = 1000, users: int = 1) -> None:
+    """Create the schema and insert an admin, `users` plain users and members."""
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        session.add_all(
+            [Role(id=1, name="Admin"), Role(id=2, name="User", description="")]
+        )
+        password_hash = get_password_hash(ADMIN_PASSWORD)
+        session.add(
+            User(
+                username=ADMIN_USERNAME,
+                email="bench_admin@example.com",
+                hashed_password=password_hash,
+                role_id=1,
+            )
+        )
+        for i in range(users):
+            session.add(
+                User(
+                    username=f"bench_user_{i}",
+                    email=f"bench_user_{i}@example.com",
+                    hashed_password=password_hash,
+                    role_id=2,
+                )
+            )
+        session.commit()
+        if members:
+            session.execute(insert(Member), member_rows(members))
+            session.commit()
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def member_rows(count: int, offset: int = 0) -> List[Dict]:
+    return [
+        {
+            "name": f"Bench Member {i:07d}",
+            "email": f"bench{i}@example.com",
+            "birth_date": date(1960 + i % 40, 1 + i % 12, 1 + i % 28),
+            "address": f"Benchstraße {i}",
+            "city": ("Berlin", "Hamburg", "München", "Köln", "Leipzig")[i % 5],
+            "postal_code": f"{10000 + i % 89999:05d}",
+            "active": i % 7 != 0,
+        }
+        for i in range(offset, offset + count)
+    ]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@contextmanager
+def running_server(
+    database_url: str, env: Optional[Dict[str, str]] = None
+) -> Iterator[str]:
+    """Start uvicorn in a subprocess and yield its base URL."""
+    port = free_port()
+    proc_env = {**os.environ, "DATABASE_URL": database_url, **(env or {})}
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=ROOT,
+        env=proc_env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(100):
+            try:
+                httpx.get(base_url + "/", timeout=1)
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+        else:
+            raise RuntimeError("uvicorn did not start")
+        yield base_url
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def login(base_url: str, username: str = ADMIN_USERNAME) -> str:
+    r = httpx.post(
+        base_url + "/auth/login",
+        data={"username": username, "password": ADMIN_PASSWORD},
+        timeout=30,
+    )
+    r.raise_for_status()
+    return r.json()["access_token"]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
@@ -0,0 +1,74 @@
+"""
+Throughput and latency of concurrent GET /members/members/ reads on one worker,
+DATABASE_MODE=sync (threadpool handlers, pysqlite/psycopg2) vs.
+DATABASE_MODE=async (async handlers, aiosqlite/asyncpg).
+
+Usage:
+    python benchmarks/bench_async_mode.py [--concurrency 500] [--requests 5000]
+    python benchmarks/bench_async_mode.py --database-url postgresql://u:p@host/db
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from _server import login, percentile, prepare_database, running_server, temp_sqlite_url
+
+
+async def fire(base_url: str, token: str, concurrency: int, total: int) -> dict:
+    samples = []
+    errors = 0
+    remaining = iter(range(total))
+    limits = httpx.Limits(max_connections=concurrency)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async with httpx.AsyncClient(
+        base_url=base_url, headers=headers, limits=limits, timeout=120
+    ) as client:
+
+        async def worker() -> None:
+            nonlocal errors
+            for _ in remaining:
+                started = time.perf_counter()
+                response = await client.get("/members/members/", params={"limit": 20})
+                samples.append((time.perf_counter() - started) * 1000)
+                if response.status_code != 200:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "rps": total / elapsed,
+        "errors": errors,
+        "p50_ms": percentile(samples, 50),
+        "p99_ms": percentile(samples, 99),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument(
+        "--database-url", default=None, help="sync URL (default: temp SQLite file)"
+    )
+    args = parser.parse_args()
+
+    database_url = args.database_url or temp_sqlite_url()
+    prepare_database(database_url, members=1000)
+
+    for mode in ("sync", "async"):
+        with running_server(database_url, {"DATABASE_MODE": mode}) as base_url:
+            token = login(base_url)
+            result = asyncio.run(fire(base_url, token, args.concurrency, args.requests))
+        print(
+            f"{mode:<6} rps={result['rps']:8.1f} errors={result['errors']:>5} "
+            f"p50={result['p50_ms']:8.1f} ms  p99={result['p99_ms']:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
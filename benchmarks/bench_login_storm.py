@@ -0,0 +1,102 @@
+"""
+p99 latency of GET /members/members/ while a login storm is running.
+
+Runs the same scenario twice: PBKDF2 inline in FastAPI's threadpool
+(PASSWORD_HASH_WORKERS=0, the previous behaviour) and with the dedicated
+hashing process pool.
+
+Usage:
+    python benchmarks/bench_login_storm.py [--logins 64] [--duration 10] [--workers 2]
+"""
+
+import argparse
+import threading
+import time
+from collections import Counter
+
+import httpx
+from _server import (
+    ADMIN_PASSWORD,
+    login,
+    percentile,
+    prepare_database,
+    running_server,
+    temp_sqlite_url,
+)
+
+
+def run_scenario(database_url: str, env: dict, logins: int, duration: float) -> dict:
+    # Ohne Rate-Limit: sonst beantwortet der Server fast alle Logins mit einem
+    # billigen 429 und es wird keine PBKDF2-Last erzeugt
+    env = {**env, "RATE_LIMIT_ENABLED": "false"}
+    with running_server(database_url, env) as base_url:
+        headers = {"Authorization": f"Bearer {login(base_url)}"}
+        stop = threading.Event()
+        statuses = Counter()
+        statuses_lock = threading.Lock()
+
+        def storm(i: int) -> None:
+            with httpx.Client(base_url=base_url, timeout=60) as client:
+                while not stop.is_set():
+                    r = client.post(
+                        "/auth/login",
+                        data={
+                            "username": f"bench_user_{i % 10}",
+                            "password": ADMIN_PASSWORD,
+                        },
+                    )
+                    with statuses_lock:
+                        statuses[r.status_code] += 1
+
+        threads = [threading.Thread(target=storm, args=(i,)) for i in range(logins)]
+        for t in threads:
+            t.start()
+
+        samples = []
+        deadline = time.monotonic() + duration
+        with httpx.Client(base_url=base_url, timeout=60, headers=headers) as client:
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                client.get("/members/members/", params={"limit": 50}).raise_for_status()
+                samples.append((time.perf_counter() - started) * 1000)
+
+        stop.set()
+        for t in threads:
+            t.join()
+
+    assert set(statuses) == {200}, f"login storm got non-200 responses: {statuses}"
+    return {
+        "logins": statuses[200],
+        "reads": len(samples),
+        "p50_ms": percentile(samples, 50),
+        "p99_ms": percentile(samples, 99),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=64, help="concurrent login loops")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--workers", type=int, default=2, help="hash pool size")
+    args = parser.parse_args()
+
+    database_url = temp_sqlite_url()
+    prepare_database(database_url, members=1000, users=10)
+
+    scenarios = [
+        ("before (inline PBKDF2)", {"PASSWORD_HASH_WORKERS": "0"}),
+        (
+            f"after (process pool, {args.workers} workers)",
+            {"PASSWORD_HASH_WORKERS": str(args.workers)},
+        ),
+    ]
+    for label, env in scenarios:
+        result = run_scenario(database_url, env, args.logins, args.duration)
+        print(
+            f"{label:<36} logins={result['logins']:>6} reads={result['reads']:>6} "
+            f"p50={result['p50_ms']:8.1f} ms  p99={result['p99_ms']:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Rows per second for POST /members/members/import (CSV and NDJSON) compared to
+one POST /members/members/ per member.
+
+Usage:
+    python benchmarks/bench_member_import.py [--rows 50000] [--single 500]
+"""
+
+import argparse
+import csv
+import io
+import json
+import time
+
+import httpx
+from _server import (
+    login,
+    member_rows,
+    prepare_database,
+    running_server,
+    temp_sqlite_url,
+)
+
+FIELDS = ["name", "email", "birth_date", "address", "city", "postal_code"]
+
+
+def payloads(count: int, offset: int):
+    for row in member_rows(count, offset):
+        yield {field: str(row[field]) for field in FIELDS}
+
+
+def ndjson_body(count: int, offset: int) -> bytes:
+    return "".join(json.dumps(p) + "\n" for p in payloads(count, offset)).encode()
+
+
+def csv_body(count: int, offset: int) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=FIELDS)
+    writer.writeheader()
+    writer.writerows(payloads(count, offset))
+    return buffer.getvalue().encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--single", type=int, default=500)
+    args = parser.parse_args()
+
+    database_url = temp_sqlite_url()
+    prepare_database(database_url, members=0)
+
+    with running_server(database_url) as base_url:
+        headers = {"Authorization": f"Bearer {login(base_url)}"}
+        with httpx.Client(base_url=base_url, headers=headers, timeout=600) as client:
+            started = time.perf_counter()
+            for payload in payloads(args.single, offset=0):
+                client.post("/members/members/", json=payload).raise_for_status()
+            elapsed = time.perf_counter() - started
+            print(
+                f"{'single POST':<14} rows={args.single:>8} rps={args.single / elapsed:10.1f}"
+            )
+
+            offset = args.single
+            for label, body, filename in (
+                ("import ndjson", ndjson_body, "members.ndjson"),
+                ("import csv", csv_body, "members.csv"),
+            ):
+                data = body(args.rows, offset)
+                offset += args.rows
+                started = time.perf_counter()
+                response = client.post(
+                    "/members/members/import", files={"file": (filename, data)}
+                )
+                response.raise_for_status()
+                elapsed = time.perf_counter() - started
+                created = response.json()["created"]
+                print(f"{label:<14} rows={created:>8} rps={created / elapsed:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
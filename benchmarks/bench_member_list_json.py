@@ -0,0 +1,98 @@
+"""
+Milliseconds per 1000 members for encoding the GET /members/members/ response:
+FastAPI's standard path (response_model validation + serialization +
+json.dumps in JSONResponse) vs. the fast path (dump_member_list, one
+pydantic-core pass straight to bytes).
+
+The first table times the encoding alone on loaded ORM objects; the second
+times full HTTP requests with limit=1000 against uvicorn with
+FAST_JSON_RESPONSES=false / true.
+
+Usage:
+    python benchmarks/bench_member_list_json.py [--members 1000] [--repeat 50]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import httpx
+from _server import login, prepare_database, running_server, temp_sqlite_url
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.models import Member
+from app.schemas.member import MemberRead, dump_member_list
+
+FIELD = create_response_field(name="members", type_=List[MemberRead])
+
+
+def standard_encode(members) -> bytes:
+    content = asyncio.run(
+        serialize_response(field=FIELD, response_content=members, is_coroutine=False)
+    )
+    return JSONResponse(content).body
+
+
+def time_per_thousand(encode, members, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        encode(members)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples) * 1000 / len(members)
+
+
+def time_http(database_url: str, fast: bool, members: int, repeat: int) -> float:
+    env = {"FAST_JSON_RESPONSES": "true" if fast else "false"}
+    with running_server(database_url, env=env) as base_url:
+        headers = {"Authorization": f"Bearer {login(base_url)}"}
+        with httpx.Client(base_url=base_url, headers=headers, timeout=60) as client:
+            samples = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                client.get(
+                    "/members/members/", params={"limit": members}
+                ).raise_for_status()
+                samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples) * 1000 / members
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    database_url = temp_sqlite_url()
+    prepare_database(database_url, members=args.members)
+
+    engine = create_engine(database_url)
+    with Session(engine) as session:
+        members = list(session.scalars(select(Member).limit(args.members)))
+        assert standard_encode(members) == dump_member_list(members)
+        print("encoding only (ms per 1000 members)")
+        for label, encode in (
+            ("standard", standard_encode),
+            ("fast", dump_member_list),
+        ):
+            print(
+                f"  {label:<9} {time_per_thousand(encode, members, args.repeat):8.2f}"
+            )
+    engine.dispose()
+
+    print(f"HTTP GET limit={args.members} (ms per 1000 members)")
+    for label, fast in (("standard", False), ("fast", True)):
+        print(
+            f"  {label:<9} "
+            f"{time_http(database_url, fast, args.members, args.repeat):8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Latency of the substring name filter of MemberService.get_members at growing
+table sizes: plain leading-wildcard ILIKE (sequential scan) vs. the trigram
+path (FTS5 trigram table on SQLite, pg_trgm GIN index on Postgres).
+
+Runs on the service layer against a throw-away SQLite file, or against
+--database-url (an empty Postgres database; its tables are recreated).
+
+Usage:
+    python benchmarks/bench_member_search.py [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import statistics
+import time
+
+from _server import member_rows, prepare_database, temp_sqlite_url
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Member
+from app.services.member_service import build_members_query
+
+TERMS = ["0004217", "Member 00", "nonexistent"]
+
+
+def time_query(session, query, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        session.scalars(query).all()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    database_url = args.database_url or temp_sqlite_url()
+    prepare_database(database_url, members=0)
+    engine = create_engine(database_url)
+    session = sessionmaker(bind=engine)()
+    dialect = engine.dialect.name
+
+    loaded = 0
+    for size in sorted(args.sizes):
+        while loaded < size:
+            batch = min(50_000, size - loaded)
+            session.execute(insert(Member), member_rows(batch, offset=loaded))
+            loaded += batch
+        session.commit()
+
+        for term in TERMS:
+            plain = time_query(
+                session, build_members_query(name=term, limit=100), args.repeat
+            )
+            indexed = time_query(
+                session,
+                build_members_query(name=term, limit=100, dialect=dialect),
+                args.repeat,
+            )
+            print(
+                f"members={size:>9} term={term!r:<14} "
+                f"ilike={plain:9.2f} ms  trigram={indexed:9.2f} ms"
+            )
+
+    session.close()
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,13 +11,23 @@ from sqlalchemy.pool import StaticPool
 
 # Ensure project root is visible for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
+# Kein Hintergrund-Abgleich gegen die konfigurierte DB; Tests gleichen selbst ab
+os.environ.setdefault("REVOCATION_SYNC_SECONDS", "0")
+# PBKDF2 inline rechnen; der Prozesspool wird in test_hashing_pool gezielt getestet
+os.environ.setdefault("PASSWORD_HASH_WORKERS", "0")
+
+from app.core.member_cache import member_cache, member_count_cache
+from app.core.principal_cache import principal_cache
+from app.core.rate_limit import rate_limiter
+from app.core.read_your_writes import read_your_writes
+from app.core.revocation import revocation_filter
 from app.core.security import get_password_hash
 from app.db import Base, get_db
 from app.main import app
 from app.models.member import Member
 from app.models.role import Role
 from app.models.user import User
+from app.services.reset_token_sweeper import reset_token_sweeper
 
 # -------------------------------------------------------
 # Test database setup (SQLite in-memory)
@@ -86,6 +96,22 @@ def db_session() -> Generator[Session, None, None]:
         connection.close()
 
 
+@pytest.fixture(autouse=True)
+def reset_in_process_state() -> Generator[None, None, None]:
+    """
+    Tests delete and recreate users with identical usernames, so per-worker
+    caches must not leak state from one test into the next.
+    """
+    principal_cache.clear()
+    revocation_filter.clear()
+    rate_limiter.clear()
+    read_your_writes.clear()
+    member_cache.clear()
+    member_count_cache.clear()
+    reset_token_sweeper.clear()
+    yield
+
+
 # -------------------------------------------------------
 # Dependency override for FastAPI (TestClient -> test DB)
 # -------------------------------------------------------
@@ -147,6 +173,35 @@ def create_test_user_direct(
     return user
 
 
+# -------------------------------------------------------
+# Shared test helpers
+# -------------------------------------------------------
+
+
+def auth_headers(token: str, **extra: str) -> dict:
+    """Bearer header for `token`, optionally with further headers."""
+    return {"Authorization": f"Bearer {token}", **extra}
+
+
+def login(client: TestClient, username: str, password: str) -> str:
+    """Log in via the real endpoint and return the access token."""
+    response = client.post(
+        "/auth/login", data={"username": username, "password": password}
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["access_token"]
+
+
+class FakeClock:
+    """Manually advanced clock for TTL/rate-limit tests (`clock.now = ...`)."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
 # -------------------------------------------------------
 # Auth fixtures (admin and member)
 # -------------------------------------------------------
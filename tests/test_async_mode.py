@@ -0,0 +1,174 @@
+from typing import AsyncGenerator
+
+import pytest
+from conftest import auth_headers, create_test_user_direct, login
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.db import Base, get_async_db
+from app.db.async_database import to_async_url
+from app.models.role import Role
+from app.routers import auth_async, members_async
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture
+def async_client(tmp_path) -> TestClient:
+    """App mit den async Routern auf einer eigenen SQLite-Datei (aiosqlite)."""
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    sync_engine = create_engine(url)
+    Base.metadata.create_all(sync_engine)
+    session = sessionmaker(bind=sync_engine)()
+    session.add_all([Role(id=1, name="Admin"), Role(id=2, name="User")])
+    session.commit()
+    create_test_user_direct(
+        session, "adminuser", "admin@test.com", "Admin", "adminpass"
+    )
+    session.close()
+    sync_engine.dispose()
+
+    async_engine = create_async_engine(to_async_url(url), poolclass=NullPool)
+    session_factory = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    async def override_get_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with session_factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(auth_async.router, prefix="/auth")
+    app.include_router(members_async.router, prefix="/members")
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    with TestClient(app) as client:
+        yield client
+
+
+def test_to_async_url_maps_sync_drivers():
+    assert to_async_url("postgresql://u:p@db:5432/csc") == (
+        "postgresql+asyncpg://u:p@db:5432/csc"
+    )
+    assert to_async_url("postgresql+psycopg2://u:p@db/csc").startswith(
+        "postgresql+asyncpg://"
+    )
+    assert to_async_url("sqlite:///./x.db") == "sqlite+aiosqlite:///./x.db"
+
+
+def test_async_member_crud(async_client):
+    headers = auth_headers(login(async_client, "adminuser", "adminpass"))
+    payload = {
+        "name": "Async Member",
+        "birth_date": "1990-01-01",
+        "address": "Street 1",
+        "city": "Berlin",
+        "postal_code": "10115",
+        "email": "async@example.com",
+    }
+
+    created = async_client.post("/members/members/", json=payload, headers=headers)
+    assert created.status_code == 201, created.text
+    member_id = created.json()["id"]
+
+    listed = async_client.get(
+        "/members/members/", params={"name": "async"}, headers=headers
+    )
+    assert [m["id"] for m in listed.json()] == [member_id]
+    cached = async_client.get(
+        "/members/members/",
+        params={"name": "async"},
+        headers={**headers, "If-None-Match": listed.headers["ETag"]},
+    )
+    assert cached.status_code == 304
+
+    detail = async_client.get(f"/members/members/{member_id}", headers=headers)
+    assert detail.json()["email"] == "async@example.com"
+    assert "Last-Modified" in detail.headers
+
+    sparse = async_client.get(
+        "/members/members/", params={"name": "async", "fields": "id"}, headers=headers
+    )
+    assert sparse.json() == [{"id": member_id}]
+
+    exported = async_client.get(
+        "/members/members/export", params={"format": "csv"}, headers=headers
+    )
+    assert exported.status_code == 200
+    assert "Async Member" in exported.text.splitlines()[1]
+
+    updated = async_client.put(
+        f"/members/members/{member_id}", json={"name": "Renamed"}, headers=headers
+    )
+    assert updated.json()["name"] == "Renamed"
+
+    assert (
+        async_client.delete(
+            f"/members/members/{member_id}", headers=headers
+        ).status_code
+        == 204
+    )
+    assert (
+        async_client.delete(
+            f"/members/members/{member_id}", headers=headers
+        ).status_code
+        == 404
+    )
+
+
+def test_async_register_login_and_logout(async_client):
+    response = async_client.post(
+        "/auth/register",
+        json={"username": "asyncuser", "email": "a@test.com", "password": "secret123"},
+    )
+    assert response.status_code == 201, response.text
+
+    token = login(async_client, "asyncuser", "secret123")
+    assert async_client.get("/auth/me", headers=auth_headers(token)).json()[
+        "username"
+    ] == ("asyncuser")
+
+    # Mitglieder-Schreibzugriffe bleiben Admins vorbehalten
+    assert (
+        async_client.post(
+            "/members/members/", json={}, headers=auth_headers(token)
+        ).status_code
+        == 403
+    )
+
+    assert (
+        async_client.post("/auth/logout", headers=auth_headers(token)).status_code
+        == 204
+    )
+    assert async_client.get("/auth/me", headers=auth_headers(token)).status_code == 401
+
+
+def test_async_duplicate_username_matches_sync_contract(async_client, client):
+    """DATABASE_MODE darf Status und Fehlertext nicht ändern."""
+    payload = {"username": "dupuser", "email": "dup@test.com", "password": "secret123"}
+    responses = []
+    for c in (async_client, client):
+        assert c.post("/auth/register", json=payload).status_code == 201
+        duplicate = {**payload, "email": "other@test.com"}
+        responses.append(c.post("/auth/register", json=duplicate))
+
+    async_response, sync_response = responses
+    assert async_response.status_code == sync_response.status_code == 400
+    assert async_response.json() == sync_response.json()
+    assert async_response.json()["detail"] == "Username is already taken"
+
+
+def test_async_password_reset_flow(async_client, monkeypatch):
+    monkeypatch.setenv("TESTING", "1")
+    response = async_client.post(
+        "/auth/password-reset-request", json={"email": "admin@test.com"}
+    )
+    reset_token = response.json()["test_token"]
+
+    response = async_client.post(
+        "/auth/reset-password",
+        json={"token": reset_token, "new_password": "newadminpass"},
+    )
+    assert response.status_code == 200, response.text
+    login(async_client, "adminuser", "newadminpass")
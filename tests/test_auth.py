@@ -1,4 +1,5 @@
 import pytest
+from conftest import TestingSessionLocal, auth_headers, login
 
 
 # -------------------------------
@@ -80,3 +81,71 @@ def test_login_and_token_creation(
         assert data.get("token_type") == "bearer"
     else:
         assert "access_token" not in response.text
+
+
+# -------------------------------
+# 🔹 Token-Claims
+# -------------------------------
+def test_login_token_carries_role_and_version(client, admin_token):
+    """Das Access-Token enthält Rolle und Token-Version."""
+    from jose import jwt
+
+    from app.core.security import ALGORITHM, SECRET_KEY
+
+    payload = jwt.decode(admin_token, SECRET_KEY, algorithms=[ALGORITHM])
+    assert payload["sub"] == "adminuser"
+    assert payload["role"] == "Admin"
+    assert payload["ver"] == 0
+
+
+def test_password_reset_revokes_existing_tokens(client, monkeypatch):
+    """Nach einem Passwort-Reset wird ein älteres Token abgelehnt."""
+    monkeypatch.setenv("TESTING", "1")
+    user_data = {
+        "username": "revoke_user",
+        "email": "revoke_user@example.com",
+        "password": "oldpassword123",
+    }
+    assert client.post("/auth/register", json=user_data).status_code == 201
+    headers = auth_headers(login(client, "revoke_user", "oldpassword123"))
+    assert client.get("/auth/me", headers=headers).status_code == 200
+
+    r = client.post("/auth/password-reset-request", json={"email": user_data["email"]})
+    token = r.json()["test_token"]
+    r = client.post(
+        "/auth/reset-password", json={"token": token, "new_password": "newpassword123"}
+    )
+    assert r.status_code == 200
+
+    assert client.get("/auth/me", headers=headers).status_code == 401
+
+
+def test_login_rehashes_outdated_password_hash(client, monkeypatch):
+    """Ein Hash unterhalb der Zielkosten wird beim Login ersetzt."""
+    from passlib.hash import pbkdf2_sha256
+
+    from app.core import security
+    from app.models.user import User
+
+    monkeypatch.setattr(security, "pwd_context", security.build_crypt_context(2000))
+
+    session = TestingSessionLocal()
+    try:
+        session.add(
+            User(
+                username="rehash_user",
+                email="rehash_user@example.com",
+                hashed_password=pbkdf2_sha256.using(rounds=1000).hash("rehashpass"),
+                role_id=2,
+            )
+        )
+        session.commit()
+
+        login(client, "rehash_user", "rehashpass")
+
+        session.expire_all()
+        user = session.query(User).filter(User.username == "rehash_user").one()
+        assert "$2000$" in user.hashed_password
+        assert security.verify_password("rehashpass", user.hashed_password)
+    finally:
+        session.close()
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from conftest import auth_headers
+
+
+def add_member(client, token: str, email: str) -> int:
+    response = client.post(
+        "/members/members/",
+        json={
+            "name": "Etag Member",
+            "birth_date": "1990-01-01",
+            "address": "Street 1",
+            "city": "Berlin",
+            "postal_code": "10115",
+            "email": email,
+        },
+        headers=auth_headers(token),
+    )
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def list_members(client, token, **headers):
+    return client.get(
+        "/members/members/",
+        params={"name": "Etag"},
+        headers=auth_headers(token, **headers),
+    )
+
+
+def test_list_if_none_match_returns_304_until_the_set_changes(client, admin_token):
+    add_member(client, admin_token, "etag1@example.com")
+
+    first = list_members(client, admin_token)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    cached = list_members(client, admin_token, **{"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+
+    # Andere Parameter ergeben ein anderes ETag
+    other = client.get(
+        "/members/members/",
+        params={"name": "Etag", "limit": 1},
+        headers=auth_headers(admin_token, **{"If-None-Match": etag}),
+    )
+    assert other.status_code == 200
+
+    member_id = add_member(client, admin_token, "etag2@example.com")
+    changed = list_members(client, admin_token, **{"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+    etag = changed.headers["ETag"]
+    client.delete(
+        f"/members/members/{member_id}", headers=auth_headers(admin_token)
+    ).raise_for_status()
+    deleted = list_members(client, admin_token, **{"If-None-Match": etag})
+    assert deleted.status_code == 200
+
+    # Auch ein Bulk-Update ohne Statistik-Spalten zählt die Version hoch
+    etag = deleted.headers["ETag"]
+    client.post(
+        "/members/members/bulk-update",
+        json={"filter": {"name": "Etag"}, "patch": {"address": "Street 2"}},
+        headers=auth_headers(admin_token),
+    ).raise_for_status()
+    patched = list_members(client, admin_token, **{"If-None-Match": etag})
+    assert patched.status_code == 200
+
+
+def test_member_detail_last_modified(client, admin_token):
+    member_id = add_member(client, admin_token, "etag-detail@example.com")
+
+    response = client.get(
+        f"/members/members/{member_id}", headers=auth_headers(admin_token)
+    )
+    assert response.status_code == 200
+    assert response.json()["email"] == "etag-detail@example.com"
+    last_modified = response.headers["Last-Modified"]
+
+    cached = client.get(
+        f"/members/members/{member_id}",
+        headers=auth_headers(admin_token, **{"If-Modified-Since": last_modified}),
+    )
+    assert cached.status_code == 304
+
+    earlier = format_datetime(
+        datetime.now(timezone.utc) - timedelta(days=1), usegmt=True
+    )
+    stale = client.get(
+        f"/members/members/{member_id}",
+        headers=auth_headers(admin_token, **{"If-Modified-Since": earlier}),
+    )
+    assert stale.status_code == 200
+
+
+def test_member_detail_not_found(client, admin_token):
+    response = client.get("/members/members/999999", headers=auth_headers(admin_token))
+    assert response.status_code == 404
@@ -0,0 +1,79 @@
+import pytest
+from conftest import auth_headers
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.db.pool import InstrumentedQueuePool, engine_pool_stats, pool_options
+
+
+def test_pool_options_keep_default_pool_for_in_memory_sqlite():
+    assert pool_options("sqlite:///:memory:") == {}
+    options = pool_options("postgresql://u:p@db/csc")
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert {"pool_size", "max_overflow", "pool_timeout", "pool_recycle"} <= set(options)
+
+
+def test_instrumented_pool_counts_checkouts_and_timeouts(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    try:
+        held = engine.connect()
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+        stats = engine_pool_stats(engine)
+        assert stats["checkouts"] == 1
+        assert stats["checkout_timeouts"] == 1
+        assert stats["checked_out"] == 1
+        assert stats["max_wait_ms"] >= 50
+
+        held.close()
+        stats = engine_pool_stats(engine)
+        assert stats["checked_out"] == 0
+    finally:
+        engine.dispose()
+
+
+def test_pool_stats_are_kept_per_engine(tmp_path):
+    """Replikat-Checkouts dürfen nicht in den Zahlen des Primary landen."""
+    engines = [
+        create_engine(f"sqlite:///{tmp_path / name}", poolclass=InstrumentedQueuePool)
+        for name in ("primary.db", "replica.db")
+    ]
+    primary, replica = engines
+    try:
+        for _ in range(3):
+            with replica.connect():
+                pass
+        with primary.connect():
+            pass
+        assert engine_pool_stats(primary)["checkouts"] == 1
+        assert engine_pool_stats(replica)["checkouts"] == 3
+
+        # dispose() erzeugt einen neuen Pool, die Zähler bleiben erhalten
+        replica.dispose()
+        assert engine_pool_stats(replica)["checkouts"] == 3
+    finally:
+        for engine in engines:
+            engine.dispose()
+
+
+def test_db_pool_endpoint_is_admin_only(client, admin_token, member_token):
+    assert (
+        client.get("/admin/db-pool", headers=auth_headers(member_token)).status_code
+        == 403
+    )
+
+    response = client.get("/admin/db-pool", headers=auth_headers(admin_token))
+    assert response.status_code == 200
+    body = response.json()
+    assert {"pool_size", "max_overflow", "sync"} <= set(body)
+    assert "checkout_timeouts" in body["sync"]
+
+    metrics = client.get("/admin/metrics", headers=auth_headers(admin_token)).json()
+    assert "db_pool" in metrics
@@ -0,0 +1,275 @@
+import smtplib
+import socket
+from datetime import datetime, timezone
+from email import message_from_bytes, policy
+
+import pytest
+from aiosmtpd.controller import Controller
+from conftest import TestingSessionLocal
+
+from app.core.config import settings
+from app.models import EmailOutbox
+from app.services.email_outbox import OutboxSender, SMTPConnection, enqueue_email
+
+
+class CollectingHandler:
+    def __init__(self):
+        self.messages = []
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope)
+        return "250 OK"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(autouse=True)
+def empty_outbox():
+    with TestingSessionLocal() as db:
+        db.query(EmailOutbox).delete()
+        db.commit()
+    yield
+
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    """Lokaler SMTP-Server als Ersatz für den echten Mailserver."""
+    handler = CollectingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=free_port())
+    controller.start()
+    monkeypatch.setattr(settings, "MAIL_SERVER", "127.0.0.1")
+    monkeypatch.setattr(settings, "MAIL_PORT", controller.port)
+    monkeypatch.setattr(settings, "MAIL_USERNAME", None)
+    monkeypatch.setattr(settings, "MAIL_FROM", "noreply@club.test")
+    yield handler
+    controller.stop()
+
+
+@pytest.fixture
+def unreachable_smtp(monkeypatch):
+    monkeypatch.setattr(settings, "MAIL_SERVER", "127.0.0.1")
+    monkeypatch.setattr(settings, "MAIL_PORT", free_port())
+    monkeypatch.setattr(settings, "MAIL_USERNAME", None)
+    monkeypatch.setattr(settings, "MAIL_TIMEOUT_SECONDS", 1.0)
+
+
+def outbox_rows():
+    with TestingSessionLocal() as db:
+        return db.query(EmailOutbox).order_by(EmailOutbox.id).all()
+
+
+def test_reset_request_queues_mail_and_worker_delivers(
+    client, member_user, smtp_server, monkeypatch
+):
+    monkeypatch.setenv("TESTING", "1")
+    r = client.post("/auth/password-reset-request", json={"email": "member@test.com"})
+    assert r.status_code == 200
+    token = r.json()["test_token"]
+
+    [queued] = outbox_rows()
+    assert queued.status == "pending"
+    assert queued.recipient == "member@test.com"
+
+    sender = OutboxSender(TestingSessionLocal)
+    try:
+        assert sender.drain_once() == 1
+    finally:
+        sender.connection.close()
+
+    [envelope] = smtp_server.messages
+    assert envelope.rcpt_tos == ["member@test.com"]
+    message = message_from_bytes(envelope.content, policy=policy.default)
+    assert message["Subject"] == "Passwort zurücksetzen"
+    assert f"?token={token}" in message.get_content()
+
+    [sent] = outbox_rows()
+    assert sent.status == "sent"
+    assert sent.sent_at is not None
+    assert sent.body == ""
+
+
+def test_unknown_email_queues_nothing(client):
+    r = client.post("/auth/password-reset-request", json={"email": "nobody@test.com"})
+    assert r.status_code == 200
+    assert outbox_rows() == []
+
+
+def test_batch_reuses_one_connection(smtp_server):
+    with TestingSessionLocal() as db:
+        for i in range(5):
+            enqueue_email(db, f"user{i}@test.com", "Hallo", "Text")
+        db.commit()
+
+    connects = []
+    sender = OutboxSender(TestingSessionLocal, batch_size=2)
+    original = sender.connection._factory
+
+    def counting_factory():
+        connects.append(1)
+        return original()
+
+    sender.connection._factory = counting_factory
+    try:
+        assert [sender.drain_once() for _ in range(4)] == [2, 2, 1, 0]
+    finally:
+        sender.connection.close()
+
+    assert len(smtp_server.messages) == 5
+    assert len(connects) == 1
+    assert {row.status for row in outbox_rows()} == {"sent"}
+
+
+def test_claimed_batch_is_leased_and_committed_before_sending(smtp_server):
+    with TestingSessionLocal() as db:
+        enqueue_email(db, "user@test.com", "Hallo", "Text")
+        db.commit()
+
+    sender = OutboxSender(TestingSessionLocal)
+    other = OutboxSender(TestingSessionLocal)
+    seen = []
+    original_send = sender._send
+
+    def send(message):
+        # Während des SMTP-Versands: Lease sichtbar, kein zweiter Worker holt sie
+        [row] = outbox_rows()
+        seen.append(row.next_attempt_at.replace(tzinfo=timezone.utc))
+        with TestingSessionLocal() as db:
+            assert other.claim(db) == []
+        original_send(message)
+
+    sender._send = send
+    try:
+        assert sender.drain_once() == 1
+    finally:
+        sender.connection.close()
+
+    assert seen[0] > datetime.now(timezone.utc)
+    [row] = outbox_rows()
+    assert row.status == "sent"
+    assert len(smtp_server.messages) == 1
+
+
+def test_concurrent_claims_do_not_share_messages(smtp_server):
+    with TestingSessionLocal() as db:
+        for i in range(3):
+            enqueue_email(db, f"user{i}@test.com", "Hallo", "Text")
+        db.commit()
+
+    sender = OutboxSender(TestingSessionLocal)
+    other = OutboxSender(TestingSessionLocal)
+    original_due_ids = sender._due_ids
+    stolen = []
+
+    def due_ids(db, now):
+        # Beide Worker haben dieselben Kandidaten gelesen (SQLite: kein SKIP LOCKED)
+        ids = original_due_ids(db, now)
+        with TestingSessionLocal() as other_db:
+            stolen.extend(other.claim(other_db))
+        return ids
+
+    sender._due_ids = due_ids
+    with TestingSessionLocal() as db:
+        assert sender.claim(db) == []
+    assert [message.recipient for message in stolen] == [
+        "user0@test.com",
+        "user1@test.com",
+        "user2@test.com",
+    ]
+
+
+class RefusingSMTP:
+    def __init__(self):
+        self.closed = False
+
+    def noop(self):
+        return (250, b"OK")
+
+    def send_message(self, email):
+        raise smtplib.SMTPRecipientsRefused({email["To"]: (550, b"No such user")})
+
+    def quit(self):
+        self.closed = True
+
+
+def test_refused_recipient_keeps_the_connection():
+    with TestingSessionLocal() as db:
+        for i in range(2):
+            enqueue_email(db, f"user{i}@test.com", "Hallo", "Text")
+        db.commit()
+
+    connections = []
+
+    def factory():
+        connections.append(RefusingSMTP())
+        return connections[-1]
+
+    sender = OutboxSender(TestingSessionLocal, connection=SMTPConnection(factory))
+    assert sender.drain_once() == 2
+
+    assert len(connections) == 1
+    assert not connections[0].closed
+    rows = outbox_rows()
+    assert [row.attempts for row in rows] == [1, 1]
+    assert all("SMTPRecipientsRefused" in row.last_error for row in rows)
+
+
+def test_disconnect_resets_the_connection():
+    with TestingSessionLocal() as db:
+        for i in range(2):
+            enqueue_email(db, f"user{i}@test.com", "Hallo", "Text")
+        db.commit()
+
+    connections = []
+
+    class DroppingSMTP(RefusingSMTP):
+        def send_message(self, email):
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+
+    def factory():
+        connections.append(DroppingSMTP())
+        return connections[-1]
+
+    sender = OutboxSender(TestingSessionLocal, connection=SMTPConnection(factory))
+    assert sender.drain_once() == 2
+    assert len(connections) == 2
+    assert connections[0].closed
+
+
+def test_failed_delivery_is_retried_with_backoff(unreachable_smtp):
+    with TestingSessionLocal() as db:
+        enqueue_email(db, "user@test.com", "Hallo", "Text")
+        db.commit()
+
+    sender = OutboxSender(TestingSessionLocal)
+    assert sender.drain_once() == 1
+
+    [row] = outbox_rows()
+    assert row.status == "pending"
+    assert row.attempts == 1
+    assert row.last_error
+    assert row.next_attempt_at.replace(tzinfo=timezone.utc) > datetime.now(timezone.utc)
+    # Noch nicht fällig: der nächste Durchlauf lässt die Nachricht liegen
+    assert sender.drain_once() == 0
+
+
+def test_delivery_gives_up_after_max_attempts(unreachable_smtp, monkeypatch):
+    monkeypatch.setattr(settings, "OUTBOX_MAX_ATTEMPTS", 2)
+    monkeypatch.setattr(settings, "OUTBOX_BACKOFF_SECONDS", 0)
+
+    with TestingSessionLocal() as db:
+        enqueue_email(db, "user@test.com", "Hallo", "Text")
+        db.commit()
+
+    sender = OutboxSender(TestingSessionLocal)
+    assert sender.drain_once() == 1
+    assert sender.drain_once() == 1
+    assert sender.drain_once() == 0
+
+    [row] = outbox_rows()
+    assert row.status == "failed"
+    assert row.attempts == 2
+    assert row.body == ""
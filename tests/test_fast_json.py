@@ -0,0 +1,71 @@
+from datetime import date
+
+import pytest
+from conftest import TestingSessionLocal, auth_headers
+
+from app.main import app
+from app.models.member import Member
+from app.schemas.member import MemberRead, dump_member_list
+
+
+@pytest.fixture
+def json_members():
+    session = TestingSessionLocal()
+    session.add_all(
+        Member(
+            name=f"Json Mitglied {i} ü",
+            birth_date=date(1990, 1, 1 + i),
+            email=f"json{i}@example.com",
+            address="Straße 1",
+            postal_code="10115",
+            city="Köln",
+            total_amount_received=12.5 * i,
+        )
+        for i in range(3)
+    )
+    session.commit()
+    session.close()
+
+
+@pytest.fixture
+def fast_json_mode():
+    previous = app.state.fast_json_responses
+
+    def switch(enabled: bool) -> None:
+        app.state.fast_json_responses = enabled
+
+    yield switch
+    app.state.fast_json_responses = previous
+
+
+def test_fast_and_standard_encoding_are_identical(
+    client, admin_token, json_members, fast_json_mode
+):
+    headers = auth_headers(admin_token)
+    params = {"name": "Json", "limit": 2}
+    responses = {}
+    for enabled in (False, True):
+        fast_json_mode(enabled)
+        responses[enabled] = client.get(
+            "/members/members/", params=params, headers=headers
+        )
+
+    standard, fast = responses[False], responses[True]
+    assert fast.status_code == standard.status_code == 200
+    assert fast.content == standard.content
+    assert fast.headers["content-type"] == standard.headers["content-type"]
+    for header in ("ETag", "X-Next-Cursor", "Link"):
+        assert fast.headers[header] == standard.headers[header]
+    assert len(fast.json()) == 2
+
+
+def test_dump_member_list_matches_member_read():
+    session = TestingSessionLocal()
+    members = session.query(Member).limit(5).all()
+    expected = (
+        "["
+        + ",".join(MemberRead.model_validate(m).model_dump_json() for m in members)
+        + "]"
+    )
+    assert dump_member_list(members).decode() == expected
+    session.close()
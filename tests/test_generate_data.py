@@ -0,0 +1,97 @@
+from collections import Counter
+
+import pytest
+from sqlalchemy import create_engine, func, select, text
+
+from app.db import Base
+from app.models import Member, MemberStats, Role, User
+from app.models.member import SQLITE_TRIGRAM_SUPPORTED
+from app.scripts.generate_data import CITIES, generate, main, member_rows
+
+
+@pytest.fixture
+def fresh_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'load.sqlite3'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_member_rows_are_deterministic():
+    assert list(member_rows(50, seed=7)) == list(member_rows(50, seed=7))
+    assert list(member_rows(50, seed=7)) != list(member_rows(50, seed=8))
+
+
+def test_member_rows_are_plausible():
+    ranges = {city: (low, high) for city, low, high, _ in CITIES}
+    rows = list(member_rows(2000, seed=1, offset=500))
+
+    assert len({row["email"] for row in rows}) == 2000
+    assert rows[0]["email"].endswith(".500@example.org")
+    for row in rows:
+        low, high = ranges[row["city"]]
+        assert low <= int(row["postal_code"]) <= high
+        assert row["join_date"].year - row["birth_date"].year >= 15
+        assert 0 <= row["total_amount_received"] < 100_000
+    assert 0.8 < sum(row["active"] for row in rows) / len(rows) < 0.95
+    assert Counter(row["city"] for row in rows).most_common(1)[0][0] == "Berlin"
+
+
+def test_generate_bulk_loads_members_users_and_stats(fresh_engine, capsys):
+    report = generate(fresh_engine, members=2500, users=40, seed=3, batch_size=1000)
+    assert report["members"] == 2500 and report["users"] == 40
+    assert "members:      2,500/2,500" in capsys.readouterr().out
+
+    with fresh_engine.connect() as connection:
+        assert connection.scalar(select(func.count()).select_from(Member)) == 2500
+        assert connection.scalar(
+            select(func.sum(MemberStats.member_count))
+        ) == connection.scalar(select(func.count()).select_from(Member))
+        roles = dict(connection.execute(select(Role.name, Role.id)).all())
+        role_ids = set(connection.scalars(select(User.role_id)))
+        assert role_ids <= {roles["Admin"], roles["User"]}
+        assert (
+            connection.scalar(
+                select(func.count()).select_from(Member).where(Member.active)
+            )
+            > 2000
+        )
+
+
+def test_cli_appends_with_offset(tmp_path, capsys):
+    url = f"sqlite:///{tmp_path / 'cli.sqlite3'}"
+    args = ["--database-url", url, "--members", "300", "--users", "0"]
+    main([*args, "--create-schema"])
+    main([*args, "--offset", "300"])
+    assert "Generated 300 members" in capsys.readouterr().out
+
+    engine = create_engine(url)
+    with engine.connect() as connection:
+        assert connection.scalar(select(func.count()).select_from(Member)) == 600
+    engine.dispose()
+
+
+@pytest.mark.skipif(not SQLITE_TRIGRAM_SUPPORTED, reason="SQLite without trigram FTS5")
+def test_initial_load_rebuilds_indexes_and_name_search(fresh_engine):
+    generate(fresh_engine, members=500, users=0, batch_size=200)
+
+    with fresh_engine.connect() as connection:
+        names = {
+            row[0]
+            for row in connection.execute(
+                text("SELECT name FROM sqlite_master WHERE tbl_name = 'members'")
+            )
+        }
+        assert {index.name for index in Member.__table__.indexes} - {
+            "ix_members_active_id"
+        } <= names
+        assert "members_name_fts_ai" in names
+        matches = connection.scalar(
+            text(
+                "SELECT count(*) FROM members_name_fts "
+                "WHERE members_name_fts MATCH 'üll'"
+            )
+        )
+        assert matches == connection.scalar(
+            select(func.count()).where(Member.name.contains("üll"))
+        )
@@ -0,0 +1,34 @@
+import pytest
+from fastapi import HTTPException
+
+from app.core.hashing_pool import PasswordHashPool
+from app.core.security import _hash_password, _verify_password
+
+
+def test_process_pool_hashes_and_verifies():
+    pool = PasswordHashPool(workers=1, max_concurrency=1, queue_timeout=30)
+    try:
+        hashed = pool.run(_hash_password, "secret-password")
+        assert pool.run(_verify_password, "secret-password", hashed)
+        assert not pool.run(_verify_password, "wrong-password", hashed)
+    finally:
+        pool.shutdown()
+
+    stats = pool.stats()
+    assert stats["completed"] == 3
+    assert stats["in_flight"] == 0
+    assert stats["waiting"] == 0
+
+
+def test_pool_rejects_when_concurrency_cap_is_exhausted():
+    pool = PasswordHashPool(workers=1, max_concurrency=1, queue_timeout=0.01)
+    pool._semaphore.acquire()  # simuliert einen laufenden Hash-Job
+    try:
+        with pytest.raises(HTTPException) as exc:
+            pool.run(_hash_password, "secret-password")
+    finally:
+        pool._semaphore.release()
+        pool.shutdown()
+
+    assert exc.value.status_code == 503
+    assert pool.stats()["rejected"] == 1
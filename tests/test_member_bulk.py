@@ -0,0 +1,111 @@
+from datetime import date
+
+import pytest
+from conftest import TestingSessionLocal, auth_headers
+
+from app.models.member import Member
+
+
+@pytest.fixture
+def bulk_member_ids():
+    session = TestingSessionLocal()
+    session.query(Member).filter(Member.name.like("Bulk %")).delete()
+    members = [
+        Member(
+            name=f"Bulk {i}",
+            birth_date=date(1990, 1, 1),
+            email=f"bulk{i}@example.com",
+            address="Street 1",
+            postal_code="10115",
+            city="Berlin",
+            join_date=date(2020 + i, 1, 1),
+            active=i % 2 == 0,
+        )
+        for i in range(4)
+    ]
+    session.add_all(members)
+    session.commit()
+    ids = [member.id for member in members]
+    session.close()
+    return ids
+
+
+def test_bulk_update_by_filter_runs_one_patch(client, admin_token, bulk_member_ids):
+    response = client.post(
+        "/members/members/bulk-update",
+        json={
+            "filter": {"name": "Bulk", "joined_before": "2022-01-01"},
+            "patch": {"active": False, "city": "Potsdam"},
+        },
+        headers=auth_headers(admin_token),
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {"count": 2, "ids": bulk_member_ids[:2]}
+
+    session = TestingSessionLocal()
+    cities = {
+        m.id: (m.city, m.active)
+        for m in session.query(Member).filter(Member.id.in_(bulk_member_ids))
+    }
+    session.close()
+    assert cities[bulk_member_ids[0]] == ("Potsdam", False)
+    assert cities[bulk_member_ids[2]] == ("Berlin", True)
+
+
+def test_bulk_delete_by_ids_and_filter(client, admin_token, bulk_member_ids):
+    response = client.post(
+        "/members/members/bulk-delete",
+        json={"ids": bulk_member_ids, "filter": {"active": False}},
+        headers=auth_headers(admin_token),
+    )
+    assert response.json() == {
+        "count": 2,
+        "ids": [bulk_member_ids[1], bulk_member_ids[3]],
+    }
+
+    session = TestingSessionLocal()
+    remaining = session.query(Member.id).filter(Member.id.in_(bulk_member_ids)).count()
+    session.close()
+    assert remaining == 2
+
+
+@pytest.mark.parametrize(
+    "path, body",
+    [
+        ("/members/members/bulk-delete", {}),
+        ("/members/members/bulk-delete", {"filter": {}}),
+        ("/members/members/bulk-update", {"ids": [1], "patch": {}}),
+        ("/members/members/bulk-update", {"ids": [1], "patch": {"email": "x@y.de"}}),
+        ("/members/members/bulk-update", {"ids": [1], "patch": {"name": None}}),
+        ("/members/members/bulk-update", {"ids": [1], "patch": {"birth_date": None}}),
+        ("/members/members/bulk-update", {"ids": [1], "patch": {"active": None}}),
+    ],
+)
+def test_bulk_requests_without_selection_or_patch_are_rejected(
+    client, admin_token, path, body
+):
+    response = client.post(path, json=body, headers=auth_headers(admin_token))
+    assert response.status_code == 422
+
+
+def test_bulk_operations_are_admin_only(client, member_token):
+    response = client.post(
+        "/members/members/bulk-delete",
+        json={"ids": [1]},
+        headers=auth_headers(member_token),
+    )
+    assert response.status_code == 403
+
+
+def test_bulk_update_can_clear_nullable_phone(client, admin_token, bulk_member_ids):
+    response = client.post(
+        "/members/members/bulk-update",
+        json={"ids": bulk_member_ids[:1], "patch": {"phone": None}},
+        headers=auth_headers(admin_token),
+    )
+    assert response.status_code == 200, response.text
+
+    session = TestingSessionLocal()
+    phone = session.get(Member, bulk_member_ids[0]).phone
+    session.close()
+    assert phone is None
@@ -0,0 +1,91 @@
+from conftest import TestingSessionLocal, auth_headers
+
+from app.core.member_cache import CachedMember, MemberCache, member_cache
+from app.models.member import Member
+
+
+def create_member(client, token, email: str) -> int:
+    payload = {
+        "name": "Cached Member",
+        "birth_date": "1990-01-01",
+        "address": "Street 1",
+        "city": "Berlin",
+        "postal_code": "10115",
+        "email": email,
+    }
+    response = client.post(
+        "/members/members/", json=payload, headers=auth_headers(token)
+    )
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def test_detail_is_served_from_cache_until_update(client, admin_token):
+    member_id = create_member(client, admin_token, "cached1@example.com")
+    url = f"/members/members/{member_id}"
+
+    first = client.get(url, headers=auth_headers(admin_token))
+    second = client.get(url, headers=auth_headers(admin_token))
+    assert first.json() == second.json()
+    assert first.json()["name"] == "Cached Member"
+    stats = member_cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+    assert stats["payload_bytes"] == len(first.content)
+
+    # Direkt in der DB geändert: der Cache liefert weiter den alten Stand
+    session = TestingSessionLocal()
+    session.get(Member, member_id).city = "Hamburg"
+    session.commit()
+    session.close()
+    assert client.get(url, headers=auth_headers(admin_token)).json()["city"] == "Berlin"
+
+    client.put(
+        url, json={"name": "Renamed"}, headers=auth_headers(admin_token)
+    ).raise_for_status()
+    updated = client.get(url, headers=auth_headers(admin_token)).json()
+    assert (updated["name"], updated["city"]) == ("Renamed", "Hamburg")
+
+    client.delete(url, headers=auth_headers(admin_token)).raise_for_status()
+    assert client.get(url, headers=auth_headers(admin_token)).status_code == 404
+
+
+def test_bulk_operations_evict_cached_members(client, admin_token):
+    ids = [
+        create_member(client, admin_token, f"cached-bulk{i}@example.com")
+        for i in range(2)
+    ]
+    for member_id in ids:
+        client.get(f"/members/members/{member_id}", headers=auth_headers(admin_token))
+    assert len(member_cache) == 2
+
+    client.post(
+        "/members/members/bulk-update",
+        json={"ids": ids, "patch": {"city": "Köln"}},
+        headers=auth_headers(admin_token),
+    ).raise_for_status()
+    assert len(member_cache) == 0
+    detail = client.get(f"/members/members/{ids[0]}", headers=auth_headers(admin_token))
+    assert detail.json()["city"] == "Köln"
+
+    client.post(
+        "/members/members/bulk-delete",
+        json={"ids": ids},
+        headers=auth_headers(admin_token),
+    ).raise_for_status()
+    assert len(member_cache) == 0
+
+
+def test_fill_is_dropped_after_concurrent_invalidation():
+    cache = MemberCache(max_size=10)
+    generation = cache.generation
+    cache.invalidate(1)
+    cache.fill(1, CachedMember(b"{}", None), generation)
+    assert cache.get(1) is None
+
+    cache.fill(1, CachedMember(b"{}", None), cache.generation)
+    assert cache.get(1) == CachedMember(b"{}", None)
+
+
+def test_member_cache_in_admin_metrics(client, admin_token):
+    metrics = client.get("/admin/metrics", headers=auth_headers(admin_token)).json()
+    assert {"hit_ratio", "payload_bytes"} <= set(metrics["member_cache"])
@@ -0,0 +1,105 @@
+from datetime import date
+
+import pytest
+from conftest import TestingSessionLocal, auth_headers
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.core.member_cache import member_count_cache
+from app.models.member import Member
+from app.schemas.member import MemberFilter
+from app.services import member_service
+from app.services.member_stats import bump_members_version
+
+
+def add_members(count: int, offset: int = 0, bump_version: bool = True) -> None:
+    session = TestingSessionLocal()
+    session.add_all(
+        Member(
+            name=f"Count Member {i}",
+            birth_date=date(1990, 1, 1),
+            email=f"count{i}@example.com",
+            address="Street 1",
+            postal_code="10115",
+            city="Berlin",
+        )
+        for i in range(offset, offset + count)
+    )
+    if bump_version:
+        # Wie jeder Schreibzugriff des MemberService
+        bump_members_version(session)
+    session.commit()
+    session.close()
+
+
+@pytest.fixture
+def count_members():
+    session = TestingSessionLocal()
+    session.query(Member).filter(Member.name.like("Count %")).delete()
+    session.commit()
+    session.close()
+    add_members(3)
+
+
+def fetch(client, token, **params):
+    response = client.get(
+        "/members/members/",
+        params={"name": "Count", "limit": 1, **params},
+        headers=auth_headers(token),
+    )
+    assert response.status_code == 200, response.text
+    return response
+
+
+def test_total_count_is_opt_in_and_exact(client, admin_token, count_members):
+    assert "X-Total-Count" not in fetch(client, admin_token).headers
+
+    response = fetch(client, admin_token, include_total="true")
+    assert response.headers["X-Total-Count"] == "3"
+    assert response.headers["X-Total-Count-Type"] == "exact"
+    assert len(response.json()) == 1
+
+
+def test_exact_count_is_cached_until_members_change(client, admin_token, count_members):
+    fetch(client, admin_token, include_total="true")
+    # Ohne Änderungszähler (z. B. direktes SQL) bleibt der Cache-Eintrag gültig
+    add_members(1, offset=3, bump_version=False)
+    cached = fetch(client, admin_token, include_total="true")
+    assert cached.headers["X-Total-Count"] == "3"
+    # Anderer Filter, eigener Eintrag
+    other = fetch(client, admin_token, include_total="true", city="Berlin")
+    assert other.headers["X-Total-Count"] == "4"
+
+    add_members(2, offset=4)
+    fresh = fetch(client, admin_token, include_total="true")
+    assert fresh.headers["X-Total-Count"] == "6"
+    assert fresh.headers["X-Total-Count-Type"] == "exact"
+
+
+def test_large_sets_use_planner_estimate(
+    client, admin_token, count_members, monkeypatch
+):
+    monkeypatch.setattr(
+        member_service, "estimate_members_count", lambda db, criteria: 250_000
+    )
+    response = fetch(client, admin_token, include_total="true")
+    assert response.headers["X-Total-Count"] == "250000"
+    assert response.headers["X-Total-Count-Type"] == "estimated"
+    assert len(member_count_cache) == 0
+
+
+@pytest.mark.parametrize("driver", ["psycopg2", "asyncpg"])
+def test_explain_keeps_filter_values_as_parameters(driver):
+    dialect = getattr(postgresql, driver).dialect()
+    name = "x'); DROP TABLE members; --"
+    query = select(Member.id).where(
+        *member_service.member_filter_clauses(
+            MemberFilter(name=name, city="Köln"), "postgresql"
+        )
+    )
+    statement, params = member_service.explain_statement(query, dialect)
+    assert statement.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "DROP TABLE" not in statement and "Köln" not in statement
+    values = params.values() if isinstance(params, dict) else params
+    assert "Köln" in values
+    assert any("DROP TABLE" in str(value) for value in values)
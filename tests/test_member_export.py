@@ -0,0 +1,67 @@
+import csv
+import io
+import json
+from datetime import date
+
+import pytest
+from conftest import TestingSessionLocal, auth_headers
+
+from app.core.config import settings
+from app.models.member import Member
+
+
+@pytest.fixture
+def export_members(monkeypatch):
+    # Kleine Blöcke, damit mehrere Partitionen gestreamt werden
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+    session = TestingSessionLocal()
+    session.query(Member).filter(Member.name.like("Export %")).delete()
+    session.add_all(
+        Member(
+            name=f"Export {i}",
+            birth_date=date(1990, 1, 1 + i),
+            email=f"export{i}@example.com",
+            address="Street, 1",
+            postal_code="10115",
+            city="Berlin",
+        )
+        for i in range(5)
+    )
+    session.commit()
+    session.close()
+
+
+def test_export_ndjson_streams_all_matching_members(
+    client, admin_token, export_members
+):
+    response = client.get(
+        "/members/members/export",
+        params={"name": "Export"},
+        headers=auth_headers(admin_token),
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    members = [json.loads(line) for line in response.text.splitlines()]
+    assert [m["name"] for m in members] == [f"Export {i}" for i in range(5)]
+    assert members[0]["birth_date"] == "1990-01-01"
+
+
+def test_export_csv_has_header_and_quoted_values(client, admin_token, export_members):
+    response = client.get(
+        "/members/members/export",
+        params={"format": "csv", "name": "Export 3"},
+        headers=auth_headers(admin_token),
+    )
+    assert response.status_code == 200
+    assert "attachment" in response.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 1
+    assert rows[0]["email"] == "export3@example.com"
+    assert rows[0]["address"] == "Street, 1"
+
+
+def test_export_is_admin_only(client, member_token):
+    response = client.get("/members/members/export", headers=auth_headers(member_token))
+    assert response.status_code == 403
@@ -0,0 +1,77 @@
+from datetime import date
+
+import pytest
+from conftest import TestingSessionLocal, auth_headers, engine
+from sqlalchemy import event
+
+from app.models.member import Member
+
+
+@pytest.fixture
+def field_members():
+    session = TestingSessionLocal()
+    session.query(Member).filter(Member.name.like("Fields %")).delete()
+    session.add_all(
+        Member(
+            name=f"Fields Member {i}",
+            birth_date=date(1990, 1, 1),
+            email=f"fields{i}@example.com",
+            address="Street 1",
+            postal_code="10115",
+            city="Berlin",
+        )
+        for i in range(3)
+    )
+    session.commit()
+    session.close()
+
+
+def fetch(client, token, **params):
+    return client.get(
+        "/members/members/",
+        params={"name": "Fields", **params},
+        headers=auth_headers(token),
+    )
+
+
+def test_fields_returns_only_selected_columns(client, admin_token, field_members):
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        response = fetch(client, admin_token, fields="email, id")
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert response.status_code == 200, response.text
+    members = response.json()
+    assert len(members) == 3
+    # Reihenfolge der Felder wie in MemberRead
+    assert [list(m) for m in members] == [["email", "id"]] * 3
+    page_query = next(s for s in statements if "LIMIT" in s)
+    assert "members.address" not in page_query
+    assert "members.created_at" not in page_query
+
+
+def test_fields_keeps_cursor_paging(client, admin_token, field_members):
+    first = fetch(client, admin_token, fields="name", order_by="name", limit=2)
+    assert [list(m) for m in first.json()] == [["name"]] * 2
+    second = fetch(
+        client,
+        admin_token,
+        fields="name",
+        order_by="name",
+        limit=2,
+        cursor=first.headers["X-Next-Cursor"],
+    )
+    names = [m["name"] for m in first.json() + second.json()]
+    assert names == sorted(names) and len(names) == 3
+
+
+@pytest.mark.parametrize("fields", ["id,password", "", " , "])
+def test_unknown_fields_are_rejected(client, admin_token, fields):
+    response = fetch(client, admin_token, fields=fields)
+    assert response.status_code == 400
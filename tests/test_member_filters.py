@@ -0,0 +1,133 @@
+import os
+from datetime import date
+
+import pytest
+from conftest import TestingSessionLocal, auth_headers, engine
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.dialects import postgresql
+
+from app.db import Base
+from app.models.member import Member
+from app.schemas.member import MemberFilter
+from app.services.member_service import build_members_page_query
+
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+# Gleichheitsfilter -> Index, der Filter und ORDER BY id zugleich bedient
+FILTER_INDEXES = [
+    (MemberFilter(city="Leipzig"), "ix_members_city_id"),
+    (MemberFilter(birth_date=date(1970, 3, 3)), "ix_members_birth_date_id"),
+]
+# Bereichsfilter brauchen eine Sortierung; der Index lohnt nur, wenn der Filter
+# selektiv genug ist. SQLite ohne STAT4 schätzt das nicht und liest dann den
+# Primärschlüssel in Reihenfolge, daher prüft das nur der Postgres-Test.
+POSTGRES_ONLY = [
+    (MemberFilter(joined_after=date(2024, 11, 1)), "ix_members_join_date_id"),
+    (MemberFilter(born_before=date(1960, 1, 2)), "ix_members_birth_date_id"),
+    (MemberFilter(min_amount_received=999), "ix_members_total_amount_received_id"),
+    (MemberFilter(postal_code_prefix="101"), "ix_members_postal_code_pattern"),
+    (MemberFilter(active=True), "ix_members_active_id"),
+]
+
+
+def filter_rows(count: int):
+    return [
+        {
+            "name": f"Filter Member {i:05d}",
+            "email": f"filter{i}@example.com",
+            "birth_date": date(1960 + i % 40, 1 + i % 12, 1 + i % 28),
+            "address": "Street 1",
+            "city": ("Berlin", "Hamburg", "München", "Köln", "Leipzig")[i % 5],
+            "postal_code": f"{10000 + i * 37 % 89999:05d}",
+            "join_date": date(2020 + i % 5, 1 + i % 12, 1),
+            "active": i % 10 != 0,
+            "total_amount_received": i % 1000,
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def filtered_members():
+    session = TestingSessionLocal()
+    session.query(Member).filter(Member.name.like("Filter %")).delete()
+    session.execute(insert(Member), filter_rows(50))
+    session.commit()
+    session.close()
+
+
+@pytest.mark.parametrize(
+    "params, expected",
+    [
+        ({"city": "Köln"}, lambda r: r["city"] == "Köln"),
+        ({"active": "false"}, lambda r: not r["active"]),
+        ({"postal_code_prefix": "103"}, lambda r: r["postal_code"].startswith("103")),
+        (
+            {"joined_after": "2022-01-01", "joined_before": "2023-06-01"},
+            lambda r: date(2022, 1, 1) < r["join_date"] < date(2023, 6, 1),
+        ),
+        (
+            {"born_after": "1970-01-01", "born_before": "1980-01-01"},
+            lambda r: date(1970, 1, 1) < r["birth_date"] < date(1980, 1, 1),
+        ),
+        (
+            {"min_amount_received": 10, "max_amount_received": 20},
+            lambda r: 10 <= r["total_amount_received"] <= 20,
+        ),
+    ],
+)
+def test_list_filters(client, admin_token, filtered_members, params, expected):
+    response = client.get(
+        "/members/members/",
+        params={"name": "Filter", "limit": 1000, "fields": "email", **params},
+        headers=auth_headers(admin_token),
+    )
+    assert response.status_code == 200, response.text
+    wanted = {r["email"] for r in filter_rows(50) if expected(r)}
+    assert wanted
+    assert {m["email"] for m in response.json()} == wanted
+
+
+@pytest.mark.parametrize("criteria, index", FILTER_INDEXES)
+def test_filter_uses_index_on_sqlite(criteria, index):
+    query, _ = build_members_page_query(criteria, limit=50, dialect="sqlite")
+    compiled = query.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as conn:
+        plan = " ".join(
+            row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+        )
+    assert index in plan
+    assert "TEMP B-TREE" not in plan, plan
+
+
+@pytest.fixture(scope="module")
+def postgres_engine():
+    if not POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL not set")
+    pg_engine = create_engine(
+        POSTGRES_URL, connect_args={"options": "-csearch_path=member_explain"}
+    )
+    with pg_engine.begin() as conn:
+        conn.execute(text("DROP SCHEMA IF EXISTS member_explain CASCADE"))
+        conn.execute(text("CREATE SCHEMA member_explain"))
+    Base.metadata.create_all(pg_engine)
+    with pg_engine.begin() as conn:
+        conn.execute(insert(Member), filter_rows(20_000))
+        conn.execute(text("ANALYZE members"))
+    yield pg_engine
+    with pg_engine.begin() as conn:
+        conn.execute(text("DROP SCHEMA member_explain CASCADE"))
+    pg_engine.dispose()
+
+
+@pytest.mark.parametrize("criteria, index", FILTER_INDEXES + POSTGRES_ONLY)
+def test_filter_uses_index_on_postgres(postgres_engine, criteria, index):
+    query, _ = build_members_page_query(criteria, limit=50, dialect="postgresql")
+    compiled = query.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    with postgres_engine.connect() as conn:
+        # Ohne Seq Scan als Ausweg muss ein passender Index existieren
+        conn.execute(text("SET enable_seqscan = off"))
+        plan = "\n".join(row[0] for row in conn.execute(text(f"EXPLAIN {compiled}")))
+    assert index in plan, plan
@@ -0,0 +1,97 @@
+import json
+
+from conftest import TestingSessionLocal, auth_headers
+
+from app.core.config import settings
+from app.models.member import Member
+
+
+def member_row(index: int) -> dict:
+    return {
+        "name": f"Import {index}",
+        "birth_date": "1990-01-01",
+        "address": f"Street {index}",
+        "city": "Berlin",
+        "postal_code": "10115",
+        "email": f"import{index}@example.com",
+    }
+
+
+def clear_imported() -> None:
+    session = TestingSessionLocal()
+    session.query(Member).filter(Member.name.like("Import %")).delete()
+    session.commit()
+    session.close()
+
+
+def test_ndjson_import_reports_created_duplicate_and_invalid_rows(
+    client, admin_token, monkeypatch
+):
+    clear_imported()
+    monkeypatch.setattr(settings, "IMPORT_BATCH_SIZE", 2)
+    lines = [
+        json.dumps(member_row(1)),
+        json.dumps({**member_row(2), "phone": "0301234"}),
+        "",
+        json.dumps(member_row(1)),  # Duplikat innerhalb der Datei
+        "{not json",
+        json.dumps({**member_row(3), "birth_date": "gestern"}),
+        json.dumps(member_row(4)),
+    ]
+    response = client.post(
+        "/members/members/import",
+        files={"file": ("roster.ndjson", "\n".join(lines).encode())},
+        headers=auth_headers(admin_token),
+    )
+    assert response.status_code == 200, response.text
+    report = response.json()
+
+    assert (report["created"], report["duplicates"], report["invalid"]) == (3, 1, 2)
+    assert [row["status"] for row in report["rows"]] == [
+        "created",
+        "created",
+        "duplicate_email",
+        "invalid",
+        "invalid",
+        "created",
+    ]
+    assert report["rows"][4]["errors"][0].startswith("birth_date")
+
+    session = TestingSessionLocal()
+    stored = session.get(Member, report["rows"][1]["id"])
+    assert stored.phone == "0301234"
+    session.close()
+
+    # Erneuter Import: alles bereits vorhanden
+    again = client.post(
+        "/members/members/import",
+        files={"file": ("roster.ndjson", json.dumps(member_row(4)).encode())},
+        headers=auth_headers(admin_token),
+    ).json()
+    assert again["duplicates"] == 1 and again["created"] == 0
+
+
+def test_csv_import_treats_empty_cells_as_unset(client, admin_token):
+    clear_imported()
+    csv_body = (
+        "name,email,birth_date,address,city,postal_code,phone\n"
+        "Import 10,import10@example.com,1985-05-05,Street 10,Köln,50667,\n"
+        "Import 11,,1985-05-05,Street 11,Köln,50667,\n"
+    )
+    response = client.post(
+        "/members/members/import",
+        files={"file": ("roster.csv", csv_body.encode())},
+        headers=auth_headers(admin_token),
+    )
+    report = response.json()
+    assert (report["created"], report["invalid"]) == (1, 1)
+    assert report["rows"][1]["errors"][0].startswith("email")
+
+
+def test_import_is_admin_only(client, member_token):
+    response = client.post(
+        "/members/members/import",
+        files={"file": ("roster.ndjson", b"")},
+        headers=auth_headers(member_token),
+    )
+    assert response.status_code == 403
@@ -0,0 +1,115 @@
+from datetime import date
+
+import pytest
+from conftest import TestingSessionLocal, auth_headers
+
+from app.core.pagination import encode_cursor
+from app.models.member import Member
+
+NAMES = ["Page Carla", "Page Anna", "Page Emil", "Page Bert", "Page Dora", "Page Anna"]
+
+
+@pytest.fixture
+def paged_members():
+    session = TestingSessionLocal()
+    session.query(Member).filter(Member.name.like("Page %")).delete()
+    session.add_all(
+        Member(
+            name=name,
+            birth_date=date(1990, 1, 1),
+            email=f"page{i}@example.com",
+            address="Street 1",
+            postal_code="10115",
+            city="Berlin",
+        )
+        for i, name in enumerate(NAMES)
+    )
+    session.commit()
+    session.close()
+
+
+def fetch(client, token, **params):
+    params = {"name": "Page", "limit": 2, **params}
+    response = client.get(
+        "/members/members/", params=params, headers=auth_headers(token)
+    )
+    assert response.status_code == 200, response.text
+    return response
+
+
+def walk_forward(client, token, order_by):
+    pages, cursor = [], None
+    while True:
+        response = fetch(client, token, order_by=order_by, cursor=cursor)
+        pages.append(response)
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return pages
+
+
+@pytest.mark.parametrize("order_by", ["id", "name"])
+def test_keyset_pages_cover_every_member_once(
+    client, admin_token, paged_members, order_by
+):
+    pages = walk_forward(client, admin_token, order_by)
+    items = [member for page in pages for member in page.json()]
+
+    key = (lambda m: m["id"]) if order_by == "id" else (lambda m: (m["name"], m["id"]))
+    assert items == sorted(items, key=key)
+    assert len(items) == len(NAMES)
+    assert len(pages) == 3
+    assert "X-Prev-Cursor" not in pages[0].headers
+    assert 'rel="next"' in pages[0].headers["Link"]
+
+
+def test_prev_cursor_returns_the_previous_page(client, admin_token, paged_members):
+    first, second, third = walk_forward(client, admin_token, "name")
+
+    back = fetch(
+        client, admin_token, order_by="name", cursor=third.headers["X-Prev-Cursor"]
+    )
+    assert back.json() == second.json()
+
+    back = fetch(
+        client, admin_token, order_by="name", cursor=back.headers["X-Prev-Cursor"]
+    )
+    assert back.json() == first.json()
+    assert "X-Prev-Cursor" not in back.headers
+
+
+def test_invalid_or_mismatched_cursor_is_rejected(client, admin_token, paged_members):
+    first, *_ = walk_forward(client, admin_token, "id")
+    headers = auth_headers(admin_token)
+
+    response = client.get(
+        "/members/members/", params={"cursor": "not-a-cursor"}, headers=headers
+    )
+    assert response.status_code == 400
+
+    response = client.get(
+        "/members/members/",
+        params={"order_by": "name", "cursor": first.headers["X-Next-Cursor"]},
+        headers=headers,
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "position",
+    [
+        {"o": "id", "k": [{"a": 1}]},
+        {"o": "id", "k": ["abc"]},
+        {"o": "id", "k": [True]},
+        {"o": "name", "k": [1, 2]},
+        {"o": "name", "k": ["Page Anna", "1"]},
+    ],
+)
+def test_cursor_key_types_are_checked(client, admin_token, position):
+    order_by = position["o"]
+    response = client.get(
+        "/members/members/",
+        params={"order_by": order_by, "cursor": encode_cursor(position)},
+        headers=auth_headers(admin_token),
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
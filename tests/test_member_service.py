@@ -40,3 +40,32 @@ def test_create_member_duplicate_email_raises(db_session):
     svc.create_member(MemberCreate(**sample_member_payload(2)))
     with pytest.raises(Exception):
         svc.create_member(MemberCreate(**sample_member_payload(2)))
+
+
+def test_name_search_uses_trigram_index_and_stays_in_sync(db_session):
+    svc = MemberService(db_session)
+    anna = svc.create_member(
+        MemberCreate(**{**sample_member_payload(3), "name": "Anna Schmidt"})
+    )
+    svc.create_member(
+        MemberCreate(**{**sample_member_payload(4), "name": "Bernd Schmitz"})
+    )
+    svc.create_member(
+        MemberCreate(**{**sample_member_payload(5), "name": "100% Müller"})
+    )
+
+    assert {m.name for m in svc.get_members(name="SCHMI")} == {
+        "Anna Schmidt",
+        "Bernd Schmitz",
+    }
+    assert [m.name for m in svc.get_members(name="na s")] == ["Anna Schmidt"]
+    # Kurze Begriffe (ILIKE-Fallback) und Platzhalter als Literale
+    assert [m.name for m in svc.get_members(name="0%")] == ["100% Müller"]
+    assert svc.get_members(name="A_na") == []
+
+    svc.update_member(anna, MemberUpdate(name="Anna Weber"))
+    assert [m.name for m in svc.get_members(name="schmi")] == ["Bernd Schmitz"]
+    assert [m.name for m in svc.get_members(name="weber")] == ["Anna Weber"]
+
+    svc.delete_member(anna)
+    assert svc.get_members(name="weber") == []
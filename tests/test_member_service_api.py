@@ -1,3 +1,6 @@
+from conftest import auth_headers
+
+
 def sample_member_payload(index: int = 0) -> dict:
     return {
         "name": f"Member {index}",
@@ -9,10 +12,6 @@ def sample_member_payload(index: int = 0) -> dict:
     }
 
 
-def auth_headers(token: str) -> dict:
-    return {"Authorization": f"Bearer {token}"}
-
-
 def find_member_in_list(items, member_id):
     for it in items:
         if it.get("id") == member_id:
@@ -0,0 +1,147 @@
+from datetime import date
+
+from conftest import TestingSessionLocal, auth_headers, engine
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.leader_lock import leader_lock
+from app.db import Base
+from app.models.member_stats import MemberStats
+from app.scripts.seed import EXAMPLE_MEMBERS, seed
+from app.services.member_stats import (
+    LOCK_NAME,
+    read_member_stats,
+    recompute_as_leader,
+    recompute_member_stats,
+    summarize,
+)
+
+
+def recomputed() -> dict:
+    session = TestingSessionLocal()
+    recompute_member_stats(session)
+    stats = read_member_stats(session).model_dump()
+    session.close()
+    return stats
+
+
+def fetch_stats(client, token) -> dict:
+    response = client.get("/members/members/stats", headers=auth_headers(token))
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def member_payload(email: str, **extra) -> dict:
+    return {
+        "name": "Stats Member",
+        "birth_date": "1985-06-01",
+        "address": "Street 1",
+        "city": "Statsstadt",
+        "postal_code": "10115",
+        "email": email,
+        **extra,
+    }
+
+
+def test_incremental_stats_match_full_recompute(client, admin_token):
+    headers = auth_headers(admin_token)
+    baseline = recomputed()
+
+    ids = [
+        client.post(
+            "/members/members/",
+            json=member_payload(f"stats{i}@example.com", total_amount_received=10 * i),
+            headers=headers,
+        ).json()["id"]
+        for i in range(3)
+    ]
+    stats = fetch_stats(client, admin_token)
+    assert stats["total"] == baseline["total"] + 3
+    assert stats["by_city"]["Statsstadt"] == 3
+    assert stats["amount_total"] == baseline["amount_total"] + 30
+    assert stats == recomputed()
+
+    client.put(
+        f"/members/members/{ids[0]}",
+        json={"city": "Umzugsstadt", "active": False},
+        headers=headers,
+    ).raise_for_status()
+    stats = fetch_stats(client, admin_token)
+    assert stats["by_city"]["Umzugsstadt"] == 1
+    assert stats["inactive"] == baseline["inactive"] + 1
+    assert stats == recomputed()
+
+    client.post(
+        "/members/members/bulk-update",
+        json={"ids": ids, "patch": {"birth_date": "2001-02-03"}},
+        headers=headers,
+    ).raise_for_status()
+    assert fetch_stats(client, admin_token) == recomputed()
+
+    client.post(
+        "/members/members/import",
+        files={
+            "file": (
+                "members.ndjson",
+                b'{"name": "Stats Import", "email": "stats-import@example.com",'
+                b' "birth_date": "1970-01-01", "address": "Street 1",'
+                b' "city": "Statsstadt", "postal_code": "10115"}\n',
+            )
+        },
+        headers=headers,
+    ).raise_for_status()
+    assert fetch_stats(client, admin_token) == recomputed()
+
+    client.delete(f"/members/members/{ids[1]}", headers=headers).raise_for_status()
+    client.post(
+        "/members/members/bulk-delete",
+        json={"filter": {"name": "Stats"}},
+        headers=headers,
+    ).raise_for_status()
+    stats = fetch_stats(client, admin_token)
+    assert stats == recomputed() == baseline
+
+
+def test_stats_require_admin(client, member_token):
+    response = client.get("/members/members/stats", headers=auth_headers(member_token))
+    assert response.status_code == 403
+
+
+def test_summarize_groups_by_city_and_age_decade():
+    rows = [
+        MemberStats(
+            city="A", active=True, birth_year=1990, member_count=2, amount_total=5
+        ),
+        MemberStats(
+            city="B", active=False, birth_year=1985, member_count=1, amount_total=0
+        ),
+        MemberStats(
+            city="B", active=True, birth_year=2020, member_count=0, amount_total=0
+        ),
+    ]
+    stats = summarize(rows, today=date(2026, 1, 1))
+    assert (stats.total, stats.active, stats.inactive) == (3, 2, 1)
+    assert stats.amount_total == 5.0
+    assert stats.by_city == {"A": 2, "B": 1}
+    assert stats.age_distribution == {"30-39": 2, "40-49": 1}
+
+
+def test_only_the_leader_recomputes(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "LEADER_LOCK_DIR", str(tmp_path))
+    with leader_lock(engine, LOCK_NAME) as leader:
+        assert leader
+        assert recompute_as_leader(TestingSessionLocal) is None
+    assert recompute_as_leader(TestingSessionLocal) > 0
+
+
+def test_seed_keeps_stats_in_step(tmp_path):
+    seed_engine = create_engine(f"sqlite:///{tmp_path / 'seed.sqlite3'}")
+    Base.metadata.create_all(seed_engine)
+    with sessionmaker(bind=seed_engine)() as db:
+        seed(db)
+        seeded = read_member_stats(db).model_dump()
+        assert seeded["total"] == len(EXAMPLE_MEMBERS)
+        recompute_member_stats(db)
+        assert read_member_stats(db).model_dump() == seeded
+    seed_engine.dispose()
@@ -1,3 +1,6 @@
+from conftest import auth_headers
+
+
 def sample_member_payload(index: int = 0) -> dict:
     return {
         "name": f"Member {index}",
@@ -9,10 +12,6 @@ def sample_member_payload(index: int = 0) -> dict:
     }
 
 
-def auth_headers(token: str) -> dict:
-    return {"Authorization": f"Bearer {token}"}
-
-
 def test_fixtures_are_available(admin_token, member_token, existing_member_id):
     # Basic assertions that fixtures produce usable artifacts
     assert isinstance(admin_token, str) and len(admin_token) > 0
@@ -0,0 +1,72 @@
+from conftest import FakeClock, TestingSessionLocal, auth_headers
+
+from app.core.cache import TTLCache
+from app.core.principal_cache import principal_cache
+from app.models.user import User
+from app.services.user_service import user_service
+
+
+def test_ttl_cache_expires_entries():
+    clock = FakeClock()
+    cache = TTLCache(max_size=10, ttl_seconds=5, clock=clock)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    clock.now = 6
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" ist jetzt der älteste Eintrag
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_current_user_is_served_from_cache(client, admin_token):
+    first = client.get("/auth/me", headers=auth_headers(admin_token))
+    second = client.get("/auth/me", headers=auth_headers(admin_token))
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert principal_cache.hits >= 1
+    assert principal_cache.misses == 1
+
+
+def test_role_change_invalidates_principal(client, admin_token):
+    r = client.post(
+        "/members/members/",
+        json={
+            "name": "Cache Member",
+            "birth_date": "1990-01-01",
+            "address": "Street 1",
+            "city": "Berlin",
+            "postal_code": "10115",
+            "email": "cache@example.com",
+        },
+        headers=auth_headers(admin_token),
+    )
+    assert r.status_code == 201
+    assert principal_cache.get("adminuser").role_name == "Admin"
+
+    session = TestingSessionLocal()
+    try:
+        user = session.query(User).filter(User.username == "adminuser").one()
+        user_service.assign_role(session, user, "User")
+
+        assert principal_cache.get("adminuser") is None
+        r = client.delete(
+            f"/members/members/{r.json()['id']}", headers=auth_headers(admin_token)
+        )
+        # Token trägt noch die alte Token-Version -> abgelehnt
+        assert r.status_code == 401
+    finally:
+        user_service.assign_role(session, user, "Admin")
+        session.close()
@@ -0,0 +1,117 @@
+from conftest import FakeClock
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app.core.config import settings
+from app.core.rate_limit import (
+    MemoryBucketStore,
+    RateLimitRule,
+    SQLiteBucketStore,
+    client_ip,
+    rate_limiter,
+    trusted_proxy_networks,
+)
+from app.main import app
+
+
+def test_memory_bucket_refills_over_time():
+    clock = FakeClock()
+    store = MemoryBucketStore(clock=clock)
+    rule = RateLimitRule(capacity=2, per_minute=60)
+
+    assert store.consume("k", rule)[0]
+    assert store.consume("k", rule)[0]
+    allowed, retry_after = store.consume("k", rule)
+    assert not allowed
+    assert 0 < retry_after <= 1
+
+    clock.now = 1.0
+    assert store.consume("k", rule)[0]
+
+
+def test_sqlite_bucket_store_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "buckets.sqlite3")
+    rule = RateLimitRule(capacity=1, per_minute=1)
+
+    assert SQLiteBucketStore(path).consume("k", rule)[0]
+    # Zweite Instanz = anderer Worker auf demselben Host
+    assert not SQLiteBucketStore(path).consume("k", rule)[0]
+
+
+def test_login_is_throttled_per_identity(client):
+    limit = rate_limiter.identity_rule.capacity
+    for _ in range(limit):
+        r = client.post(
+            "/auth/login", data={"username": "stuffed_user", "password": "wrong"}
+        )
+        assert r.status_code == 401
+
+    r = client.post(
+        "/auth/login", data={"username": "stuffed_user", "password": "wrong"}
+    )
+    assert r.status_code == 429
+    assert int(r.headers["Retry-After"]) >= 1
+    assert rate_limiter.stats()["rejected"] == {"login:identity": 1}
+
+    # Andere Identität ist nicht betroffen
+    r = client.post("/auth/login", data={"username": "other_user", "password": "x"})
+    assert r.status_code == 401
+
+
+def test_password_reset_request_is_throttled_per_ip(client):
+    limit = rate_limiter.ip_rule.capacity
+    for i in range(limit):
+        r = client.post(
+            "/auth/forgot-password", json={"email": f"nobody{i}@example.com"}
+        )
+        assert r.status_code == 200
+
+    r = client.post("/auth/forgot-password", json={"email": "last@example.com"})
+    assert r.status_code == 429
+
+
+def request_from(peer: str, forwarded_for: str = "") -> Request:
+    headers = [(b"x-forwarded-for", forwarded_for.encode())] if forwarded_for else []
+    return Request({"type": "http", "client": (peer, 1234), "headers": headers})
+
+
+def test_client_ip_ignores_forwarded_for_without_trusted_proxies():
+    request = request_from("203.0.113.7", "198.51.100.1")
+    assert client_ip(request, trusted=()) == "203.0.113.7"
+
+
+def test_client_ip_resolves_forwarded_for_behind_trusted_proxy():
+    trusted = trusted_proxy_networks("10.0.0.0/8, 172.16.0.1")
+    # Client, dann zwei eigene Proxys; ganz links ein gefälschter Eintrag
+    request = request_from("10.0.0.5", "1.2.3.4, 198.51.100.1, 172.16.0.1")
+    assert client_ip(request, trusted) == "198.51.100.1"
+    # Direkte Verbindungen dürfen den Header nicht setzen
+    request = request_from("198.51.100.9", "1.2.3.4")
+    assert client_ip(request, trusted) == "198.51.100.9"
+
+
+def test_login_limit_is_per_forwarded_client(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_TRUSTED_PROXIES", "10.0.0.0/8")
+    monkeypatch.setattr(
+        rate_limiter, "ip_rule", RateLimitRule(capacity=1, per_minute=1)
+    )
+
+    async def behind_proxy(scope, receive, send):
+        # Verbindung kommt vom Reverse-Proxy
+        if scope["type"] == "http":
+            scope = {**scope, "client": ("10.0.0.2", 50000)}
+        await app(scope, receive, send)
+
+    with TestClient(behind_proxy) as proxied:
+
+        def attempt(forwarded_for: str) -> int:
+            return proxied.post(
+                "/auth/login",
+                data={"username": f"nobody-{forwarded_for}", "password": "x"},
+                headers={"X-Forwarded-For": forwarded_for},
+            ).status_code
+
+        assert attempt("198.51.100.1") == 401
+        assert attempt("198.51.100.1") == 429
+        # Andere Clients hinter demselben Proxy sind nicht betroffen
+        assert attempt("198.51.100.2") == 401
@@ -0,0 +1,175 @@
+from datetime import date
+
+import pytest
+from conftest import TestingSessionLocal, auth_headers, create_test_user_direct
+from sqlalchemy import create_engine, delete, func, select
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import HTTPConnection
+
+from app.core.member_cache import member_cache
+from app.core.principal_cache import principal_cache
+from app.core.read_your_writes import (
+    COOKIE_NAME,
+    cookie_prefers_primary,
+    marker_cookie,
+    read_your_writes,
+)
+from app.db import Base, replica as replica_module
+from app.db.replica import RoutingSession
+from app.models.member import Member
+from app.models.role import Role
+from app.models.user import User
+
+
+def member_names(client, token: str) -> set:
+    response = client.get("/members/members/", headers=auth_headers(token))
+    assert response.status_code == 200, response.text
+    return {member["name"] for member in response.json()}
+
+
+@pytest.fixture
+def replica_engine(tmp_path, monkeypatch):
+    """Zweite SQLite-Datei als Replikat-Stand-in (mit eigenem Mitgliederbestand)."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([Role(id=1, name="Admin"), Role(id=2, name="User")])
+    session.commit()
+    replica_admin = create_test_user_direct(
+        session, "adminuser", "admin@test.com", "Admin", "adminpass"
+    )
+    # Replikat spiegelt den Primary: gleiche Token-Version wie dort
+    primary = TestingSessionLocal()
+    primary_admin = primary.query(User).filter_by(username="adminuser").first()
+    if primary_admin:
+        replica_admin.token_version = primary_admin.token_version
+    primary.close()
+    session.add(
+        Member(
+            name="Replica Only",
+            birth_date=date(1980, 1, 1),
+            email="replica@example.com",
+            address="Street 1",
+            postal_code="10115",
+            city="Berlin",
+        )
+    )
+    session.commit()
+    session.close()
+
+    monkeypatch.setattr(replica_module, "replica_engine", engine)
+    yield engine
+    engine.dispose()
+
+
+def test_reads_go_to_replica_until_the_client_writes(
+    client, admin_token, replica_engine
+):
+    client.cookies.clear()
+    assert member_names(client, admin_token) == {"Replica Only"}
+
+    response = client.post(
+        "/members/members/",
+        json={
+            "name": "Fresh Member",
+            "birth_date": "1990-01-01",
+            "address": "Street 2",
+            "city": "Berlin",
+            "postal_code": "10115",
+            "email": "fresh@example.com",
+        },
+        headers=auth_headers(admin_token),
+    )
+    assert response.status_code == 201
+
+    # Read-your-writes: das eigene neue Mitglied kommt vom Primary
+    assert "Fresh Member" in member_names(client, admin_token)
+
+    # Andere Worker kennen den Eintrag im Speicher nicht, das Cookie reicht
+    read_your_writes.clear()
+    assert COOKIE_NAME in client.cookies
+    assert "Fresh Member" in member_names(client, admin_token)
+
+    client.cookies.clear()
+    assert member_names(client, admin_token) == {"Replica Only"}
+
+
+def test_principal_is_loaded_from_the_primary(client, admin_token, replica_engine):
+    """Ein nachhinkendes Replikat darf keine alte Token-Version cachen."""
+    client.cookies.clear()
+    replica = sessionmaker(bind=replica_engine)()
+    replica_admin = replica.query(User).filter_by(username="adminuser").one()
+    replica_admin.token_version += 5
+    replica.commit()
+    replica.close()
+    principal_cache.clear()
+
+    response = client.get("/auth/me", headers=auth_headers(admin_token))
+    assert response.status_code == 200, response.text
+    assert member_names(client, admin_token) == {"Replica Only"}
+
+
+def test_replica_reads_do_not_fill_the_member_cache(
+    client, admin_token, replica_engine
+):
+    client.cookies.clear()
+    replica = sessionmaker(bind=replica_engine)()
+    member_id = replica.scalar(select(Member.id).where(Member.name == "Replica Only"))
+    replica.close()
+
+    response = client.get(
+        f"/members/members/{member_id}", headers=auth_headers(admin_token)
+    )
+    assert response.status_code == 200
+    assert response.json()["name"] == "Replica Only"
+    assert member_cache.get(member_id) is None
+
+
+def test_marker_cookie_is_signed_and_bound_to_the_subject(admin_token):
+    def conn(cookie_header: str, token: str = admin_token) -> HTTPConnection:
+        headers = [
+            (b"cookie", cookie_header.encode()),
+            (b"authorization", f"Bearer {token}".encode()),
+        ]
+        return HTTPConnection({"type": "http", "headers": headers})
+
+    def cookie(subject, now: float) -> str:
+        return marker_cookie(subject, now=now).split(";")[0]
+
+    now = 1_000_000.0
+    assert cookie_prefers_primary(conn(cookie("adminuser", now - 1)), now=now)
+    # Abgelaufen bzw. für einen anderen Benutzer ausgestellt
+    assert not cookie_prefers_primary(conn(cookie("adminuser", now - 10)), now=now)
+    assert not cookie_prefers_primary(conn(cookie("someone", now - 1)), now=now)
+    # Selbst gesetzte oder veränderte Werte werden ignoriert
+    assert not cookie_prefers_primary(conn(f"{COOKIE_NAME}={now + 3}"), now=now)
+    forged = cookie("adminuser", now - 1).replace(f"{now + 4:.3f}", f"{now + 5:.3f}")
+    assert not cookie_prefers_primary(conn(forged), now=now)
+    assert not cookie_prefers_primary(conn(f"{COOKIE_NAME}=garbage"), now=now)
+
+
+def test_routing_session_sends_dml_to_primary(replica_engine):
+    primary = TestingSessionLocal()
+    primary.query(Member).delete()
+    primary.add(
+        Member(
+            name="Primary Only",
+            birth_date=date(1990, 1, 1),
+            email="primary@example.com",
+            address="Street 3",
+            postal_code="10115",
+            city="Berlin",
+        )
+    )
+    primary.commit()
+
+    session = RoutingSession(primary=primary.get_bind(), replica=replica_engine)
+    try:
+        assert session.scalars(select(Member.name)).all() == ["Replica Only"]
+        session.execute(delete(Member).where(Member.name == "Primary Only"))
+        session.commit()
+    finally:
+        session.close()
+
+    assert primary.scalar(select(func.count()).select_from(Member)) == 0
+    primary.close()
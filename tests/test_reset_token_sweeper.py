@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from conftest import TestingSessionLocal, auth_headers, create_test_user_direct, engine
+from sqlalchemy import delete, insert, select, text
+
+from app.core.config import settings
+from app.core.leader_lock import leader_lock
+from app.models import EmailOutbox, PasswordResetToken
+from app.services.reset_token_sweeper import LOCK_NAME, reset_token_sweeper
+
+
+@pytest.fixture
+def tokens(monkeypatch, tmp_path):
+    """7 abgelaufene und 2 gültige Tokens eines Benutzers."""
+    monkeypatch.setattr(settings, "LEADER_LOCK_DIR", str(tmp_path))
+    now = datetime.now(timezone.utc)
+    with TestingSessionLocal() as db:
+        user = create_test_user_direct(db, "sweepuser", "sweep@test.com", "User")
+        db.execute(delete(PasswordResetToken))
+        db.execute(
+            insert(PasswordResetToken),
+            [
+                {
+                    "hashed_token": f"expired-{i}",
+                    "user_id": user.id,
+                    "expires_at": now - timedelta(minutes=i + 1),
+                }
+                for i in range(7)
+            ]
+            + [
+                {
+                    "hashed_token": f"valid-{i}",
+                    "user_id": user.id,
+                    "expires_at": now + timedelta(minutes=15),
+                }
+                for i in range(2)
+            ],
+        )
+        db.commit()
+    yield
+    with TestingSessionLocal() as db:
+        db.execute(delete(PasswordResetToken))
+        db.commit()
+
+
+def remaining_tokens():
+    with TestingSessionLocal() as db:
+        return sorted(db.scalars(select(PasswordResetToken.hashed_token)))
+
+
+def test_sweep_deletes_expired_tokens_in_batches(tokens):
+    with TestingSessionLocal() as db:
+        assert reset_token_sweeper.sweep(db, batch_size=3) == 7
+
+    assert remaining_tokens() == ["valid-0", "valid-1"]
+    stats = reset_token_sweeper.stats()
+    assert stats["runs"] == 1
+    # drei Blöcke Tokens, ein leerer Block Outbox
+    assert stats["batches"] == 4
+    assert stats["rows_purged"] == 7
+    assert stats["last_run_purged"] == 7
+    assert stats["max_batch_ms"] >= stats["avg_batch_ms"] > 0
+
+
+def test_sweep_respects_max_batches(tokens):
+    with TestingSessionLocal() as db:
+        assert reset_token_sweeper.sweep(db, batch_size=2, max_batches=2) == 4
+    assert len(remaining_tokens()) == 5
+
+
+def test_only_the_leader_sweeps(tokens):
+    with leader_lock(engine, LOCK_NAME) as leader:
+        assert leader
+        assert reset_token_sweeper.sweep_as_leader(TestingSessionLocal) is None
+    assert reset_token_sweeper.stats()["skipped_not_leader"] == 1
+    assert len(remaining_tokens()) == 9
+
+    assert reset_token_sweeper.sweep_as_leader(TestingSessionLocal) == 7
+    assert remaining_tokens() == ["valid-0", "valid-1"]
+
+
+def test_sweep_purges_old_sent_and_failed_outbox_rows(tokens):
+    now = datetime.now(timezone.utc)
+    old = now - timedelta(days=settings.OUTBOX_RETENTION_DAYS, hours=1)
+    rows = [
+        ("old-sent", "sent", old),
+        ("old-failed", "failed", old),
+        ("old-pending", "pending", old),
+        ("new-sent", "sent", now),
+    ]
+    with TestingSessionLocal() as db:
+        db.execute(delete(EmailOutbox))
+        db.execute(
+            insert(EmailOutbox),
+            [
+                {
+                    "recipient": f"{name}@test.com",
+                    "subject": name,
+                    "body": "",
+                    "status": status,
+                    "attempts": 0,
+                    "next_attempt_at": at,
+                }
+                for name, status, at in rows
+            ],
+        )
+        db.commit()
+
+        assert reset_token_sweeper.sweep(db, batch_size=1) == 7 + 2
+        remaining = sorted(db.scalars(select(EmailOutbox.subject)))
+        db.execute(delete(EmailOutbox))
+        db.commit()
+    assert remaining == ["new-sent", "old-pending"]
+
+
+def test_sweep_batch_uses_expires_at_index():
+    now = datetime.now(timezone.utc)
+    query = (
+        select(PasswordResetToken.id)
+        .where(PasswordResetToken.expires_at < now)
+        .order_by(PasswordResetToken.expires_at)
+        .limit(100)
+    )
+    compiled = query.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as conn:
+        plan = "\n".join(
+            row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+        )
+    assert "ix_password_reset_tokens_expires_at" in plan
+
+
+def test_metrics_report_sweeper(client, admin_token):
+    r = client.get("/admin/metrics", headers=auth_headers(admin_token))
+    assert r.status_code == 200
+    assert r.json()["reset_token_sweeper"]["rows_purged"] == 0
@@ -0,0 +1,97 @@
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine, select
+
+from alembic import command
+from app.core.config import settings
+from app.core.leader_lock import leader_lock
+from app.db import Base, bootstrap
+from app.models import AppState, User
+
+
+@pytest.fixture
+def fresh_engine(tmp_path, monkeypatch):
+    """Eigene SQLite-Datei mit aktuellem Schema, aber ohne Alembic-Stempel."""
+    monkeypatch.setattr(settings, "LEADER_LOCK_DIR", str(tmp_path))
+    engine = create_engine(f"sqlite:///{tmp_path / 'startup.sqlite3'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def stamp_head(engine) -> None:
+    # Die Migrationen selbst sind Postgres-spezifisch; hier reicht der Stempel
+    config = bootstrap.alembic_config()
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.stamp(config, "head")
+
+
+def fail(*args, **kwargs):
+    raise AssertionError("startup step should have been skipped")
+
+
+def test_seeds_once_then_skips(fresh_engine, monkeypatch):
+    stamp_head(fresh_engine)
+    monkeypatch.setattr(bootstrap, "migrate", fail)
+
+    report = bootstrap.prepare_database(fresh_engine)
+    assert report.seeded and not report.migrated
+    with fresh_engine.connect() as connection:
+        assert connection.execute(
+            select(User.username).where(User.username == "admin")
+        ).scalar()
+        assert bootstrap.stored_fingerprint(connection) == (
+            bootstrap.seed_fingerprint()
+        )
+
+    monkeypatch.setattr(bootstrap, "run_seed", fail)
+    report = bootstrap.prepare_database(fresh_engine)
+    assert report.stats()["checked"]
+    assert not (report.migrated or report.seeded or report.locked)
+
+
+def test_migrates_when_behind_head(fresh_engine, monkeypatch):
+    calls = []
+
+    def fake_migrate(engine, config):
+        calls.append(1)
+        stamp_head(engine)
+
+    monkeypatch.setattr(bootstrap, "migrate", fake_migrate)
+    report = bootstrap.prepare_database(fresh_engine)
+    assert report.migrated and report.seeded
+    assert calls == [1]
+
+    report = bootstrap.prepare_database(fresh_engine)
+    assert not report.migrated and calls == [1]
+
+
+def test_changed_seed_data_reseeds(fresh_engine, monkeypatch):
+    stamp_head(fresh_engine)
+    bootstrap.prepare_database(fresh_engine)
+
+    monkeypatch.setattr(bootstrap, "seed_fingerprint", lambda: "changed")
+    assert bootstrap.prepare_database(fresh_engine).seeded
+    with fresh_engine.connect() as connection:
+        assert connection.execute(select(AppState.value)).scalar() == "changed"
+
+
+def test_other_workers_wait_for_the_lock(fresh_engine):
+    stamp_head(fresh_engine)
+    done = threading.Event()
+
+    def worker():
+        bootstrap.prepare_database(fresh_engine)
+        done.set()
+
+    with leader_lock(fresh_engine, bootstrap.LOCK_NAME) as leader:
+        assert leader
+        thread = threading.Thread(target=worker)
+        thread.start()
+        time.sleep(0.2)
+        assert not done.is_set()
+    thread.join(timeout=10)
+    assert done.is_set()
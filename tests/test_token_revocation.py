@@ -0,0 +1,81 @@
+import time
+
+from conftest import TestingSessionLocal, auth_headers, login
+
+from app.core.revocation import BloomFilter, RevocationFilter, revocation_filter
+from app.services.token_revocation_service import (
+    TokenRevocationService,
+    sync_revocations,
+)
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [f"jti-{i}" for i in range(1000)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+    false_positives = sum(f"other-{i}" in bloom for i in range(10_000))
+    assert false_positives < 300  # ~1 % erwartet
+
+
+def test_revocation_filter_prunes_expired_entries():
+    revocations = RevocationFilter(capacity=10)
+    now = time.time()
+    revocations.add("expired", now - 1)
+    revocations.add("active", now + 60)
+
+    assert revocations.prune(now) == 1
+    assert not revocations.is_revoked("expired")
+    assert revocations.is_revoked("active")
+
+
+def test_logout_revokes_only_the_current_token(client, admin_user):
+    first = login(client, "adminuser", "adminpass")
+    second = login(client, "adminuser", "adminpass")
+
+    response = client.post("/auth/logout", headers=auth_headers(first))
+    assert response.status_code == 204
+
+    assert client.get("/auth/me", headers=auth_headers(first)).status_code == 401
+    assert client.get("/auth/me", headers=auth_headers(second)).status_code == 200
+
+
+def test_revocation_survives_filter_reload(client, admin_user):
+    """Der In-Memory-Filter wird aus der persistierten Liste wieder aufgebaut."""
+    token = login(client, "adminuser", "adminpass")
+    client.post("/auth/logout", headers=auth_headers(token))
+
+    revocation_filter.clear()
+    sync_revocations(TestingSessionLocal, force=True)
+    assert client.get("/auth/me", headers=auth_headers(token)).status_code == 401
+
+
+def test_token_check_does_not_touch_the_database(client, admin_user, monkeypatch):
+    """Abgleich und Aufräumen laufen im Hintergrund, nicht im Request."""
+    token = login(client, "adminuser", "adminpass")
+    client.get("/auth/me", headers=auth_headers(token)).raise_for_status()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("revocation sync ran inside a request")
+
+    monkeypatch.setattr(TokenRevocationService, "sync_filter", fail)
+    monkeypatch.setattr(TokenRevocationService, "prune_expired", fail)
+    revocation_filter.last_synced_at = 0.0
+    revocation_filter.last_pruned_at = 0.0
+    assert client.get("/auth/me", headers=auth_headers(token)).status_code == 200
+
+
+def test_logout_all_revokes_every_session(client, member_user):
+    first = login(client, "memberuser", "memberpass")
+    second = login(client, "memberuser", "memberpass")
+
+    response = client.post("/auth/logout-all", headers=auth_headers(first))
+    assert response.status_code == 204
+
+    assert client.get("/auth/me", headers=auth_headers(first)).status_code == 401
+    assert client.get("/auth/me", headers=auth_headers(second)).status_code == 401
+
+    fresh = login(client, "memberuser", "memberpass")
+    assert client.get("/auth/me", headers=auth_headers(fresh)).status_code == 200